@@ -0,0 +1,69 @@
+"""Benchmarks the calls per second of the lexing methods of the Lexer and FastLexer
+classes, as well as the time taken to tokenize a text via each class.
+
+Usage: python profiling/lexer.py [--number N]"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "source"))
+
+
+from lexographer import Lexer, FastLexer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tests"))
+
+from examples.text import Tokenizer
+
+TEXT: str = "The quick brown fox jumped over the lazy corgi.\n" * 2000
+
+# The lexing method calls to benchmark, each of which is run against a fresh instance
+CALLS: dict[str, str] = {
+    "read()": "lexer.read()",
+    "peek()": "lexer.peek(length=2)",
+    "consume()": "lexer.consume(length=1)",
+    "lookahead()": "lexer.lookahead('he')",
+    "expect()": "lexer.expect('Th') or lexer.read()",
+}
+
+
+def benchmark(number: int):
+    print(f"{'call':<16}{'Lexer':>16}{'FastLexer':>16}{'speedup':>10}")
+
+    for name, statement in CALLS.items():
+        rates: list[float] = []
+
+        for cls in (Lexer, FastLexer):
+            lexer = cls(text=TEXT)
+
+            # The cursor is reset periodically so the calls never reach the end
+            timer = timeit.Timer(
+                f"{statement}\nif lexer._index > 90000: lexer._index = 0",
+                globals=dict(lexer=lexer),
+            )
+
+            rates.append(number / min(timer.repeat(repeat=5, number=number)))
+
+        print(
+            f"{name:<16}{rates[0]:>14,.0f}/s{rates[1]:>14,.0f}/s{rates[1] / rates[0]:>9.2f}x"
+        )
+
+    class FastTokenizer(Tokenizer):
+        _lexer_subclass = FastLexer
+
+    durations: list[float] = [
+        min(timeit.repeat(lambda: cls(text=TEXT[:20000]), repeat=3, number=1))
+        for cls in (Tokenizer, FastTokenizer)
+    ]
+
+    print(
+        f"{'tokenize':<16}{durations[0]:>15.3f}s{durations[1]:>15.3f}s{durations[0] / durations[1]:>9.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=100000)
+    benchmark(parser.parse_args().number)
@@ -0,0 +1,90 @@
+"""Benchmarks the time taken and the peak resident memory used when loading a file, via
+a single text mode read of the whole file, compared to loading the file via the Lexer,
+which detects any byte order mark and decodes the bytes in place in a single pass. The
+Lexer holds the whole of the decoded text, so its peak memory grows with the file size,
+and is expected to match that of the text mode read rather than being bounded; only the
+StreamLexer class decodes incrementally, and lexes in bounded memory.
+
+Each measurement is taken in a fresh subprocess, so that the peak resident memory of one
+measurement does not affect the next, and is reported as the increase in the peak over
+the resident memory of the subprocess before the file was loaded.
+
+Usage: python profiling/loading.py [--size MEGABYTES] [--unicode]"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+SOURCE: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "source")
+
+# The code run in each subprocess to load the file via the specified method
+MEASURE: str = """
+import resource, sys, time
+
+sys.path.insert(0, {source!r})
+
+from lexographer import Lexer
+
+baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+started = time.perf_counter()
+
+if {method!r} == "read":
+    with open({file!r}, "r", encoding="utf-8") as handle:
+        text = handle.read()
+else:
+    text = Lexer(file={file!r}).text
+
+duration = time.perf_counter() - started
+
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+print(duration, (peak - baseline) / 1024, len(text))
+"""
+
+
+def measure(method: str, file: str) -> tuple[float, float, int]:
+    output: str = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            MEASURE.format(source=SOURCE, method=method, file=file),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    duration, peak, length = output.split()
+
+    return (float(duration), float(peak), int(length))
+
+
+def benchmark(size: int, unicode: bool):
+    line: str = "The quick brown fox jumped over the lazy corgi"
+    line += " – ça va bién?\n" if unicode else ".\n"
+
+    with tempfile.TemporaryDirectory() as directory:
+        file: str = os.path.join(directory, "sample.txt")
+
+        with open(file, "w", encoding="utf-8") as handle:
+            for _ in range(size * 1024 * 1024 // len(line.encode("utf-8"))):
+                handle.write(line)
+
+        print(f"file size: {os.path.getsize(file) / 1024 / 1024:.1f} MiB")
+        print(f"{'method':<24}{'load time':>12}{'peak RSS increase':>20}")
+
+        for method, name in [("read", "handle.read()"), ("lexer", "Lexer(file=...)")]:
+            duration, peak, length = min(measure(method, file) for _ in range(3))
+
+            print(f"{name:<24}{duration:>11.3f}s{peak:>16.1f} MiB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=64)
+    parser.add_argument("--unicode", action="store_true")
+    arguments = parser.parse_args()
+    benchmark(arguments.size, arguments.unicode)
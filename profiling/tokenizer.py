@@ -0,0 +1,103 @@
+"""Benchmarks the tokens per second of the sample Tokenizer subclass, which creates each
+Token via the validating Token constructor, against an equivalent Tokenizer subclass
+which creates each Token via the Tokenizer's unvalidated 'emit()' method, and against an
+equivalent RuleTokenizer subclass which tokenizes via a compiled master pattern, and an
+equivalent DFATokenizer subclass which tokenizes via a compiled automaton.
+
+Usage: python profiling/tokenizer.py [--repeat N]"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "source"))
+
+from lexographer import Type, Context, RuleTokenizer, DFATokenizer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tests"))
+
+from examples.text import Tokenizer
+
+TEXT: str = "The quick brown fox jumped over the lazy corgi.\n" * 2000
+
+
+class EmittingTokenizer(Tokenizer):
+    """Tokenizes the text as per the sample Tokenizer, but via the 'emit()' method."""
+
+    def parse(self):
+        self.context = Context.Start
+
+        lexer = self.lexer
+        emit = self.emit
+        types = self._types
+
+        while character := lexer.read():
+            start: int = lexer.index - 1
+
+            if character in types:
+                emit(types[character], start, lexer.index)
+            elif character.isspace():
+                while (character := lexer.peek()) and character.isspace():
+                    lexer.read()
+
+                emit(Type.Spacing, start, lexer.index)
+            elif character.isalpha() or character == "'":
+                while (character := lexer.peek()) and (
+                    character.isalpha() or character == "'"
+                ):
+                    lexer.read()
+
+                emit(Type.Word, start, lexer.index)
+            else:
+                emit(Type.Unknown, start, lexer.index)
+
+        self.context = Context.Finish
+
+
+class RuleBasedTokenizer(RuleTokenizer):
+    """Tokenizes the text as per the sample Tokenizer, but via declared rules."""
+
+    _rules = [
+        (Type.Word, r"[^\W\d_]+(?:'[^\W\d_]*)*"),
+        (Type.Spacing, r"[^\S\n\r\t]+"),
+        (Type.Period, r"\."),
+        (Type.NewLine, r"\n"),
+        (Type.Unknown, r"."),
+    ]
+
+
+class AutomatonTokenizer(DFATokenizer):
+    """Tokenizes the text as per the sample Tokenizer, but via a compiled automaton."""
+
+    _rules = RuleBasedTokenizer._rules
+
+
+def benchmark(repeat: int):
+    print(f"{'tokenizer':<24}{'tokens':>10}{'tokens/s':>16}{'speedup':>10}")
+
+    rates: list[float] = []
+
+    for cls in (
+        Tokenizer,
+        EmittingTokenizer,
+        RuleBasedTokenizer,
+        AutomatonTokenizer,
+    ):
+        count: int = len(cls(text=TEXT))
+
+        duration: float = min(
+            timeit.repeat(lambda: cls(text=TEXT), repeat=repeat, number=1)
+        )
+
+        rates.append(count / duration)
+
+        print(
+            f"{cls.__name__:<24}{count:>10,}{rates[-1]:>14,.0f}/s{rates[-1] / rates[0]:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    benchmark(parser.parse_args().repeat)
@@ -1,6 +1,16 @@
-from lexographer.lexer import Lexer, Position
+from lexographer.lexer import Lexer, Literals, Mark, Position
+from lexographer.lexer.asynchronous import AsyncLexer
+from lexographer.lexer.binary import BytesLexer
+from lexographer.lexer.fast import FastLexer
+from lexographer.lexer.mapped import MappedLexer
+from lexographer.lexer.stream import StreamLexer
 from lexographer.parser import Parser
-from lexographer.tokenizer import Tokenizer, Token, Tokens
+from lexographer.tokenizer import Tokenizer, Token, Tokens, TokenStore
+from lexographer.tokenizer.rules import Rule, RuleTokenizer
+from lexographer.tokenizer.automaton import Automaton, DFATokenizer
+from lexographer.tokenizer.parallel import ParallelTokenizer
+from lexographer.tokenizer.cache import TokenCache, DiskTokenCache
+from lexographer.tokenizer.serialization import TokenFile
 from lexographer.exceptions import (
     LexographerError,
     LexerError,
@@ -10,18 +20,36 @@ from lexographer.exceptions import (
 from lexographer.enumerations import (
     Context,
     Type,
+    TypeTable,
 )
 
 __all__ = [
     "Lexer",
+    "AsyncLexer",
+    "BytesLexer",
+    "FastLexer",
+    "MappedLexer",
+    "StreamLexer",
+    "Literals",
+    "Mark",
     "Position",
     "Parser",
     "Tokenizer",
     "Token",
     "Tokens",
+    "TokenStore",
+    "Rule",
+    "RuleTokenizer",
+    "Automaton",
+    "DFATokenizer",
+    "ParallelTokenizer",
+    "TokenCache",
+    "DiskTokenCache",
+    "TokenFile",
     # Enumerations
     "Context",
     "Type",
+    "TypeTable",
     # Exceptions
     "LexographerError",
     "LexerError",
@@ -1,5 +1,9 @@
+from __future__ import annotations
+
 from enumerific import Enumeration, auto
 
+from collections.abc import Iterable
+
 
 class Context(Enumeration):
     """List of Tokenizer contexts, noting the section of text currently being processed.
@@ -70,3 +74,166 @@ class Type(Enumeration, overwritable=True):
     LessThan = auto(example="<")
     GreaterThanEqual = auto(example=">=")
     LessThanEqual = auto(example="<=")
+
+    @property
+    def id(self) -> int:
+        """Returns the dense integer identifier of the Type enumeration option, assigned in
+        the order the options were defined and then registered, for use with TypeTable
+        instances; see the TypeTable class for the extent to which these are stable."""
+
+        return TypeTable.typeid(self)
+
+
+class TypeTable(object):
+    """The TypeTable class supports dispatching on token types via small integers rather
+    than by hashing or comparing Type enumeration options, which is slower, and may also
+    conflate distinct options, as the Type options compare and hash by their values, and
+    options registered at runtime may share the same value. Each Type option is assigned
+    a dense integer identifier, keyed by its name, so an option that is overwritten keeps
+    its identifier. The identifiers are assigned in the order that the options were
+    defined, and then registered, rather than in the order they are first used, so the
+    identifiers of the predefined options are fixed, and those of the registered options
+    are the same in every process that registers the same options in the same order. As
+    the registration order is not guaranteed to match between processes, or between
+    versions of an application, the identifiers must never be persisted, or passed
+    between processes, without the names of the options that they identify, as is done
+    by the TokenFile and DiskTokenCache classes and by the ParallelTokenizer. A TypeTable instance holds a list of values that
+    is indexed by these identifiers, such as handler functions or token classifications,
+    while the 'mask()' class method builds an integer bitmask over the identifiers which
+    supports fast membership tests for sets of token types via the 'contains()' method.
+    """
+
+    # The identifiers assigned to the Type options, keyed by option name, and the options
+    # indexed by their identifiers, which are shared by all of the TypeTable instances
+    _typeids: dict[str, int] = {}
+    _types: list[Type] = []
+
+    _values: list[object] = None
+    _default: object = None
+
+    @classmethod
+    def typeid(cls, type: Type) -> int:
+        """Returns the dense integer identifier of the specified Type option, assigning the
+        identifiers of any options that have not been assigned one yet, in the order they
+        were defined and registered; the identifier is then cached on the option itself.
+        """
+
+        try:
+            return type.__dict__["_typeid"]
+        except (AttributeError, KeyError):
+            pass
+
+        if not isinstance(type, Type):
+            raise TypeError(
+                "The 'type' argument must reference a Type enumeration class option!"
+            )
+
+        if not type.name in cls._typeids:
+            for option in Type:
+                if not option.name in cls._typeids:
+                    cls._typeids[option.name] = len(cls._types)
+                    cls._types.append(option)
+
+            # An option that is not listed by its class is assigned the next identifier
+            if not type.name in cls._typeids:
+                cls._typeids[type.name] = len(cls._types)
+                cls._types.append(type)
+
+        typeid: int = cls._typeids[type.name]
+
+        cls._types[typeid] = type
+
+        type._typeid = typeid
+
+        return typeid
+
+    @classmethod
+    def type(cls, typeid: int) -> Type:
+        """Returns the Type option that has been assigned the specified identifier."""
+
+        if not isinstance(typeid, int):
+            raise TypeError("The 'typeid' argument must have an integer value!")
+        elif not 0 <= typeid < len(cls._types):
+            raise ValueError(
+                f"The 'typeid' argument, {typeid}, has not been assigned to a Type!"
+            )
+
+        return cls._types[typeid]
+
+    @classmethod
+    def mask(cls, *types: Type) -> int:
+        """Returns an integer bitmask with the bit for each of the specified Type options'
+        identifiers set, for use with the 'contains()' class method."""
+
+        mask: int = 0
+
+        for type in types:
+            mask |= 1 << cls.typeid(type)
+
+        return mask
+
+    @staticmethod
+    def contains(mask: int, typeid: int) -> bool:
+        """Determine if the bit for the specified Type identifier is set in the bitmask."""
+
+        return (mask >> typeid) & 1 == 1
+
+    def __init__(
+        self,
+        values: dict[Type, object] | Iterable[tuple[Type, object]],
+        default: object = None,
+    ):
+        """Supports initializing the TypeTable class with the values to be dispatched to
+        for each of the specified Type options, and a default value for any other Type.
+        The values may be specified as a dictionary, or as an iterable of (type, value)
+        pairs, which should be used where options sharing the same value are specified,
+        as such options would otherwise be conflated by the dictionary's keys."""
+
+        if isinstance(values, dict):
+            values = values.items()
+        elif isinstance(values, (str, bytes)) or not isinstance(values, Iterable):
+            raise TypeError(
+                "The 'values' argument must have a dictionary or iterable value!"
+            )
+
+        # The identifiers are assigned up front so that the list can be sized to fit them
+        typeids: list[tuple[int, object]] = [
+            (self.typeid(type), value) for type, value in values
+        ]
+
+        self._values = [default] * len(self._types)
+        self._default = default
+
+        for typeid, value in typeids:
+            self._values[typeid] = value
+
+    def __len__(self) -> int:
+        """Returns the number of entries held by the TypeTable's list of values."""
+
+        return len(self._values)
+
+    def __getitem__(self, type: Type | int) -> object:
+        """Returns the value for the specified Type option or Type identifier, or the
+        default value if no value was specified for the Type option."""
+
+        if isinstance(type, Type) or not isinstance(type, int):
+            type = self.typeid(type)
+
+        if 0 <= type < len(self._values):
+            return self._values[type]
+
+        return self._default
+
+    @property
+    def values(self) -> list[object]:
+        """Returns the list of values indexed by Type identifier, which may be indexed
+        directly in hot loops; Type options assigned identifiers after the TypeTable was
+        created may have identifiers beyond the end of the list."""
+
+        return self._values
+
+    @property
+    def default(self) -> object:
+        """Returns the default value for any Type option without a specified value."""
+
+        return self._default
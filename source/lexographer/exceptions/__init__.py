@@ -15,7 +15,7 @@ class LexerError(LexographerError):
     def __init__(self, message: str, context: Context = None):
         super().__init__(message)
 
-        if type is None:
+        if context is None:
             pass
         elif isinstance(context, Context):
             self._context = context
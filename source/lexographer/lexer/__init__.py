@@ -4,10 +4,23 @@ from lexographer.logging import logger
 from lexographer.exceptions import LexerError
 from lexographer.enumerations import Context
 
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+
+import codecs
+import io
 import os
+import re
 
 logger = logger.getChild(__name__)
 
+# The number of compiled scanning patterns held by the least-recently-used caches of
+# the '_build()' methods, so that patterns built from many distinct values, such as
+# delimiters taken from the input, are evicted rather than retained indefinitely
+_PATTERNS: int = 512
+
 
 class Lexer(object):
     """The Lexer class supports lexing over a provided string as well as convenience
@@ -20,9 +33,56 @@ class Lexer(object):
     _line: int = None
     _column: int = None
     _characters: str = None
-
-    def __init__(self, text: str = None, file: str = None):
-        """Supports initializing the Lexer class with the provided text string or file contents."""
+    _indexed: bool = False
+    _newlines: array = None
+    _marks: list[Mark] = None
+    _encoding: str = None
+    _errors: str = None
+
+    # Whether the 'locate()' method can locate any character position in the text, rather
+    # than only the cursor position, which allows Positions to be derived on demand
+    _locatable: bool = True
+
+    # The byte order marks and the encodings they identify; the UTF-32 marks are checked
+    # before the UTF-16 marks as the UTF-32 little-endian mark begins with the UTF-16 one
+    _boms: tuple[tuple[bytes, str]] = (
+        (codecs.BOM_UTF32_LE, "utf-32-le"),
+        (codecs.BOM_UTF32_BE, "utf-32-be"),
+        (codecs.BOM_UTF8, "utf-8"),
+        (codecs.BOM_UTF16_LE, "utf-16-le"),
+        (codecs.BOM_UTF16_BE, "utf-16-be"),
+    )
+
+    # The string predicates that have an exactly equivalent regular expression class,
+    # which allows runs of characters matching these predicates to be scanned by the
+    # regular expression engine rather than calling the predicate for each character
+    _predicates: dict[Callable, str] = {
+        str.isspace: r"\s",
+        str.isdecimal: r"\d",
+        str.isalnum: r"[^\W_]",
+    }
+
+    def __init__(
+        self,
+        text: str = None,
+        file: str = None,
+        indexed: bool = False,
+        encoding: str = None,
+        errors: str = "strict",
+    ):
+        """Supports initializing the Lexer class with the provided text string or file
+        contents; if the 'indexed' argument is set to True, a table of the offsets of the
+        new line characters in the text is built once up front, and the line and column
+        numbers are then derived from the table only when requested, rather than being
+        tracked on every cursor movement.
+
+        Files are decoded in a single pass using the specified encoding and error handling
+        scheme; if no encoding is specified, the encoding is detected from any byte order
+        mark at the start of the file, or otherwise UTF-8 is assumed. Any byte order mark
+        is skipped, and new lines are translated as per text mode. As the Lexer holds the
+        whole of the text, its memory is not bounded; only the StreamLexer class decodes
+        its input incrementally, in chunks, so as to lex in bounded memory.
+        """
 
         if text is None and file is None:
             raise LexerError(
@@ -47,14 +107,16 @@ class Lexer(object):
         elif not os.path.isfile(file):
             raise LexerError("The 'file' argument must reference a valid file!")
 
+        if not isinstance(indexed, bool):
+            raise TypeError("The 'indexed' argument must have a boolean value!")
+
+        self._validate_codec(encoding=encoding, errors=errors)
+
+        self._encoding = encoding
+        self._errors = errors
+
         if file:
-            with open(file, "r") as handle:
-                if isinstance(contents := handle.read(), str):
-                    text = contents
-                else:
-                    raise LexerError(
-                        f"Unable to read the contents of the specified file: {file}!"
-                    )
+            text = self._load(file)
 
         if (length := len(text)) == 0:
             raise ValueError("The 'text' argument must have a non-empty string value!")
@@ -66,6 +128,133 @@ class Lexer(object):
         self._line: int = 1
         self._column: int = 1
 
+        if indexed is True:
+            self._indexed = True
+            self._newlines = self._index_newlines(text)
+
+    @classmethod
+    def _create(cls, text: str) -> Lexer:
+        """Creates a Lexer for the specified text string without the validation performed
+        by the initializer, other than checking that the text is a non-empty string, for
+        use where many Lexers are created, such as by the 'tokenize_many()' class method
+        of the Tokenizer class; subclasses that extend the initializer must not use it.
+        """
+
+        if not isinstance(text, str):
+            raise TypeError("The 'text' argument must have a string value!")
+        elif (length := len(text)) == 0:
+            raise ValueError("The 'text' argument must have a non-empty string value!")
+
+        lexer: Lexer = cls.__new__(cls)
+
+        # All of the attributes are assigned up front, rather than falling back to the
+        # class attribute defaults, so that the instance dictionary is built in one go
+        lexer._file = None
+        lexer._text = text
+        lexer._length = length
+        lexer._index = 0
+        lexer._line = 1
+        lexer._column = 1
+        lexer._characters = None
+        lexer._indexed = False
+        lexer._newlines = None
+        lexer._marks = None
+        lexer._encoding = None
+        lexer._errors = "strict"
+
+        return lexer
+
+    @classmethod
+    def _validate_codec(cls, encoding: str | None, errors: str):
+        """Validates the 'encoding' and 'errors' arguments used for decoding."""
+
+        if encoding is None:
+            pass
+        elif not isinstance(encoding, str):
+            raise TypeError(
+                "The 'encoding' argument, if specified, must have a string value!"
+            )
+        else:
+            try:
+                codecs.lookup(encoding)
+            except LookupError:
+                raise LexerError(
+                    f"The 'encoding' argument, {encoding}, is not recognised!"
+                )
+
+        if not isinstance(errors, str):
+            raise TypeError("The 'errors' argument must have a string value!")
+
+        try:
+            codecs.lookup_error(errors)
+        except LookupError:
+            raise LexerError(f"The 'errors' argument, {errors}, is not recognised!")
+
+    @classmethod
+    def _detect(cls, prefix: bytes, encoding: str | None) -> tuple[str, int]:
+        """Returns the encoding with which to decode the bytes that start with the prefix
+        along with the length of any byte order mark to skip; a byte order mark is only
+        skipped if no encoding was specified or the encoding belongs to the same family
+        as the mark, such as the 'utf-16' encoding and the UTF-16 little-endian mark."""
+
+        for bom, detected in cls._boms:
+            if prefix.startswith(bom):
+                if detected == "utf-8":
+                    family: str = "utf-8-sig"
+                else:
+                    family: str = detected.rsplit("-", 1)[0]
+
+                if encoding is None or codecs.lookup(encoding).name in (
+                    detected,
+                    family,
+                ):
+                    return (detected, len(bom))
+
+                break
+
+        return (encoding or "utf-8", 0)
+
+    @classmethod
+    def _incremental(cls, encoding: str, errors: str) -> io.IncrementalNewlineDecoder:
+        """Returns an incremental decoder for the encoding which also translates any new
+        lines, as per reading a file in text mode, across the chunks it is given."""
+
+        return io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(encoding)(errors), translate=True
+        )
+
+    def _load(self, file: str) -> str:
+        """Reads and decodes the contents of the file, skipping any byte order mark, and
+        translating any new lines as per reading the file in text mode. As the whole text
+        is held by the Lexer, the bytes are read in one go and decoded in a single pass,
+        without copying them, so that the peak memory used is that of the bytes and the
+        decoded text, as for a file read in text mode; gathering decoded chunks would hold
+        the text twice while the chunks are joined. Files too large to hold in memory may
+        be lexed via the StreamLexer class instead."""
+
+        with open(file, "rb") as handle:
+            data: bytes = handle.read()
+
+        encoding, skip = self._detect(data[:4], self._encoding)
+
+        try:
+            with memoryview(data) as view, view[skip:] as content:
+                text: str = str(content, encoding, self._errors)
+        except UnicodeDecodeError as exception:
+            raise LexerError(
+                f"Unable to decode the contents of the specified file: {file}, using the {encoding} encoding; {exception}!"
+            ) from exception
+
+        del data
+
+        # The text is only copied where carriage returns must be translated to new lines
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+        self._encoding = encoding
+
+        return text
+
     def __len__(self) -> int:
         """Return the source text string length."""
 
@@ -103,6 +292,19 @@ class Lexer(object):
 
         return self._text
 
+    @property
+    def encoding(self) -> str | None:
+        """Returns the encoding used to decode the file, if the text was read from a file,
+        or otherwise the encoding specified during class instantiation, if any."""
+
+        return self._encoding
+
+    @property
+    def errors(self) -> str:
+        """Returns the error handling scheme used when decoding."""
+
+        return self._errors
+
     @property
     def length(self) -> int:
         """Returns the source text string length."""
@@ -115,22 +317,45 @@ class Lexer(object):
 
         return self._index  # remember self._index is incremented only after a read()
 
+    @property
+    def indexed(self) -> bool:
+        """Returns whether the line and column numbers are derived from the table of new
+        line offsets rather than being tracked on every cursor movement."""
+
+        return self._indexed
+
+    @property
+    def locatable(self) -> bool:
+        """Returns whether any character position in the text can be located via the
+        'locate()' method, rather than only the cursor position."""
+
+        return self._locatable
+
     @property
     def position(self) -> Position:
         """Returns the current character position as a Position instance."""
 
-        return Position(index=self.index, line=self.line, column=self.column)
+        if self._indexed is True:
+            return self.locate(self._index)
+
+        return Position._make(self.index, self.line, self.column)
 
     @property
     def line(self) -> int:
         """Returns the one-indexed line number, i.e. the line numbers start at 1."""
 
+        if self._indexed is True:
+            return bisect_left(self._newlines, self._index) + 1
+
         return self._line
 
     @property
     def column(self) -> int:
         """Returns the one-indexed column number, i.e. the column numbers start at 1."""
 
+        if self._indexed is True:
+            return self.locate(self._index).column
+
         return self._column
 
     @property
@@ -157,11 +382,13 @@ class Lexer(object):
         self._characters = characters = self._text[self._index : self._index + length]
 
         self._index += length
-        self._column += length
 
-        if characters == "\n":
-            self._line += 1
-            self._column = 1
+        if self._indexed is False:
+            self._column += length
+
+            if characters == "\n":
+                self._line += 1
+                self._column = 1
 
         return characters
 
@@ -203,11 +430,13 @@ class Lexer(object):
         self._characters = characters = self._text[self._index : self._index + length]
 
         self._index += length
-        self._column += length
 
-        if "\n" in characters:
-            self._line += 1
-            self._column = 1
+        if self._indexed is False:
+            self._column += length
+
+            if "\n" in characters:
+                self._line += 1
+                self._column = 1
 
         return characters
 
@@ -222,14 +451,118 @@ class Lexer(object):
         characters: str = self._text[self.index - length : self.index]
 
         self._index -= length
-        self._column += length
 
-        if "\n" in characters:
-            self._line -= 1
-            self._column = 1
+        if self._indexed is False:
+            self._column += length
+
+            if "\n" in characters:
+                self._line -= 1
+                self._column = 1
 
         return characters
 
+    def locate(self, index: int) -> Position:
+        """Returns the Position for the specified zero-indexed character position, with
+        the line and column numbers derived from the table of new line offsets, which is
+        built on first use if the Lexer was not instantiated with indexing enabled."""
+
+        if not isinstance(index, int):
+            raise TypeError("The 'index' argument must have an integer value!")
+        elif not index >= 0:
+            raise ValueError(
+                "The 'index' argument must have a non-negative integer value!"
+            )
+
+        if (newlines := self._newlines) is None:
+            newlines = self._newlines = self._index_newlines(self._text)
+
+        if line := bisect_left(newlines, index):
+            return Position._make(index, line + 1, index - newlines[line - 1])
+        else:
+            return Position._make(index, 1, index + 1)
+
+    @staticmethod
+    def _index_newlines(text: str) -> array:
+        """Builds a table of the offsets of all of the new line characters in the text."""
+
+        newlines: array = array("q")
+
+        if text.count("\n") > 0:
+            append = newlines.append
+            find = text.find
+
+            index: int = find("\n")
+
+            while index >= 0:
+                append(index)
+                index = find("\n", index + 1)
+
+        return newlines
+
+    def replace(self, start: int, end: int, replacement: str) -> str:
+        """Replaces the text between the specified start and end offsets with the specified
+        replacement text, returning the text that was replaced. The table of new line
+        offsets, if built, is updated in place rather than being rebuilt, and the cursor is
+        moved along with the text after the replaced text, or to the start offset if the
+        cursor was within the replaced text."""
+
+        if self._locatable is False:
+            raise LexerError(
+                f"The {self.__class__.__name__} does not support replacing its text!"
+            )
+
+        if not isinstance(start, int):
+            raise TypeError("The 'start' argument must have an integer value!")
+        elif not 0 <= start <= self._length:
+            raise ValueError(
+                f"The 'start' argument must have a value between 0 and {self._length}!"
+            )
+
+        if not isinstance(end, int):
+            raise TypeError("The 'end' argument must have an integer value!")
+        elif not start <= end <= self._length:
+            raise ValueError(
+                f"The 'end' argument must have a value between {start} and {self._length}!"
+            )
+
+        if not isinstance(replacement, str):
+            raise TypeError("The 'replacement' argument must have a string value!")
+
+        text: str = self._text
+        replaced: str = text[start:end]
+        delta: int = len(replacement) - (end - start)
+
+        self._text = text[:start] + replacement + text[end:]
+        self._length += delta
+
+        if (newlines := self._newlines) is not None:
+            first: int = bisect_left(newlines, start)
+            last: int = bisect_left(newlines, end)
+
+            inserted: array = array(
+                "q", (start + offset for offset in self._index_newlines(replacement))
+            )
+
+            if delta:
+                newlines[last:] = array(
+                    "q", (index + delta for index in newlines[last:])
+                )
+
+            newlines[first:last] = inserted
+
+        if self._index >= end:
+            self._index += delta
+        elif self._index > start:
+            self._index = start
+
+        if self._indexed is False:
+            position: Position = self.locate(self._index)
+
+            self._line = position.line
+            self._column = position.column
+
+        return replaced
+
     def lookbehind(
         self,
         text: str,
@@ -305,13 +638,541 @@ class Lexer(object):
         # Otherwise, return an empty (falsey) string as the default behaviour
         return ""
 
+    def mark(self) -> Mark:
+        """Returns a Mark recording a snapshot of the current cursor position, which can
+        later be passed to the 'rollback()' method to restore the cursor position, or to
+        the 'commit()' method once the mark is no longer needed. The Mark may also be used
+        as a context manager, which rolls back the Mark if an exception is raised within
+        the context, or otherwise commits the Mark when the context exits."""
+
+        if self._marks is None:
+            self._marks = []
+
+        return Mark(owner=self, state=self._snapshot(), marks=self._marks)
+
+    def rollback(self, mark: Mark) -> None:
+        """Restores the cursor position recorded by the specified Mark, releasing the Mark
+        as well as any Marks that were made after it."""
+
+        self._verify(mark)
+        self._restore(mark.state)
+
+        mark._release()
+
+    def commit(self, mark: Mark) -> None:
+        """Releases the specified Mark, as well as any Marks that were made after it,
+        leaving the cursor at its current position."""
+
+        self._verify(mark)
+
+        mark._release()
+
+    def _verify(self, mark: Mark):
+        """Verifies that the specified Mark was made by this Lexer and is still active."""
+
+        if not isinstance(mark, Mark):
+            raise TypeError("The 'mark' argument must reference a Mark class instance!")
+        elif not mark.owner is self:
+            raise LexerError(
+                f"The 'mark' argument must reference a Mark made by this {self.__class__.__name__}!"
+            )
+        elif mark.active is False:
+            raise LexerError(
+                "The 'mark' argument references a Mark that has already been released!"
+            )
+
+    def _snapshot(self) -> tuple:
+        """Returns the state of the cursor position to be recorded by a Mark."""
+
+        return (self._index, self._line, self._column, self._characters)
+
+    def _restore(self, state: tuple):
+        """Restores the state of the cursor position recorded by a Mark."""
+
+        self._index, self._line, self._column, self._characters = state
+
+    def lookahead_any(
+        self,
+        literals: Literals | dict[str, object] | Iterable[str],
+        offset: int = 0,
+        consume: bool = False,
+    ) -> object | None:
+        """Check if any of the provided literals follow the current position, returning
+        the value associated with the longest matching literal, or the literal itself if
+        no values were associated, or None if none of the literals match; the literals
+        should be provided as a Literals instance built once and reused, as otherwise a
+        Literals instance must be built from the provided literals on every call."""
+
+        if not isinstance(literals, Literals):
+            literals = Literals(literals)
+
+        if not isinstance(offset, int):
+            raise TypeError("The 'offset' argument must have an integer value!")
+
+        if not isinstance(consume, bool):
+            raise TypeError("The 'consume' argument must have a boolean value!")
+
+        if (matched := literals.match(self._text, self._index + offset)) is None:
+            return None
+
+        # Consume only if the match was successful
+        if consume is True:
+            self.consume(length=matched[0], offset=offset)
+
+        return matched[1]
+
+    def expect_any(
+        self,
+        literals: Literals | dict[str, object] | Iterable[str],
+        offset: int = 0,
+        raises: bool = False,
+    ) -> object | None:
+        """Supports performing a combined lookahead and consume on the longest matching
+        literal of those provided, returning its associated value, or the literal itself
+        if no values were associated, or None if none of the literals match."""
+
+        if not isinstance(raises, bool):
+            raise TypeError("The 'raises' argument must have a boolean value!")
+
+        if (
+            value := self.lookahead_any(literals=literals, offset=offset, consume=True)
+        ) is not None:
+            return value
+
+        # Otherwise, if the raises flag was set, raise an error when no match is found
+        if raises is True:
+            raise LexerError(
+                "None of the expected literals are present at the current offset!",
+                context=Context.NotFound,
+            )
+
+        return None
+
+    def match(self, pattern: str | re.Pattern, consume: bool = True) -> str:
+        """Matches the regular expression pattern at the current position, returning the
+        matched text, or an empty string if the pattern does not match; the matched text
+        is consumed, moving the cursor, unless the 'consume' argument is set to False.
+        """
+
+        if not isinstance(pattern, (str, re.Pattern)):
+            raise TypeError(
+                "The 'pattern' argument must have a string or compiled pattern value!"
+            )
+
+        if not isinstance(consume, bool):
+            raise TypeError("The 'consume' argument must have a boolean value!")
+
+        if matched := self._compile("match", pattern).match(self._text, self._index):
+            if consume is True:
+                return self._move(matched.end())
+            else:
+                return matched.group()
+
+        return ""
+
+    def scan_while(self, characters: str | re.Pattern | Callable[[str], bool]) -> str:
+        """Consumes the run of characters from the current position that are each in the
+        provided string of characters, or that each match the provided single character
+        pattern, or for which the provided predicate returns True, returning the run of
+        characters, or an empty string if the character at the current position does not
+        qualify. Runs of characters in a string or matching a pattern are scanned by the
+        regular expression engine in one call, as are runs of characters qualifying for
+        the str.isspace, str.isdecimal and str.isalnum predicates."""
+
+        if self._scannable(characters) is False:
+            text: str = self._text
+            end: int = self._index
+            length: int = self._length
+
+            while end < length and characters(text[end]):
+                end += 1
+
+            return self._move(end)
+
+        if matched := self._compile("while", characters).match(self._text, self._index):
+            return self._move(matched.end())
+
+        return ""
+
+    def scan_until(self, delimiters: str | Iterable[str]) -> str:
+        """Consumes the characters from the current position up to, but not including, the
+        next occurrence of the provided delimiter string, or of any one of the provided
+        delimiter strings, returning the consumed characters; if no delimiter is found,
+        the remainder of the text is consumed."""
+
+        delimiters = self._delimiters(delimiters)
+
+        if isinstance(delimiters, str):
+            end: int = self._text.find(delimiters, self._index)
+        elif matched := self._compile("until", delimiters).search(
+            self._text, self._index
+        ):
+            end: int = matched.start()
+        else:
+            end: int = -1
+
+        if end < 0:
+            end = max(self._length, self._index)
+
+        return self._move(end)
+
+    def _move(self, index: int) -> str:
+        """Moves the cursor forward to the specified index in a single update of the index
+        as well as the line and column numbers, returning the characters passed over."""
+
+        self._characters = characters = self._text[self._index : index]
+
+        self._index = index
+
+        if self._indexed is False:
+            if newlines := characters.count("\n"):
+                self._line += newlines
+                self._column = len(characters) - characters.rfind("\n")
+            else:
+                self._column += len(characters)
+
+        return characters
+
+    def _scannable(self, characters: str | re.Pattern | Callable[[str], bool]) -> bool:
+        """Validates the characters argument for the 'scan_while()' method, returning
+        whether the qualifying characters can be scanned via a regular expression."""
+
+        if isinstance(characters, str):
+            if len(characters) == 0:
+                raise ValueError(
+                    "The 'characters' argument must have a non-empty string value!"
+                )
+
+            return True
+        elif isinstance(characters, re.Pattern):
+            return True
+        elif callable(characters):
+            return characters in self._predicates
+        elif isinstance(characters, (bytes, bytearray, memoryview)):
+            raise TypeError(
+                f"The 'characters' argument must have a string value rather than bytes, as the {self.__class__.__name__} lexes over text!"
+            )
+        else:
+            raise TypeError(
+                "The 'characters' argument must have a string, compiled pattern or callable value!"
+            )
+
+    def _delimiters(self, delimiters: str | Iterable[str]) -> str | tuple[str]:
+        """Validates the delimiters argument for the 'scan_until()' method, returning the
+        single delimiter string or the delimiter strings as a tuple."""
+
+        if isinstance(delimiters, str):
+            if len(delimiters) == 0:
+                raise ValueError(
+                    "The 'delimiters' argument must have a non-empty string value!"
+                )
+
+            return delimiters
+        elif isinstance(delimiters, (bytes, bytearray, memoryview)):
+            raise TypeError(
+                f"The 'delimiters' argument must have a string value rather than bytes, as the {self.__class__.__name__} lexes over text!"
+            )
+        elif isinstance(delimiters, Iterable):
+            delimiters = tuple(delimiters)
+
+            if len(delimiters) == 0:
+                raise ValueError("The 'delimiters' argument must not be empty!")
+
+            for delimiter in delimiters:
+                if not (isinstance(delimiter, str) and len(delimiter) > 0):
+                    raise TypeError(
+                        "The 'delimiters' argument must only contain non-empty strings!"
+                    )
+
+            return delimiters
+        else:
+            raise TypeError(
+                "The 'delimiters' argument must have a string or iterable value!"
+            )
+
+    def _compile(
+        self, kind: str, value: str | tuple[str] | re.Pattern | Callable
+    ) -> re.Pattern:
+        """Returns the compiled pattern for the specified kind of scan and value, which is
+        compiled on first use and then cached, against the patterns, character sets or
+        delimiters it was compiled from, for reuse thereafter."""
+
+        return self._build(kind, value)
+
+    @classmethod
+    @lru_cache(maxsize=_PATTERNS)
+    def _build(
+        cls, kind: str, value: str | tuple[str] | re.Pattern | Callable
+    ) -> re.Pattern:
+        """Compiles the pattern for the specified kind of scan and value, holding the
+        most recently used of the compiled patterns in a bounded cache."""
+
+        if kind == "match":
+            return re.compile(value)
+        elif kind == "while":
+            if isinstance(value, re.Pattern):
+                return re.compile(f"(?:{value.pattern})+", value.flags)
+            elif isinstance(value, str):
+                return re.compile(f"[{''.join(map(re.escape, value))}]+")
+            else:
+                return re.compile(f"{cls._predicates[value]}+")
+        elif kind == "until":
+            # Longer delimiters are placed first so that they take precedence over any
+            # shorter delimiters that they begin with when starting at the same position
+            return re.compile(
+                "|".join(map(re.escape, sorted(value, key=len, reverse=True)))
+            )
+
+        raise ValueError(f"The pattern kind, {kind}, is not recognised!")
+
+
+class Mark(object):
+    """The Mark class records a snapshot of the state of a Lexer or Tokenizer, as made by
+    their 'mark()' methods, so that the state can be restored in a single operation via
+    their 'rollback()' methods when speculatively lexing or tokenizing text that may need
+    to be backtracked over. Marks are held in a stack by the Lexer or Tokenizer that made
+    them, and releasing a Mark, either by rolling it back or committing it, also releases
+    any Marks that were made after it. A Mark may be used as a context manager, in which
+    case it is rolled back if an exception is raised within the context, otherwise it is
+    committed when the context exits, unless it has already been released."""
+
+    _owner: object = None
+    _state: tuple = None
+    _marks: list[Mark] = None
+    _active: bool = None
+
+    def __init__(self, owner: object, state: tuple, marks: list[Mark]):
+        """Initialize the new Mark class instance with the specified owner and state."""
+
+        if not isinstance(state, tuple):
+            raise TypeError("The 'state' argument must have a tuple value!")
+
+        if not isinstance(marks, list):
+            raise TypeError("The 'marks' argument must have a list value!")
+
+        self._owner = owner
+        self._state = state
+        self._marks = marks
+        self._active = True
+
+        marks.append(self)
+
+    def __enter__(self) -> Mark:
+        """Supports using the Mark as a context manager."""
+
+        return self
+
+    def __exit__(self, type, value, traceback) -> bool:
+        """Rolls back the Mark if an exception was raised within the context, otherwise
+        commits the Mark, unless it was released within the context; any exception raised
+        within the context is propagated."""
+
+        if self._active is True:
+            if type is None:
+                self._owner.commit(self)
+            else:
+                self._owner.rollback(self)
+
+        return False
+
+    @property
+    def owner(self) -> object:
+        """Returns the Lexer or Tokenizer that made the Mark."""
+
+        return self._owner
+
+    @property
+    def state(self) -> tuple:
+        """Returns the state recorded by the Mark."""
+
+        return self._state
+
+    @property
+    def active(self) -> bool:
+        """Returns whether the Mark is active, or if it has been released."""
+
+        return self._active
+
+    def rollback(self) -> None:
+        """Restores the state recorded by the Mark via its owner's 'rollback()' method."""
+
+        self._owner.rollback(self)
+
+    def commit(self) -> None:
+        """Releases the Mark via its owner's 'commit()' method."""
+
+        self._owner.commit(self)
+
+    def _release(self):
+        """Releases the Mark as well as any Marks that were made after it."""
+
+        while self._marks:
+            mark: Mark = self._marks.pop()
+            mark._active = False
+
+            if mark is self:
+                break
+
+
+class Literals(object):
+    """The Literals class holds a set of literal strings, such as the operators and the
+    punctuation of a grammar, and optionally a value associated with each literal, such
+    as its token Type, for matching via the Lexer's 'lookahead_any()' and 'expect_any()'
+    methods. The literals are held in a dispatch table keyed by their first character,
+    with the literals sharing a first character ordered from the longest to shortest, so
+    the longest matching literal is found with a single table lookup per position rather
+    than a separate look-ahead for each literal. As building the table takes some work,
+    a Literals instance should be built once, such as in a Tokenizer class attribute."""
+
+    _literals: dict[str | bytes, object] = None
+    _table: dict[str | int, tuple[tuple[str | bytes, object]]] = None
+    _longest: int = None
+    _binary: bool = None
+    _encoded: dict[str, Literals] = None
+
+    def __init__(self, literals: dict[str | bytes, object] | Iterable[str | bytes]):
+        """Initialize the new Literals class instance with the specified literals, either
+        as a dictionary of literals mapped to their associated values, or as an iterable
+        of literals, in which case each literal is associated with itself as its value.
+        """
+
+        if isinstance(literals, dict):
+            pass
+        elif isinstance(literals, (str, bytes)) or not isinstance(literals, Iterable):
+            raise TypeError(
+                "The 'literals' argument must have a dictionary or iterable value!"
+            )
+        else:
+            literals = {literal: literal for literal in literals}
+
+        if len(literals) == 0:
+            raise ValueError("The 'literals' argument must not be empty!")
+
+        binary: bool = isinstance(next(iter(literals)), bytes)
+
+        table: dict[str | int, list[tuple[str | bytes, object]]] = {}
+
+        for literal, value in literals.items():
+            if not isinstance(literal, bytes if binary else str):
+                raise TypeError(
+                    "The 'literals' argument must only contain either strings or bytes!"
+                )
+            elif len(literal) == 0:
+                raise ValueError(
+                    "The 'literals' argument must not contain empty values!"
+                )
+            elif value is None:
+                raise ValueError("The 'literals' argument values must not be None!")
+
+            table.setdefault(literal[0], []).append((literal, value))
+
+        # The literals sharing a first character are ordered from the longest to shortest
+        # so that the first literal found to match is also the longest matching literal
+        self._table = {
+            first: tuple(
+                sorted(candidates, key=lambda item: len(item[0]), reverse=True)
+            )
+            for first, candidates in table.items()
+        }
+
+        self._literals = dict(literals)
+        self._longest = max(map(len, literals))
+        self._binary = binary
+        self._encoded = {}
+
+    def __len__(self) -> int:
+        """Returns the number of literals held by the Literals class instance."""
+
+        return len(self._literals)
+
+    def __iter__(self):
+        """Supports iterating over the literals held by the Literals class instance."""
+
+        return iter(self._literals)
+
+    def __contains__(self, literal: str | bytes) -> bool:
+        """Determine if the specified literal is held by the Literals class instance."""
+
+        return literal in self._literals
+
+    def __getitem__(self, literal: str | bytes) -> object:
+        """Returns the value associated with the specified literal."""
+
+        return self._literals[literal]
+
+    @property
+    def literals(self) -> dict[str | bytes, object]:
+        """Returns a copy of the literals and their associated values."""
+
+        return dict(self._literals)
+
+    @property
+    def longest(self) -> int:
+        """Returns the length of the longest literal."""
+
+        return self._longest
+
+    @property
+    def binary(self) -> bool:
+        """Returns whether the literals are held as bytes rather than strings."""
+
+        return self._binary
+
+    def match(
+        self, text: str | bytes | memoryview, index: int = 0
+    ) -> tuple[str | bytes, object] | None:
+        """Returns the longest literal matching the text at the specified index as well
+        as its associated value, or None if none of the literals match."""
+
+        if not 0 <= index < len(text):
+            return None
+
+        # Indexing a string yields its first character while indexing a bytes-like value
+        # yields its first byte as an integer, matching the keys of the dispatch table
+        if (candidates := self._table.get(text[index])) is None:
+            return None
+
+        if self._binary is False:
+            for literal, value in candidates:
+                if text.startswith(literal, index):
+                    return (literal, value)
+        else:
+            for literal, value in candidates:
+                if text[index : index + len(literal)] == literal:
+                    return (literal, value)
+
+        return None
+
+    def encode(self, encoding: str) -> Literals:
+        """Returns a Literals instance holding the literals encoded into bytes with the
+        specified encoding, which is built on first use and then cached for reuse."""
+
+        if self._binary is True:
+            return self
+
+        if (literals := self._encoded.get(encoding)) is None:
+            literals = self._encoded[encoding] = Literals(
+                {
+                    literal.encode(encoding): value
+                    for literal, value in self._literals.items()
+                }
+            )
+
+        return literals
+
 
 class Position(object):
-    """The Position class encapsulates the current cursor position of the Lexer."""
+    """The Position class encapsulates the current cursor position of the Lexer. Position
+    instances are immutable and hold their values in slots rather than an instance dict,
+    so they may be shared freely and hashed; the 'adjust()' method returns a new Position
+    rather than modifying the instance. Positions are ordered and hashed by their index.
+    """
 
-    _index: int = None
-    _line: int = None
-    _column: int = None
+    __slots__ = ("_index", "_line", "_column")
+
+    _index: int
+    _line: int
+    _column: int
 
     def __init__(self, index: int = 0, line: int = 0, column: int = 0):
         """Initialize the new Position class instance with the specified values."""
@@ -323,8 +1184,6 @@ class Position(object):
                 "The 'index' argument must have an non-negative integer value!"
             )
 
-        self._index = index
-
         if not isinstance(line, int):
             raise TypeError("The 'line' argument must have an integer value!")
         elif not line >= 0:
@@ -332,8 +1191,6 @@ class Position(object):
                 "The 'line' argument must have an non-negative integer value!"
             )
 
-        self._line = line
-
         if not isinstance(column, int):
             raise TypeError("The 'column' argument must have an integer value!")
         elif not column >= 0:
@@ -341,31 +1198,61 @@ class Position(object):
                 "The 'column' argument must have an non-negative integer value!"
             )
 
-        self._column = column
+        _setattr(self, "_index", index)
+        _setattr(self, "_line", line)
+        _setattr(self, "_column", column)
+
+    @classmethod
+    def _make(cls, index: int, line: int, column: int) -> Position:
+        """Returns a new Position with the specified values without validating them, for
+        use by trusted callers such as the Lexer which already hold valid values."""
+
+        position: Position = _new(cls)
+
+        _setattr(position, "_index", index)
+        _setattr(position, "_line", line)
+        _setattr(position, "_column", column)
+
+        return position
+
+    def __setattr__(self, name: str, value: object):
+        """Prevents the values of the immutable Position class instance being modified."""
+
+        raise AttributeError("Position class instances are immutable!")
+
+    def __delattr__(self, name: str):
+        """Prevents the values of the immutable Position class instance being deleted."""
+
+        raise AttributeError("Position class instances are immutable!")
+
+    def __reduce__(self) -> tuple:
+        """Supports pickling and copying the immutable Position class instance."""
+
+        return (self.__class__._make, (self._index, self._line, self._column))
 
     def __str__(self) -> str:
         """Returns a string representation of current Position class instance."""
 
         return f"Position(index: {self._index}, line: {self._line}, column: {self._column})"
 
+    def __hash__(self) -> int:
+        """Returns the hash of the current Position class instance, based on its index."""
+
+        return hash(self._index)
+
     def __eq__(self, other: Position) -> bool:
         """Determine if current Position has values equal to another."""
 
         if not isinstance(other, Position):
             return NotImplemented
 
-        if not self.index == other.index:
-            return False
-
-        if not self.column == other.column:
-            return False
-
-        if not self.line == other.line:
-            return False
+        return (
+            self._index == other._index
+            and self._line == other._line
+            and self._column == other._column
+        )
 
-        return True
-
-    def __neq__(self, other: Position) -> bool:
+    def __ne__(self, other: Position) -> bool:
         """Determine if current Position has values not-equal to another."""
 
         if not isinstance(other, Position):
@@ -374,72 +1261,36 @@ class Position(object):
         return not (self == other)
 
     def __gt__(self, other: Position) -> bool:
-        """Determine if current Position has values greater-than to another."""
+        """Determine if current Position is after another, based on their indices."""
 
         if not isinstance(other, Position):
             return NotImplemented
 
-        if self.index > other.index:
-            return True
-
-        if self.column > other.column:
-            return True
-
-        if self.line > other.line:
-            return True
-
-        return False
+        return self._index > other._index
 
     def __lt__(self, other: Position) -> bool:
-        """Determine if current Position has values less-than to another."""
+        """Determine if current Position is before another, based on their indices."""
 
         if not isinstance(other, Position):
             return NotImplemented
 
-        if self.index < other.index:
-            return True
-
-        if self.column < other.column:
-            return True
-
-        if self.line < other.line:
-            return True
-
-        return False
+        return self._index < other._index
 
     def __ge__(self, other: Position) -> bool:
-        """Determine if current Position has values greater-than-or-equal to another."""
+        """Determine if current Position is at or after another, based on their indices."""
 
         if not isinstance(other, Position):
             return NotImplemented
 
-        if not (self.index >= other.index):
-            return False
-
-        if not (self.column >= other.column):
-            return False
-
-        if not (self.line >= other.line):
-            return False
-
-        return True
+        return self._index >= other._index
 
     def __le__(self, other: Position) -> bool:
-        """Determine if current Position has values less-than-or-equal to another."""
+        """Determine if current Position is at or before another, based on their indices."""
 
         if not isinstance(other, Position):
             return NotImplemented
 
-        if not (self.index <= other.index):
-            return False
-
-        if not (self.column <= other.column):
-            return False
-
-        if not (self.line <= other.line):
-            return False
-
-        return True
+        return self._index <= other._index
 
     @property
     def index(self) -> int:
@@ -462,40 +1313,40 @@ class Position(object):
     def copy(self) -> Position:
         """Returns an exact copy of the current Position class instance."""
 
-        return Position(index=self.index, line=self.line, column=self.column)
+        return Position._make(self._index, self._line, self._column)
 
     def adjust(self, offset: int = 0, line: int = None, column: int = None) -> Position:
-        """The 'adjust' method supports adjusting the current index position represented
-        by the Position class instance, and allows for the line and column numbers to be
-        adjusted as well as a change in the index position may also mean that the line
-        number needs to change, and that the column number must change. If the line and
-        column numbers are not easily computable when the adjustment is made, they should
-        not be specified and will revert to having values of `0` which means that they
-        are not known."""
+        """The 'adjust' method returns a new Position with the index position represented
+        by the Position class instance adjusted by the offset, and allows for the line and
+        column numbers to be adjusted as well as a change in the index position may also
+        mean that the line number needs to change, and that the column number must change.
+        If the column number is not specified, it is adjusted by the offset, and if the
+        line number is not specified, it is left unchanged. The current Position class
+        instance is left unmodified."""
 
         if not isinstance(offset, int):
             raise TypeError("The 'offset' argument must have an integer value!")
 
-        # Adjust the index by the specified offset value
-        self._index += offset
-
         if line is None:
-            pass
+            line = self._line
         elif not isinstance(line, int):
             raise TypeError("The 'line' argument must have an integer value!")
         elif not line >= 1:
             raise ValueError("The 'line' argument must have a positive integer value!")
-        else:
-            self._line = line
 
         if column is None:
             # Adjust the column by the specified offset value
-            self._column += offset
+            column = self._column + offset
         elif not isinstance(column, int):
             raise TypeError("The 'column' argument must have an integer value!")
-        elif not line >= 1:
-            raise ValueError("The 'line' argument must have a positive integer value!")
-        else:
-            self._column = column
+        elif not column >= 1:
+            raise ValueError(
+                "The 'column' argument must have a positive integer value!"
+            )
 
-        return self
+        return Position._make(self._index + offset, line, column)
+
+
+# The slot assignment and allocation functions used to build immutable Position instances
+_setattr: Callable[[object, str, object], None] = object.__setattr__
+_new: Callable[[type], object] = object.__new__
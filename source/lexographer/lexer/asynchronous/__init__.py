@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+from lexographer.logging import logger
+from lexographer.exceptions import LexerError
+from lexographer.lexer.stream import StreamLexer
+
+from collections.abc import AsyncIterable, AsyncIterator
+
+import asyncio
+import concurrent.futures
+import inspect
+
+logger = logger.getChild(__name__)
+
+
+class AsyncLexer(StreamLexer):
+    """The AsyncLexer class supports lexing over text received asynchronously, such as
+    from an asyncio.StreamReader or any asynchronous iterable of text strings or bytes,
+    which are decoded incrementally as they are received. The text is held in a sliding
+    buffer as per the StreamLexer class, and more text is only awaited when the buffer
+    does not hold enough text to satisfy the current lexing method call.
+
+    The AsyncLexer offers asynchronous variants of the main lexing methods, such as the
+    'aread()', 'apeek()', 'alookahead()' and 'aexpect()' methods, which await any text
+    needed before performing the synchronous lexing operation over the buffer, as well
+    as asynchronous iteration over the characters of the text. The synchronous lexing
+    methods may also be called from a thread other than the event loop's thread, such as
+    by a Tokenizer running in a worker thread, in which case they block while the text
+    they need is received via the event loop; calling them from the event loop's thread
+    when the buffer does not hold enough text raises a LexerError, as blocking the event
+    loop thread while waiting on the event loop would never complete."""
+
+    _loop: asyncio.AbstractEventLoop = None
+    _pending: concurrent.futures.Future = None
+    _closed: bool = None
+
+    def __init__(
+        self,
+        stream: asyncio.StreamReader | AsyncIterable[str | bytes],
+        encoding: str = None,
+        errors: str = "strict",
+        chunk: int = 65536,
+        window: int = 4096,
+    ):
+        """Supports initializing the AsyncLexer class with the provided stream, which may
+        be an asyncio.StreamReader or any object offering an asynchronous 'read(size)'
+        method, or any asynchronous iterable of text strings or bytes. The AsyncLexer must
+        be instantiated while the event loop that will provide the text is running."""
+
+        if isinstance(stream, asyncio.StreamReader) or (
+            hasattr(stream, "read") and inspect.iscoroutinefunction(stream.read)
+        ):
+            readable: bool = True
+        elif isinstance(stream, AsyncIterable):
+            readable: bool = False
+            stream = aiter(stream)
+        else:
+            raise TypeError(
+                "The 'stream' argument must reference an asyncio.StreamReader or an asynchronous iterable!"
+            )
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            raise LexerError(
+                "The AsyncLexer must be instantiated while an event loop is running!"
+            )
+
+        super().__init__(
+            stream=(), chunk=chunk, window=window, encoding=encoding, errors=errors
+        )
+
+        self._stream = stream
+        self._readable = readable
+        self._loop = loop
+        self._closed = False
+
+    def __aiter__(self) -> AsyncLexer:
+        """Supports asynchronously iterating over the characters of the stream."""
+
+        return self
+
+    async def __anext__(self) -> str:
+        """Supports asynchronously iterating over the characters of the stream."""
+
+        if await self.wait(1) is False:
+            raise StopAsyncIteration
+
+        return self.read()
+
+    def close(self) -> None:
+        """Closes the AsyncLexer, cancelling any text being received for a synchronous
+        lexing method call, which will then see the stream as having been exhausted."""
+
+        self._closed = True
+
+        if (pending := self._pending) is not None:
+            pending.cancel()
+
+        super().close()
+
+    async def wait(self, length: int = 1) -> bool:
+        """Awaits the receipt of text until the buffer holds the specified number of
+        characters from the cursor onwards, or until the stream is exhausted, returning
+        whether enough characters are available."""
+
+        if not (isinstance(length, int) and length >= 0):
+            raise TypeError(
+                "The 'length' argument must have a non-negative integer value!"
+            )
+
+        while self._length - self._index < length and self._exhausted is False:
+            self._append(await self._areceive())
+
+        return self._length - self._index >= length
+
+    async def aread(self, length: int = 1, raises: bool = False) -> str:
+        """Awaits the text needed before reading the specified number of characters."""
+
+        await self.wait(length if isinstance(length, int) and length > 0 else 0)
+
+        return self.read(length=length, raises=raises)
+
+    async def apeek(self, offset: int = 0, length: int = 1) -> str:
+        """Awaits the text needed before peeking the specified number of characters."""
+
+        if isinstance(offset, int) and isinstance(length, int):
+            await self.wait(max(0, offset + length))
+
+        return self.peek(offset=offset, length=length)
+
+    async def alookahead(
+        self, text: str, offset: int = 0, consume: bool = False
+    ) -> bool:
+        """Awaits the text needed before checking if the provided text follows."""
+
+        if isinstance(text, str) and isinstance(offset, int):
+            await self.wait(max(0, offset + len(text)))
+
+        return self.lookahead(text=text, offset=offset, consume=consume)
+
+    async def aexpect(self, text: str, offset: int = 0, raises: bool = False) -> str:
+        """Awaits the text needed before consuming the provided text if it follows."""
+
+        if isinstance(text, str) and isinstance(offset, int):
+            await self.wait(max(0, offset + len(text)))
+
+        return self.expect(text=text, offset=offset, raises=raises)
+
+    async def _areceive(self) -> str:
+        """Receives and decodes the next chunk of text from the stream, returning an
+        empty string once the stream has been exhausted."""
+
+        while self._closed is False:
+            if self._readable is True:
+                if not (data := await self._stream.read(self._chunk)):
+                    break
+            elif (data := await anext(self._stream, None)) is None:
+                break
+
+            if isinstance(data, str):
+                text: str = data
+            elif isinstance(data, (bytes, bytearray, memoryview)):
+                text: str = self._decode(data)
+            else:
+                raise TypeError("The stream must provide text string or bytes chunks!")
+
+            # A chunk may end part-way through a multi-byte character, in which case the
+            # decoder holds onto its bytes until the remainder of the character arrives
+            if text:
+                return text
+
+        return self._decode(b"", final=True)
+
+    def _receive(self) -> str:
+        """Receives the next chunk of text from the stream via the event loop, blocking
+        the calling thread until the text has been received."""
+
+        if self._closed is True:
+            return ""
+
+        try:
+            running: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        except RuntimeError:
+            running: asyncio.AbstractEventLoop = None
+
+        if running is self._loop:
+            raise LexerError(
+                "The AsyncLexer's synchronous methods cannot wait for text on the event loop thread; await the asynchronous methods, such as 'aread()', instead!"
+            )
+
+        self._pending = asyncio.run_coroutine_threadsafe(self._areceive(), self._loop)
+
+        try:
+            return self._pending.result()
+        except concurrent.futures.CancelledError:
+            return ""
+        finally:
+            self._pending = None
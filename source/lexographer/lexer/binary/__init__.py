@@ -0,0 +1,715 @@
+from __future__ import annotations
+
+from lexographer.logging import logger
+from lexographer.exceptions import LexerError
+from lexographer.enumerations import Context
+from lexographer.lexer import Lexer, Literals, Position, _PATTERNS
+
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+
+import codecs
+import mmap
+import os
+import re
+
+logger = logger.getChild(__name__)
+
+
+class BytesLexer(Lexer):
+    """The BytesLexer class supports lexing directly over encoded bytes, such as those
+    held by a bytes, bytearray, memoryview or memory map object, without first decoding
+    the whole of the input; the bytes are only decoded for the slices of text actually
+    returned by the lexing methods, or if decoding is disabled, the slices are returned
+    as zero-copy memoryview slices of the underlying bytes instead.
+
+    The BytesLexer supports the UTF-8 encoding, as well as single-byte encodings such as
+    ASCII and Latin-1; the 'index' property reports the character position as per the
+    Lexer class while the 'offset' property reports the corresponding byte position."""
+
+    # Encodings where every character is represented by a single byte
+    _singles: set[str] = {"ascii", "iso8859-1", "cp1252"}
+
+    # The number of bytes to process at a time when counting characters
+    _chunk: int = 1024 * 1024
+
+    # Only the cursor position can be located, so Positions cannot be derived on demand
+    _locatable: bool = False
+
+    # The number of bytes occupied by a UTF-8 character, indexed by its leading byte;
+    # continuation bytes are mapped to a width of one so that malformed input advances
+    _widths: bytes = bytes(
+        1 if byte < 0xC0 else 2 if byte < 0xE0 else 3 if byte < 0xF0 else 4
+        for byte in range(256)
+    )
+
+    # The runs of UTF-8 continuation bytes, which do not begin a new character
+    _continuations: re.Pattern = re.compile(b"[\x80-\xbf]+")
+
+    # The new line byte, used for tracking line numbers without decoding
+    _newline: re.Pattern = re.compile(b"\n")
+
+    # The regular expression classes compiled over bytes only match ASCII characters, so
+    # none of the string predicates have an exact equivalent when lexing over bytes
+    _predicates: dict[Callable, str] = {}
+
+    _encoding: str = None
+    _data: bytes | bytearray | memoryview | mmap.mmap = None
+    _view: memoryview = None
+    _decode: bool = None
+    _offset: int = None
+    _start: int = None
+    _size: int = None
+    _variable: bool = None
+
+    def __init__(
+        self,
+        text: bytes | bytearray | memoryview | mmap.mmap = None,
+        file: str = None,
+        encoding: str = "utf-8",
+        decode: bool = True,
+        errors: str = "strict",
+    ):
+        """Supports initializing the BytesLexer class with the provided bytes-like value
+        or file contents; if the 'decode' argument is set to False, the lexing methods
+        return memoryview slices of the bytes rather than decoded text strings."""
+
+        if text is None and file is None:
+            raise LexerError(
+                "The BytesLexer must be instantiated with either a bytes value or a valid file path!"
+            )
+
+        if text is None:
+            pass
+        elif not isinstance(text, (bytes, bytearray, memoryview, mmap.mmap)):
+            raise TypeError(
+                "The 'text' argument, if specified, must have a bytes, bytearray, memoryview or mmap value!"
+            )
+        elif isinstance(text, memoryview):
+            if not text.c_contiguous:
+                raise LexerError(
+                    "The 'text' argument must reference contiguous memory!"
+                )
+
+            text = text.cast("B")
+
+        if file is None:
+            pass
+        elif not isinstance(file, str):
+            raise TypeError(
+                "The 'file' argument, if specified, must have a string value!"
+            )
+        elif not os.path.exists(file):
+            raise LexerError("The 'file' argument must reference a valid file path!")
+        elif not os.path.isfile(file):
+            raise LexerError("The 'file' argument must reference a valid file!")
+        elif text is None:
+            with open(file, "rb") as handle:
+                text = handle.read()
+
+        if not isinstance(encoding, str):
+            raise TypeError("The 'encoding' argument must have a string value!")
+
+        try:
+            name: str = codecs.lookup(encoding).name
+        except LookupError:
+            raise LexerError(f"The 'encoding' argument, {encoding}, is not recognised!")
+
+        if name in ("utf-8", "utf-8-sig"):
+            self._variable = True
+        elif name in self._singles:
+            self._variable = False
+        else:
+            raise LexerError(
+                f"The 'encoding' argument, {encoding}, is not supported by the {self.__class__.__name__}; only UTF-8 and single-byte encodings are supported!"
+            )
+
+        if not isinstance(decode, bool):
+            raise TypeError("The 'decode' argument must have a boolean value!")
+
+        self._validate_codec(encoding=None, errors=errors)
+
+        if len(text) == 0:
+            raise ValueError("The 'text' argument must have a non-empty bytes value!")
+
+        # Skip over any UTF-8 byte order mark so that it is not lexed as content
+        if self._variable and text[:3] == codecs.BOM_UTF8:
+            self._start = 3
+        else:
+            self._start = 0
+
+        self._data = text
+        self._view = memoryview(text) if decode is False else None
+        self._decode = decode
+        self._errors = errors
+        self._encoding = "utf-8" if self._variable else name
+        self._size = len(text)
+        self._file = file
+        self._text = None
+        self._length = None
+        self._offset = self._start
+        self._index = 0
+        self._line = 1
+        self._column = 1
+
+    def __len__(self) -> int:
+        """Return the source text string length in characters."""
+
+        return self.length
+
+    def __iter__(self) -> BytesLexer:
+        """Supports iterating over the source text string."""
+
+        self._offset = self._start
+
+        return super().__iter__()
+
+    @property
+    def data(self) -> bytes | bytearray | memoryview | mmap.mmap:
+        """Returns the source bytes-like value."""
+
+        return self._data
+
+    @property
+    def text(self) -> str:
+        """Returns the source text string; as this requires decoding all of the source
+        bytes into memory, this property should be used sparingly if at all."""
+
+        return str(self._data[self._start : self._size], self._encoding, self._errors)
+
+    @property
+    def length(self) -> int:
+        """Returns the source text string length in characters; for variable-width
+        encodings this is computed in a single pass over the source bytes on first use.
+        """
+
+        if self._length is None:
+            length: int = 0
+
+            for start in range(self._start, self._size, self._chunk):
+                length += self._count(start, min(start + self._chunk, self._size))
+
+            self._length = length
+
+        return self._length
+
+    @property
+    def encoding(self) -> str:
+        """Returns the encoding used to decode the source bytes."""
+
+        return self._encoding
+
+    @property
+    def decode(self) -> bool:
+        """Returns whether the lexing methods return decoded text strings."""
+
+        return self._decode
+
+    @property
+    def offset(self) -> int:
+        """Returns the zero-indexed byte position of the cursor within the source bytes."""
+
+        return self._offset
+
+    @property
+    def size(self) -> int:
+        """Returns the size of the source bytes."""
+
+        return self._size
+
+    def _slice(self, start: int, end: int) -> str | memoryview:
+        """Returns the decoded text or memoryview slice between the byte offsets."""
+
+        if self._decode is True:
+            return str(self._data[start:end], self._encoding, self._errors)
+        else:
+            return self._view[start:end]
+
+    def _count(self, start: int, end: int) -> int:
+        """Returns the number of characters encoded between the specified byte offsets."""
+
+        if self._variable is False:
+            return end - start
+
+        # The continuation bytes are counted by run, without collecting the matches
+        return (
+            end
+            - start
+            - sum(
+                match.end() - match.start()
+                for match in self._continuations.finditer(self._data, start, end)
+            )
+        )
+
+    def _encode(self, text: str | bytes) -> bytes:
+        """Returns the provided text encoded into bytes, if it is not already bytes."""
+
+        if isinstance(text, str):
+            return text.encode(self._encoding)
+
+        return bytes(text)
+
+    def _forward(self, offset: int, count: int) -> tuple[int, int]:
+        """Steps forward by the specified number of characters from the specified byte
+        offset, returning the new byte offset and the number of characters stepped."""
+
+        if self._variable is False:
+            end: int = min(offset + count, self._size)
+
+            return (end, end - offset)
+
+        data: bytes = self._data
+        widths: bytes = self._widths
+        stepped: int = 0
+
+        while stepped < count and offset < self._size:
+            offset += widths[data[offset]]
+            stepped += 1
+
+        return (min(offset, self._size), stepped)
+
+    def _backward(self, offset: int, count: int) -> tuple[int, int]:
+        """Steps backward by the specified number of characters from the specified byte
+        offset, returning the new byte offset and the number of characters stepped."""
+
+        if self._variable is False:
+            start: int = max(offset - count, self._start)
+
+            return (start, offset - start)
+
+        data: bytes = self._data
+        stepped: int = 0
+
+        while stepped < count and offset > self._start:
+            offset -= 1
+
+            while offset > self._start and 0x80 <= data[offset] < 0xC0:
+                offset -= 1
+
+            stepped += 1
+
+        return (offset, stepped)
+
+    def _seek(self, offset: int) -> int | None:
+        """Returns the byte offset of the character at the specified character offset
+        from the cursor, or None if the offset lies outside of the source bytes."""
+
+        if offset > 0:
+            start, stepped = self._forward(self._offset, offset)
+        elif offset < 0:
+            start, stepped = self._backward(self._offset, 0 - offset)
+        else:
+            return self._offset
+
+        return start if stepped == abs(offset) else None
+
+    def _linestart(self, offset: int) -> int:
+        """Returns the byte offset of the start of the line holding the byte offset."""
+
+        data: bytes = self._data
+
+        while offset > self._start and not data[offset - 1] == 0x0A:
+            offset -= 1
+
+        return offset
+
+    def _advance(self, offset: int, stepped: int) -> str | memoryview:
+        """Advances the cursor to the specified byte offset, updating the character index
+        as well as the line and column numbers based on the characters passed over."""
+
+        self._characters = characters = self._slice(self._offset, offset)
+
+        if self._decode is True:
+            newlines: int = characters.count("\n")
+        else:
+            newlines: int = len(self._newline.findall(self._data, self._offset, offset))
+
+        self._offset = offset
+        self._index += stepped
+
+        if newlines:
+            self._line += newlines
+            self._column = self._count(self._linestart(offset), offset) + 1
+        else:
+            self._column += stepped
+
+        return characters
+
+    def read(self, length: int = 1, raises: bool = False) -> str | memoryview:
+        """Reads/advances the specified number of characters from the source bytes."""
+
+        if not (isinstance(length, int) and length >= 1):
+            raise TypeError("The 'length' argument must have a positive integer value!")
+
+        if not isinstance(raises, bool):
+            raise TypeError("The 'raises' argument must have a boolean value!")
+
+        offset, stepped = self._forward(self._offset, length)
+
+        if raises is True and stepped < length:
+            raise LexerError(
+                f"The 'length' argument value, {length}, in addition to the current index, {self._index}, exceeds the overall length, {self._index + stepped}!",
+                context=Context.Finish,
+            )
+
+        return self._advance(offset, stepped)
+
+    def peek(self, offset: int = 0, length: int = 1) -> str | memoryview:
+        """Returns the specified number of characters at the current offset position."""
+
+        if not isinstance(offset, int):
+            raise TypeError("The 'offset' argument must have an integer value!")
+
+        if not (isinstance(length, int) and length >= 1):
+            raise TypeError("The 'length' argument must have a positive integer value!")
+
+        if (start := self._seek(offset)) is None:
+            return self._slice(self._offset, self._offset)
+
+        end, stepped = self._forward(start, length)
+
+        if stepped < length:
+            return self._slice(self._offset, self._offset)
+
+        return self._slice(start, end)
+
+    def consume(
+        self, length: int | str | bytes = 1, offset: int = 0
+    ) -> str | memoryview:
+        """Consumes the specified number of characters, moving the cursor."""
+
+        if isinstance(length, str):
+            length = len(length)
+        elif isinstance(length, bytes):
+            length = len(str(length, self._encoding, self._errors))
+        elif not (isinstance(length, int) and length >= 1):
+            raise TypeError("The 'length' argument must have a positive integer value!")
+
+        if not (isinstance(offset, int) and offset >= 0):
+            raise TypeError("The 'offset' argument must have a positive integer value!")
+        elif self._seek(offset) is None:
+            raise LexerError(
+                f"The 'offset' argument value, {offset}, in addition to the current index, {self._index}, exceeds the overall length!",
+                context=Context.Finish,
+            )
+
+        return self._advance(*self._forward(self._offset, length))
+
+    def push(self, length: int | str | bytes = 1) -> str | memoryview:
+        """Pushes the specified number of characters back, moving the position index."""
+
+        if isinstance(length, str):
+            length = len(length)
+        elif isinstance(length, bytes):
+            length = len(str(length, self._encoding, self._errors))
+        elif not (isinstance(length, int) and length >= 1):
+            raise TypeError("The 'length' argument must have a positive integer value!")
+
+        offset, stepped = self._backward(self._offset, length)
+
+        characters: str | memoryview = self._slice(offset, self._offset)
+
+        newlines: int = len(self._newline.findall(self._data, offset, self._offset))
+
+        self._offset = offset
+        self._index -= stepped
+
+        if newlines:
+            self._line -= newlines
+            self._column = self._count(self._linestart(offset), offset) + 1
+        else:
+            self._column -= stepped
+
+        return characters
+
+    def lookbehind(self, text: str | bytes, offset: int = 0) -> bool:
+        """Check if the contents proceeding the current position match that provided."""
+
+        return self.lookahead(text=text, offset=offset)
+
+    def lookahead(
+        self,
+        text: str | bytes,
+        offset: int = 0,
+        consume: bool = False,
+    ) -> bool:
+        """Check if the contents following the current position match that provided; the
+        comparison is made between the encoded bytes, so no decoding is needed."""
+
+        if not isinstance(text, (str, bytes)):
+            raise TypeError("The 'text' argument must have a string or bytes value!")
+        elif len(text) == 0:
+            raise ValueError("The 'text' argument must have a non-empty value!")
+
+        if not isinstance(offset, int):
+            raise TypeError("The 'offset' argument must have an integer value!")
+
+        if not isinstance(consume, bool):
+            raise TypeError("The 'consume' argument must have a boolean value!")
+
+        if (start := self._seek(offset)) is None:
+            return False
+
+        encoded: bytes = self._encode(text)
+
+        matches: bool = self._data[start : start + len(encoded)] == encoded
+
+        # Consume only if the match was successful
+        if matches is True and consume is True:
+            self.consume(length=text, offset=offset)
+
+        return matches
+
+    def expect(
+        self, text: str | bytes, offset: int = 0, raises: bool = False
+    ) -> str | memoryview:
+        """Supports performing a combined lookahead and consume on the expected text."""
+
+        if not isinstance(text, (str, bytes)):
+            raise TypeError("The 'text' argument must have a string or bytes value!")
+
+        if not isinstance(offset, int):
+            raise TypeError("The 'offset' argument must have an integer value!")
+
+        if not isinstance(raises, bool):
+            raise TypeError("The 'raises' argument must have a boolean value!")
+
+        # If the specified text is present, consume it, adjusting the current
+        # cursor position, then return the text value as confirmation
+        if self.lookahead(text=text, offset=offset) is True:
+            return self.consume(text, offset=offset)
+
+        # Otherwise, if the raises flag was set, raise an error when no match is found
+        if raises is True:
+            raise LexerError(
+                "The expected text, %r, is not present at the current offset!" % (text),
+                context=Context.NotFound,
+            )
+
+        # Otherwise, return an empty (falsey) string, or memoryview, as the default
+        return self._slice(self._offset, self._offset)
+
+    def _snapshot(self) -> tuple:
+        """Returns the state of the cursor position to be recorded by a Mark, which also
+        includes the byte offset of the cursor."""
+
+        return (self._index, self._offset, self._line, self._column, self._characters)
+
+    def _restore(self, state: tuple):
+        """Restores the state of the cursor position recorded by a Mark."""
+
+        self._index, self._offset, self._line, self._column, self._characters = state
+
+    def locate(self, index: int) -> Position:
+        """Returns the Position for the specified zero-indexed character position; as the
+        BytesLexer does not hold an index of the new lines in the source bytes, only the
+        cursor position can be located."""
+
+        if not isinstance(index, int):
+            raise TypeError("The 'index' argument must have an integer value!")
+
+        if not index == self.index:
+            raise LexerError(
+                f"The {self.__class__.__name__} only supports locating the current cursor position!"
+            )
+
+        return self.position
+
+    def lookahead_any(
+        self,
+        literals: Literals | dict[str, object] | Iterable[str],
+        offset: int = 0,
+        consume: bool = False,
+    ) -> object | None:
+        """Check if any of the provided literals follow the current position, as per the
+        Lexer class' method; the literals are encoded once and cached by the Literals
+        instance, and are then compared directly against the source bytes."""
+
+        if not isinstance(literals, Literals):
+            literals = Literals(literals)
+
+        if not isinstance(offset, int):
+            raise TypeError("The 'offset' argument must have an integer value!")
+
+        if not isinstance(consume, bool):
+            raise TypeError("The 'consume' argument must have a boolean value!")
+
+        if (start := self._seek(offset)) is None:
+            return None
+
+        if (
+            matched := literals.encode(self._encoding).match(self._data, start)
+        ) is None:
+            return None
+
+        # Consume only if the match was successful
+        if consume is True:
+            self.consume(length=matched[0], offset=offset)
+
+        return matched[1]
+
+    def match(
+        self, pattern: str | bytes | re.Pattern, consume: bool = True
+    ) -> str | memoryview:
+        """Matches the regular expression pattern at the current position, as per the
+        Lexer class' method; the pattern is matched directly over the source bytes, so
+        string patterns are encoded before being compiled, and as such any character
+        classes within the pattern match single bytes rather than whole characters."""
+
+        if not isinstance(pattern, (str, bytes, re.Pattern)):
+            raise TypeError(
+                "The 'pattern' argument must have a string, bytes or compiled pattern value!"
+            )
+
+        if not isinstance(consume, bool):
+            raise TypeError("The 'consume' argument must have a boolean value!")
+
+        if matched := self._compile("match", pattern).match(self._data, self._offset):
+            if consume is True:
+                return self._advance(
+                    end := matched.end(), self._count(self._offset, end)
+                )
+            else:
+                return self._slice(self._offset, matched.end())
+
+        return self._slice(self._offset, self._offset)
+
+    def scan_while(
+        self, characters: str | bytes | re.Pattern | Callable[[str], bool]
+    ) -> str | memoryview:
+        """Consumes the run of qualifying characters from the current position, as per
+        the Lexer class' method; character sets that can be encoded as single bytes are
+        scanned directly over the source bytes, while predicates and any multi-byte
+        characters are checked one decoded character at a time."""
+
+        if isinstance(characters, bytes):
+            characters = str(characters, self._encoding, self._errors)
+
+        if self._scannable(characters) is False:
+            predicate: Callable[[str], bool] = characters
+        elif isinstance(characters, str) and not (
+            characters.isascii() or self._variable is False
+        ):
+            predicate: Callable[[str], bool] = characters.__contains__
+        elif matched := self._compile("while", characters).match(
+            self._data, self._offset
+        ):
+            return self._advance(end := matched.end(), self._count(self._offset, end))
+        else:
+            return self._slice(self._offset, self._offset)
+
+        offset: int = self._offset
+        stepped: int = 0
+
+        while offset < self._size:
+            end, _ = self._forward(offset, 1)
+
+            if not predicate(str(self._data[offset:end], self._encoding, self._errors)):
+                break
+
+            offset = end
+            stepped += 1
+
+        return self._advance(offset, stepped)
+
+    def scan_until(
+        self, delimiters: str | bytes | Iterable[str | bytes]
+    ) -> str | memoryview:
+        """Consumes the characters from the current position up to, but not including, the
+        next occurrence of any of the delimiters, as per the Lexer class' method; the
+        delimiters are encoded and searched for directly over the source bytes."""
+
+        delimiters = self._delimiters(delimiters)
+
+        if not isinstance(delimiters, tuple):
+            delimiters = (delimiters,)
+
+        if matched := self._compile("until", delimiters).search(
+            self._data, self._offset
+        ):
+            end: int = matched.start()
+        else:
+            end: int = self._size
+
+        return self._advance(end, self._count(self._offset, end))
+
+    def _delimiters(
+        self, delimiters: str | bytes | Iterable[str | bytes]
+    ) -> str | bytes | tuple[str | bytes]:
+        """Validates the delimiters argument for the 'scan_until()' method, as per the
+        Lexer class' method, while also accepting delimiters specified as bytes."""
+
+        if isinstance(delimiters, bytes):
+            if len(delimiters) == 0:
+                raise ValueError(
+                    "The 'delimiters' argument must have a non-empty bytes value!"
+                )
+
+            return delimiters
+        elif isinstance(delimiters, Iterable) and not isinstance(delimiters, str):
+            delimiters = tuple(delimiters)
+
+            if len(delimiters) == 0:
+                raise ValueError("The 'delimiters' argument must not be empty!")
+
+            for delimiter in delimiters:
+                if not (isinstance(delimiter, (str, bytes)) and len(delimiter) > 0):
+                    raise TypeError(
+                        "The 'delimiters' argument must only contain non-empty strings or bytes!"
+                    )
+
+            return delimiters
+
+        return super()._delimiters(delimiters)
+
+    def _compile(
+        self, kind: str, value: str | bytes | tuple | re.Pattern
+    ) -> re.Pattern:
+        """Returns the compiled pattern for the specified kind of scan and value, which is
+        cached against the encoding as well, as string values are encoded to compile."""
+
+        return self._build(kind, value, self._encoding)
+
+    @classmethod
+    @lru_cache(maxsize=_PATTERNS)
+    def _build(
+        cls, kind: str, value: str | bytes | tuple | re.Pattern, encoding: str = "utf-8"
+    ) -> re.Pattern:
+        """Compiles the bytes pattern for the specified kind of scan and value, encoding
+        any string values via the specified encoding; the patterns are compiled over bytes
+        and so are cached separately from those of the Lexer class."""
+
+        def encode(text: str | bytes) -> bytes:
+            return text.encode(encoding) if isinstance(text, str) else bytes(text)
+
+        if isinstance(value, re.Pattern):
+            if isinstance(value.pattern, str):
+                flags: int = value.flags & ~re.UNICODE
+                value: bytes = encode(value.pattern)
+            else:
+                flags: int = value.flags
+                value: bytes = value.pattern
+
+            if kind == "while":
+                value = b"(?:" + value + b")+"
+
+            return re.compile(value, flags)
+        elif kind == "match":
+            return re.compile(encode(value))
+        elif kind == "while":
+            return re.compile(
+                b"["
+                + b"".join(re.escape(bytes([byte])) for byte in encode(value))
+                + b"]+"
+            )
+        elif kind == "until":
+            # Longer delimiters are placed first so that they take precedence over any
+            # shorter delimiters that they begin with when starting at the same position
+            return re.compile(
+                b"|".join(
+                    re.escape(delimiter)
+                    for delimiter in sorted(map(encode, value), key=len, reverse=True)
+                )
+            )
+
+        raise ValueError(f"The pattern kind, {kind}, is not recognised!")
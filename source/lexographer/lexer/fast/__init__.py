@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from lexographer.logging import logger
+from lexographer.exceptions import LexerError
+from lexographer.enumerations import Context
+from lexographer.lexer import Lexer, Literals
+
+logger = logger.getChild(__name__)
+
+
+class FastLexer(Lexer):
+    """The FastLexer class is an API-compatible variant of the Lexer class for use in hot
+    lexing loops; its arguments are validated once during instantiation, but the lexing
+    methods skip the per-call argument validation performed by the Lexer class, and the
+    look-ahead and expect methods compute their slices inline rather than delegating to
+    the peek and consume methods, which would otherwise validate the arguments again.
+
+    As the lexing methods do not validate their arguments, passing invalid arguments to
+    them results in undefined behaviour rather than the TypeError and ValueError errors
+    raised by the Lexer class, so the FastLexer is best suited for use by Tokenizer
+    subclasses that have been developed and tested against the Lexer class."""
+
+    def __next__(self) -> str:
+        """Supports iterating over individual characters from the source text string."""
+
+        if self._index >= self._length:
+            raise StopIteration
+
+        return self.read()
+
+    def read(self, length: int = 1, raises: bool = False) -> str:
+        """Reads/advances the specified number of characters from the source string."""
+
+        index: int = self._index
+
+        if raises is True and index + length > self._length:
+            raise LexerError(
+                f"The 'length' argument value, {length}, in addition to the current index, {index}, exceeds the overall length, {self._length}!",
+                context=Context.Finish,
+            )
+
+        self._characters = characters = self._text[index : index + length]
+
+        self._index = index + length
+
+        if self._indexed is False:
+            if characters == "\n":
+                self._line += 1
+                self._column = 1
+            else:
+                self._column += length
+
+        return characters
+
+    def advance(self, length: int = 1) -> str:
+        """The 'advance()' method is an alias for the 'read()' method."""
+
+        return self.read(length)
+
+    def peek(self, offset: int = 0, length: int = 1) -> str:
+        """Returns the specified number of characters at the current offset position."""
+
+        index: int = self._index + offset
+
+        if index + length <= self._length:
+            return self._text[index : index + length]
+        else:
+            return ""
+
+    def consume(self, length: int | str = 1, offset: int = 0) -> str:
+        """Consumes the specified number of characters, moving the cursor."""
+
+        if isinstance(length, str):
+            length = len(length)
+
+        index: int = self._index
+
+        if index + offset > self._length:
+            raise LexerError(
+                f"The 'offset' argument value, {offset}, in addition to the current index, {index}, exceeds the overall length, {self._length}!",
+                context=Context.Finish,
+            )
+
+        self._characters = characters = self._text[index : index + length]
+
+        self._index = index + length
+
+        if self._indexed is False:
+            if "\n" in characters:
+                self._line += 1
+                self._column = 1
+            else:
+                self._column += length
+
+        return characters
+
+    def push(self, length: int | str = 1) -> str:
+        """Pushes the specified number of characters back, moving the position index."""
+
+        if isinstance(length, str):
+            length = len(length)
+
+        index: int = self._index
+
+        characters: str = self._text[index - length : index]
+
+        self._index = index - length
+
+        if self._indexed is False:
+            if "\n" in characters:
+                self._line -= 1
+                self._column = 1
+            else:
+                self._column += length
+
+        return characters
+
+    def lookbehind(self, text: str, offset: int = 0) -> bool:
+        """Check if the contents proceeding the current position match that provided."""
+
+        index: int = self._index + offset
+
+        return (end := index + len(text)) <= self._length and self._text[
+            index:end
+        ] == text
+
+    def lookahead(self, text: str, offset: int = 0, consume: bool = False) -> bool:
+        """Check if the contents following the current position match that provided."""
+
+        index: int = self._index + offset
+
+        if not (
+            (end := index + len(text)) <= self._length and self._text[index:end] == text
+        ):
+            return False
+
+        # Consume only if the match was successful
+        if consume is True:
+            self.consume(text, offset)
+
+        return True
+
+    def expect(self, text: str, offset: int = 0, raises: bool = False) -> str:
+        """Supports performing a combined lookahead and consume on the expected text."""
+
+        index: int = self._index + offset
+
+        # If the specified text is present, consume it, adjusting the current
+        # cursor position, then return the text value as confirmation
+        if (end := index + len(text)) <= self._length and self._text[index:end] == text:
+            return self.consume(text, offset)
+
+        # Otherwise, if the raises flag was set, raise an error when no match is found
+        if raises is True:
+            raise LexerError(
+                "The expected text, %r, is not present at the current offset!" % (text),
+                context=Context.NotFound,
+            )
+
+        # Otherwise, return an empty (falsey) string as the default behaviour
+        return ""
+
+    def lookahead_any(
+        self, literals: Literals, offset: int = 0, consume: bool = False
+    ) -> object | None:
+        """Check if any of the provided literals follow the current position, returning
+        the value associated with the longest matching literal; the literals must be
+        provided as a Literals instance, as they are not converted by this method."""
+
+        if (matched := literals.match(self._text, self._index + offset)) is None:
+            return None
+
+        # Consume only if the match was successful
+        if consume is True:
+            self.consume(matched[0], offset)
+
+        return matched[1]
+
+    def expect_any(
+        self, literals: Literals, offset: int = 0, raises: bool = False
+    ) -> object | None:
+        """Supports performing a combined lookahead and consume on the longest matching
+        literal of those provided, returning its associated value."""
+
+        if (matched := literals.match(self._text, self._index + offset)) is not None:
+            self.consume(matched[0], offset)
+
+            return matched[1]
+
+        # Otherwise, if the raises flag was set, raise an error when no match is found
+        if raises is True:
+            raise LexerError(
+                "None of the expected literals are present at the current offset!",
+                context=Context.NotFound,
+            )
+
+        return None
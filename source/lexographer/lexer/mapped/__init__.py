@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from lexographer.logging import logger
+from lexographer.exceptions import LexerError
+from lexographer.lexer.binary import BytesLexer
+
+import mmap
+import os
+
+logger = logger.getChild(__name__)
+
+
+class MappedLexer(BytesLexer):
+    """The MappedLexer class supports lexing over the contents of a file via a read-only
+    memory map rather than reading and decoding the whole file into memory up front; the
+    mapped bytes are only decoded for the slices of text actually returned by the lexing
+    methods, so resident memory tracks the working window rather than the file size.
+
+    The MappedLexer supports the UTF-8 encoding, as well as single-byte encodings such as
+    ASCII and Latin-1; the 'index' property reports the character position as per the
+    Lexer class while the 'offset' property reports the corresponding byte position."""
+
+    _mapping: mmap.mmap = None
+
+    def __init__(
+        self,
+        text: str = None,
+        file: str = None,
+        encoding: str = "utf-8",
+        errors: str = "strict",
+    ):
+        """Supports initializing the MappedLexer class with the provided file path."""
+
+        if text is not None:
+            raise LexerError(
+                "The MappedLexer can only be instantiated with a file path, not a text string!"
+            )
+
+        if file is None:
+            raise LexerError("The MappedLexer must be instantiated with a file path!")
+        elif not isinstance(file, str):
+            raise TypeError("The 'file' argument must have a string value!")
+        elif not os.path.exists(file):
+            raise LexerError("The 'file' argument must reference a valid file path!")
+        elif not os.path.isfile(file):
+            raise LexerError("The 'file' argument must reference a valid file!")
+
+        if os.path.getsize(file) == 0:
+            raise ValueError("The 'file' argument must reference a non-empty file!")
+
+        with open(file, "rb") as handle:
+            self._mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            super().__init__(text=self._mapping, encoding=encoding, errors=errors)
+        except Exception:
+            self._mapping.close()
+            raise
+
+        self._file = file
+
+    def __enter__(self) -> MappedLexer:
+        """Supports using the MappedLexer as a context manager."""
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Closes the memory map when the context manager exits."""
+
+        self.close()
+
+    def close(self) -> None:
+        """Closes the memory map; the MappedLexer cannot be used after it is closed."""
+
+        if self._mapping is not None and not self._mapping.closed:
+            self._mapping.close()
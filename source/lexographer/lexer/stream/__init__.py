@@ -0,0 +1,566 @@
+from __future__ import annotations
+
+from lexographer.logging import logger
+from lexographer.exceptions import LexerError
+from lexographer.enumerations import Context
+from lexographer.lexer import Lexer, Literals, Position
+
+from collections.abc import Callable, Iterable, Iterator
+
+import io
+import os
+import re
+
+logger = logger.getChild(__name__)
+
+
+class StreamLexer(Lexer):
+    """The StreamLexer class supports lexing over a stream of text, such as a file object,
+    a pipe, or an iterable or generator of text string or bytes chunks, where any bytes
+    are decoded incrementally, without needing the whole of the text up front. The text
+    is held in a sliding buffer which is filled from the stream on demand, and which
+    retains a window of text behind the cursor to support negative peek offsets, look-
+    behinds and pushing back, so that unbounded input can be lexed in constant memory.
+    The 'index', 'line' and 'column' properties report positions relative to the start
+    of the stream, rather than to the buffer."""
+
+    _stream: Iterator[str] | object = None
+    _handle: object = None
+    _chunk: int = None
+    _window: int = None
+    _base: int = None
+    _origin: int = None
+    _readable: bool = None
+    _exhausted: bool = None
+    _decoder: io.IncrementalNewlineDecoder = None
+    _prefix: bytes = b""
+
+    # Only the cursor position can be located, so Positions cannot be derived on demand
+    _locatable: bool = False
+
+    def __init__(
+        self,
+        text: str = None,
+        file: str = None,
+        stream: Iterable[str] | object = None,
+        chunk: int = 65536,
+        window: int = 4096,
+        encoding: str = None,
+        errors: str = "strict",
+    ):
+        """Supports initializing the StreamLexer class with the provided text string, file
+        path, or stream, which may be any object offering a 'read(size)' method, such as a
+        file object or pipe, or any iterable or generator of text string or bytes chunks;
+        files are read as bytes and are decoded incrementally, as are any bytes chunks
+        received from a stream, using the specified encoding and error handling scheme,
+        or if no encoding is specified, the encoding identified by any byte order mark at
+        the start of the stream, otherwise UTF-8."""
+
+        if [text, file, stream].count(None) != 2:
+            raise LexerError(
+                "The StreamLexer must be instantiated with one of a text string, a valid file path or a stream!"
+            )
+
+        if text is None:
+            pass
+        elif not isinstance(text, str):
+            raise TypeError(
+                "The 'text' argument, if specified, must have a string value!"
+            )
+        else:
+            stream = iter((text,))
+
+        if file is None:
+            pass
+        elif not isinstance(file, str):
+            raise TypeError(
+                "The 'file' argument, if specified, must have a string value!"
+            )
+        elif not os.path.exists(file):
+            raise LexerError("The 'file' argument must reference a valid file path!")
+        elif not os.path.isfile(file):
+            raise LexerError("The 'file' argument must reference a valid file!")
+        else:
+            stream = self._handle = open(file, "rb")
+
+        if hasattr(stream, "read") and callable(stream.read):
+            self._stream = stream
+            self._readable = True
+        elif isinstance(stream, Iterable) and not isinstance(stream, (str, bytes)):
+            self._stream = iter(stream)
+            self._readable = False
+        else:
+            raise TypeError(
+                "The 'stream' argument must reference a readable object or an iterable of text strings or bytes!"
+            )
+
+        if not (isinstance(chunk, int) and chunk >= 1):
+            raise TypeError("The 'chunk' argument must have a positive integer value!")
+
+        if not (isinstance(window, int) and window >= 0):
+            raise TypeError(
+                "The 'window' argument must have a non-negative integer value!"
+            )
+
+        self._validate_codec(encoding=encoding, errors=errors)
+
+        self._chunk = chunk
+        self._window = window
+        self._encoding = encoding
+        self._errors = errors
+        self._file = file
+        self._text = ""
+        self._length = 0
+        self._base = 0
+        self._origin = 1
+        self._index = 0
+        self._line = 1
+        self._column = 1
+        self._exhausted = False
+
+    def __len__(self) -> int:
+        """Return the number of characters received from the stream so far."""
+
+        return self.length
+
+    def __iter__(self) -> StreamLexer:
+        """Supports iterating over the stream; as streams cannot be rewound, iteration
+        continues from the current cursor position rather than from the beginning."""
+
+        return self
+
+    def __enter__(self) -> StreamLexer:
+        """Supports using the StreamLexer as a context manager."""
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Closes any file opened by the StreamLexer when the context manager exits."""
+
+        self.close()
+
+    @property
+    def text(self) -> str:
+        """Returns the text currently held in the buffer, rather than the whole text."""
+
+        return self._text
+
+    @property
+    def length(self) -> int:
+        """Returns the number of characters received from the stream so far; the overall
+        length of the stream is only known once the stream has been exhausted."""
+
+        return self._base + self._length
+
+    @property
+    def index(self) -> int:
+        """Returns the zero-indexed character position, relative to the stream start."""
+
+        return self._base + self._index
+
+    @property
+    def exhausted(self) -> bool:
+        """Returns whether the end of the stream has been reached."""
+
+        return self._exhausted
+
+    @property
+    def window(self) -> int:
+        """Returns the number of characters retained in the buffer behind the cursor."""
+
+        return self._window
+
+    def close(self) -> None:
+        """Closes the file, if any, that was opened by the StreamLexer."""
+
+        if self._handle is not None:
+            self._handle.close()
+
+    def _fill(self, length: int) -> bool:
+        """Fills the buffer from the stream until it holds the specified number of
+        characters from the cursor onwards, returning whether enough are available."""
+
+        while self._length - self._index < length and self._exhausted is False:
+            self._append(self._receive())
+
+        return self._length - self._index >= length
+
+    def _receive(self) -> str:
+        """Receives the next chunk of text from the stream, decoding any bytes received,
+        returning an empty string once the stream has been exhausted."""
+
+        while True:
+            if self._readable is True:
+                if not (chunk := self._stream.read(self._chunk)):
+                    break
+            elif (chunk := next(self._stream, None)) is None:
+                break
+
+            if isinstance(chunk, (bytes, bytearray, memoryview)):
+                chunk = self._decode(chunk)
+
+            # Skip over any empty chunks, as well as any chunks of bytes which only held
+            # part of a multi-byte character that the decoder is holding onto for now
+            if not chunk == "":
+                return chunk
+
+        return self._decode(b"", final=True)
+
+    def _decode(self, data: bytes | bytearray | memoryview, final: bool = False) -> str:
+        """Decodes the chunk of bytes received from the stream incrementally, detecting
+        any byte order mark at the start of the stream before decoding the first chunk.
+        """
+
+        if self._decoder is None:
+            data = self._prefix + bytes(data)
+
+            # The byte order mark may be split across the first few chunks of bytes, so
+            # up to four bytes are gathered before the encoding is detected from them
+            if len(data) < 4 and final is False:
+                self._prefix = data
+
+                return ""
+            elif len(data) == 0:
+                return ""
+
+            self._prefix = b""
+
+            encoding, skip = self._detect(data[:4], self._encoding)
+
+            self._decoder = self._incremental(encoding, self._errors)
+            self._encoding = encoding
+
+            data = data[skip:]
+
+        try:
+            return self._decoder.decode(data, final)
+        except UnicodeDecodeError as exception:
+            raise LexerError(
+                f"Unable to decode the stream using the {self._encoding} encoding; {exception}!"
+            ) from exception
+
+    def _append(self, chunk: str | None):
+        """Appends the chunk of text to the buffer, or if the chunk is empty, notes that
+        the stream has been exhausted."""
+
+        if not chunk:
+            self._exhausted = True
+            return
+        elif not isinstance(chunk, str):
+            raise TypeError("The stream must provide text string chunks!")
+
+        # Discard the text that has fallen out of the window behind the cursor before
+        # appending the new chunk; this is only done once at least a chunk's worth of
+        # text can be discarded so the cost of rebuilding the buffer is amortized; any
+        # text after the earliest active Mark is retained so it can be rolled back to
+        discard: int = self._index - self._window
+
+        if self._marks:
+            discard = min(
+                discard, min(mark.state[0] for mark in self._marks) - self._base
+            )
+
+        if discard >= self._chunk:
+            # Note the column number of the first character retained in the buffer
+            if (newline := self._text.rfind("\n", 0, discard)) >= 0:
+                self._origin = discard - newline
+            else:
+                self._origin += discard
+
+            self._text = self._text[discard:] + chunk
+            self._base += discard
+            self._index -= discard
+        else:
+            self._text += chunk
+
+        self._length = len(self._text)
+
+    def _advance(self, length: int) -> str:
+        """Advances the cursor by up to the specified number of characters, updating the
+        line and column numbers based on the characters passed over."""
+
+        self._characters = characters = self._text[self._index : self._index + length]
+
+        self._index += len(characters)
+
+        if newlines := characters.count("\n"):
+            self._line += newlines
+            self._column = len(characters) - characters.rfind("\n")
+        else:
+            self._column += len(characters)
+
+        return characters
+
+    def read(self, length: int = 1, raises: bool = False) -> str:
+        """Reads/advances the specified number of characters from the stream."""
+
+        if not (isinstance(length, int) and length >= 1):
+            raise TypeError("The 'length' argument must have a positive integer value!")
+
+        if not isinstance(raises, bool):
+            raise TypeError("The 'raises' argument must have a boolean value!")
+
+        if self._fill(length) is False and raises is True:
+            raise LexerError(
+                f"The 'length' argument value, {length}, in addition to the current index, {self.index}, exceeds the overall length, {self.length}!",
+                context=Context.Finish,
+            )
+
+        return self._advance(length)
+
+    def peek(self, offset: int = 0, length: int = 1) -> str:
+        """Returns the specified number of characters at the current offset position."""
+
+        if not isinstance(offset, int):
+            raise TypeError("The 'offset' argument must have an integer value!")
+
+        if not (isinstance(length, int) and length >= 1):
+            raise TypeError("The 'length' argument must have a positive integer value!")
+
+        # Characters that have fallen out of the window can no longer be peeked
+        if self._index + offset < 0:
+            return ""
+
+        if self._fill(offset + length):
+            return self._text[self._index + offset : self._index + offset + length]
+        else:
+            return ""
+
+    def consume(self, length: int | str = 1, offset: int = 0) -> str:
+        """Consumes the specified number of characters, moving the cursor."""
+
+        if isinstance(length, str):
+            length = len(length)
+        elif not (isinstance(length, int) and length >= 1):
+            raise TypeError("The 'length' argument must have a positive integer value!")
+
+        if not (isinstance(offset, int) and offset >= 0):
+            raise TypeError("The 'offset' argument must have a positive integer value!")
+        elif self._fill(offset) is False:
+            raise LexerError(
+                f"The 'offset' argument value, {offset}, in addition to the current index, {self.index}, exceeds the overall length, {self.length}!",
+                context=Context.Finish,
+            )
+
+        self._fill(length)
+
+        return self._advance(length)
+
+    def push(self, length: int | str = 1) -> str:
+        """Pushes the specified number of characters back, moving the position index;
+        the cursor can only be pushed back over the characters retained in the window.
+        """
+
+        if isinstance(length, str):
+            length = len(length)
+        elif not (isinstance(length, int) and length >= 1):
+            raise TypeError("The 'length' argument must have a positive integer value!")
+
+        if length > self._index:
+            raise LexerError(
+                f"The 'length' argument value, {length}, exceeds the number of characters, {self._index}, retained behind the cursor!"
+            )
+
+        characters: str = self._text[self._index - length : self._index]
+
+        self._index -= length
+
+        if newlines := characters.count("\n"):
+            self._line -= newlines
+
+            if (newline := self._text.rfind("\n", 0, self._index)) >= 0:
+                self._column = self._index - newline
+            else:
+                self._column = self._origin + self._index
+        else:
+            self._column -= length
+
+        return characters
+
+    def lookahead_any(
+        self,
+        literals: Literals | dict[str, object] | Iterable[str],
+        offset: int = 0,
+        consume: bool = False,
+    ) -> object | None:
+        """Check if any of the provided literals follow the current position, as per the
+        Lexer class' method, filling the buffer to hold the longest of the literals."""
+
+        if not isinstance(literals, Literals):
+            literals = Literals(literals)
+
+        if not isinstance(offset, int):
+            raise TypeError("The 'offset' argument must have an integer value!")
+
+        if not isinstance(consume, bool):
+            raise TypeError("The 'consume' argument must have a boolean value!")
+
+        self._fill(offset + literals.longest)
+
+        if (matched := literals.match(self._text, self._index + offset)) is None:
+            return None
+
+        # Consume only if the match was successful
+        if consume is True:
+            self.consume(length=matched[0], offset=offset)
+
+        return matched[1]
+
+    def match(self, pattern: str | re.Pattern, consume: bool = True) -> str:
+        """Matches the regular expression pattern at the current position, returning the
+        matched text, or an empty string if the pattern does not match. The pattern is
+        matched over the buffered text, which is extended from the stream as long as the
+        match reaches the end of the buffer, so matches may span across chunks."""
+
+        if not isinstance(pattern, (str, re.Pattern)):
+            raise TypeError(
+                "The 'pattern' argument must have a string or compiled pattern value!"
+            )
+
+        if not isinstance(consume, bool):
+            raise TypeError("The 'consume' argument must have a boolean value!")
+
+        compiled: re.Pattern = self._compile("match", pattern)
+
+        self._fill(self._chunk)
+
+        while (matched := compiled.match(self._text, self._index)) and self._extend(
+            matched.end()
+        ):
+            pass
+
+        if matched:
+            if consume is True:
+                return self._move(matched.end())
+            else:
+                return matched.group()
+
+        return ""
+
+    def scan_while(self, characters: str | re.Pattern | Callable[[str], bool]) -> str:
+        """Consumes the run of qualifying characters from the current position, as per
+        the Lexer class' method, extending the buffer from the stream as needed."""
+
+        if self._scannable(characters) is False:
+            self._fill(1)
+
+            end: int = self._index
+
+            while True:
+                text: str = self._text
+                length: int = self._length
+
+                while end < length and characters(text[end]):
+                    end += 1
+
+                if end < length:
+                    break
+
+                # The buffer may be trimmed as it is extended, so the end is noted as an
+                # absolute index while the buffer is extended, and then made relative
+                end += self._base
+
+                if not self._extend(end - self._base):
+                    end -= self._base
+                    break
+
+                end -= self._base
+
+            return self._move(end)
+
+        compiled: re.Pattern = self._compile("while", characters)
+
+        self._fill(self._chunk)
+
+        while (matched := compiled.match(self._text, self._index)) and self._extend(
+            matched.end()
+        ):
+            pass
+
+        if matched:
+            return self._move(matched.end())
+
+        return ""
+
+    def scan_until(self, delimiters: str | Iterable[str]) -> str:
+        """Consumes the characters from the current position up to, but not including, the
+        next occurrence of any of the delimiters, as per the Lexer class' method, reading
+        from the stream until a delimiter is found, or until the stream is exhausted."""
+
+        delimiters = self._delimiters(delimiters)
+
+        if isinstance(delimiters, str):
+            compiled: re.Pattern = None
+            longest: int = len(delimiters)
+        else:
+            compiled: re.Pattern = self._compile("until", delimiters)
+            longest: int = max(map(len, delimiters))
+
+        self._fill(self._chunk)
+
+        start: int = self._index
+
+        while True:
+            if compiled is None:
+                end: int = self._text.find(delimiters, start)
+            elif matched := compiled.search(self._text, start):
+                end: int = matched.start()
+            else:
+                end: int = -1
+
+            # If no delimiter was found, or a longer delimiter could still match at the
+            # end of the buffer, extend the buffer and search again from the earliest
+            # position where a delimiter could have been cut off by the end of the buffer
+            if end >= 0 and end + longest <= self._length:
+                break
+
+            resume: int = self._base + max(self._index, self._length - longest + 1)
+
+            if not self._extend(self._length):
+                break
+
+            start = resume - self._base
+
+        if end < 0:
+            end = self._length
+
+        return self._move(end)
+
+    def _extend(self, end: int) -> bool:
+        """Extends the buffer from the stream if the specified relative index has reached
+        the end of the buffer, returning whether the buffer was extended."""
+
+        if end < self._length or self._exhausted is True:
+            return False
+
+        length: int = self._length - self._index
+
+        return self._fill(length + self._chunk) or self._length - self._index > length
+
+    def _snapshot(self) -> tuple:
+        """Returns the state of the cursor position to be recorded by a Mark, where the
+        index is recorded relative to the start of the stream rather than the buffer."""
+
+        return (self._base + self._index, self._line, self._column, self._characters)
+
+    def _restore(self, state: tuple):
+        """Restores the state of the cursor position recorded by a Mark."""
+
+        index, self._line, self._column, self._characters = state
+
+        self._index = index - self._base
+
+    def locate(self, index: int) -> Position:
+        """Returns the Position for the specified zero-indexed character position; as the
+        StreamLexer does not retain the whole of the text, only the cursor position can
+        be located."""
+
+        if not isinstance(index, int):
+            raise TypeError("The 'index' argument must have an integer value!")
+
+        if not index == self.index:
+            raise LexerError(
+                "The StreamLexer only supports locating the current cursor position!"
+            )
+
+        return self.position
@@ -3,9 +3,12 @@ from __future__ import annotations
 from lexographer.logging import logger
 from lexographer.enumerations import Context, Type
 from lexographer.tokenizer import Tokenizer, Tokens, Token
+from lexographer.tokenizer.cache import TokenCache
 from lexographer.exceptions import ParserError
 
 from abc import abstractmethod
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor
 
 import os
 
@@ -17,6 +20,7 @@ class Parser(object):
     _encoding: str = None
     _tokenizer: Tokenizer = None
     _context: Context = None
+    _token_cache: TokenCache = None
 
     @classmethod
     def register_tokenizer(cls, tokenizer: Tokenizer):
@@ -32,22 +36,92 @@ class Parser(object):
             )
         cls._tokenizer_subclass = tokenizer
 
+    @classmethod
+    def register_cache(cls, cache: TokenCache | None):
+        """Supports registering a TokenCache for this Parser subclass to hold the tokens of
+        the texts that it parses in, which is used by the Tokenizer of each Parser rather
+        than any TokenCache registered for the Tokenizer subclass, or None to disable it.
+        """
+
+        if cache is None:
+            pass
+        elif not isinstance(cache, TokenCache):
+            raise TypeError(
+                "The 'cache' argument must reference a TokenCache class instance or None!"
+            )
+
+        cls._token_cache = cache
+
+    @classmethod
+    def parse_many(
+        cls,
+        texts: Iterable[str],
+        executor: Executor | str = None,
+        workers: int = None,
+        batch: int = 64,
+        ordered: bool = True,
+    ) -> Iterator[object | tuple[int, object]]:
+        """Supports parsing many text strings via the registered Tokenizer subclass, such
+        as short queries, yielding the result of the 'parse()' method for each text. The
+        Parser, Tokenizer and Lexer for each text are created without the validation of
+        their initializers, and the texts may be parsed in batches by a pool of worker
+        threads or processes, as per the 'tokenize_many()' class method of the Tokenizer
+        class; when parsed by worker processes, the results must support being pickled.
+        """
+
+        from lexographer.tokenizer.parallel import _dispatch, _parse_batch
+
+        if not (
+            isinstance(cls._tokenizer_subclass, type)
+            and issubclass(cls._tokenizer_subclass, Tokenizer)
+        ):
+            raise TypeError(
+                "A Tokenizer subclass must be registered with the Parser beforehand via the Parser.register_tokenizer() class method!"
+            )
+
+        return _dispatch(
+            cls,
+            texts,
+            executor=executor,
+            workers=workers,
+            batch=batch,
+            ordered=ordered,
+            local=_parse_batch,
+        )
+
+    @classmethod
+    def _create(cls, text: str) -> Parser:
+        """Creates an instance of this Parser subclass for the specified text string via
+        the registered Tokenizer subclass, without the validation of the initializer."""
+
+        parser: Parser = cls.__new__(cls)
+        parser._tokenizer = cls._tokenizer_subclass._create(
+            text, cache=cls._token_cache
+        )
+
+        return parser
+
     def __init__(
         self,
-        text: str = None,
+        text: str | bytes | bytearray | memoryview = None,
         file: str = None,
         encoding: str = None,
         tokenizer: Tokenizer = None,
+        errors: str = None,
     ):
-        """Supports initializing the Parser class with the provided values."""
+        """Supports initializing the Parser class with the provided values; the optional
+        'encoding' and 'errors' arguments are used when decoding the file contents or
+        bytes, and if no encoding is specified, the encoding is detected from any byte
+        order mark present, or otherwise UTF-8 is assumed."""
 
         logger.debug(
-            "%s.__init__(text: %d, file: %s, encoding: %s, tokenizer: %s)",
+            "%s.__init__(text: %d, file: %s, encoding: %s, tokenizer: %s, errors: %s)",
             self.__class__.__name__,
-            len(text) if isinstance(text, str) else 0,
+            len(text) if isinstance(text, (str, bytes, bytearray, memoryview)) else 0,
             file,
             encoding,
             tokenizer,
+            errors,
         )
 
         if text is None and file is None:
@@ -57,9 +131,9 @@ class Parser(object):
 
         if text is None:
             pass
-        elif not isinstance(text, str):
+        elif not isinstance(text, (str, bytes, bytearray, memoryview)):
             raise TypeError(
-                "The 'text' argument, if specified, must have a string value!"
+                "The 'text' argument, if specified, must have a string, bytes, bytearray or memoryview value!"
             )
 
         if file is None:
@@ -91,8 +165,6 @@ class Parser(object):
                 "The 'tokenizer' argument must reference a Tokenizer subclass!"
             )
 
-        self._tokenizer: Tokenizer = tokenizer(text=text, file=file)
-
         if encoding is None:
             pass
         elif isinstance(encoding, str):
@@ -102,6 +174,22 @@ class Parser(object):
                 "The 'encoding' argument, if specified, must have a string value!"
             )
 
+        if errors is None:
+            pass
+        elif not isinstance(errors, str):
+            raise TypeError(
+                "The 'errors' argument, if specified, must have a string value!"
+            )
+
+        # The Parser's TokenCache, if any, is assigned before the Tokenizer is initialized
+        # as the Tokenizer starts tokenizing the text during its initialization
+        self._tokenizer: Tokenizer = tokenizer.__new__(tokenizer)
+
+        if self._token_cache is not None:
+            self._tokenizer._token_cache = self._token_cache
+
+        self._tokenizer.__init__(text=text, file=file, encoding=encoding, errors=errors)
+
     @property
     def text(self) -> str:
         """Return the associated Tokenizer class instance's text property value."""
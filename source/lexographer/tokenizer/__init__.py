@@ -1,15 +1,38 @@
 from __future__ import annotations
 
 from lexographer.logging import logger
-from lexographer.enumerations import Context, Type
+from lexographer.enumerations import Context, Type, TypeTable
 from lexographer.exceptions import TokenizerError
-from lexographer.lexer import Lexer
+from lexographer.lexer import Lexer, Mark, Position
+from lexographer.lexer.asynchronous import AsyncLexer
+from lexographer.lexer.binary import BytesLexer
 from lexographer.tokenizer.token import Token
 from lexographer.tokenizer.tokens import Tokens
+from lexographer.tokenizer.store import TokenStore
+from lexographer.tokenizer.cache import TokenCache, DiskTokenCache
+from lexographer.tokenizer.serialization import TokenFile
 
 from abc import abstractmethod
+from typing import BinaryIO
+from concurrent.futures import Executor
+from bisect import bisect_left, bisect_right
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Sequence,
+)
 
+import asyncio
+import hashlib
+import inspect
+import json
+import operator
 import os
+import re
 
 logger = logger.getChild(__name__)
 
@@ -21,27 +44,471 @@ class Tokenizer(object):
     structured text being tokenized, such as a document in a format such as XML, a query
     string in a language like SQL, or code written in a language such as Python."""
 
+    _lexer_subclass: type[Lexer] = Lexer
+    _store_subclass: type[TokenStore] = None
     _lexer: Lexer = None
-    _tokens: list[Token] = None
+    _tokens: list[Token] | TokenStore = None
     _context: Context = None
     _index: int = None
     _line: int = None
     _column: int = None
     _length: int = None
     _level: int = None
+    _marks: list[Mark] = None
+    _listener: Callable[[Token], None] = None
+    _interned: int = 0
+    _strings: dict[str, str] = None
+    _generator: Generator[Token | None, None, None] = None
+    _edits: list[tuple[int, int]] = None
+    _epoch: int = 0
+    _compacted: int = 0
+    _boundary: re.Pattern = None
+    _token_cache: TokenCache = None
+    _disk_cache: DiskTokenCache = None
+    _key: tuple[type, bytes] = None
 
-    def __init__(self, text: str = None, file: str = None):
-        """Supports initializing the Tokenizer class with the provided text string or file contents."""
+    # The fingerprints of the Tokenizer subclasses, as computed on first use
+    _fingerprints: dict[type, str] = {}
 
-        if text is None and file is None:
+    # The number of tokens before the token containing the start of an edit from which the
+    # 'apply_edit()' method restarts tokenization, as an edit can change how the preceding
+    # tokens are tokenized, such as when characters are typed at the end of a word
+    _lookback: int = 1
+
+    # The number of edits recorded in the log of edits before the log is compacted
+    _history: int = 256
+
+    # The initial number of tokens that a 'parse()' method that is not generator-based is
+    # run for when re-tokenizing from an edit, before it is stopped and run again
+    _budget: int = 64
+
+    @classmethod
+    def register_lexer(cls, lexer: type[Lexer]):
+        """Supports registering the Lexer subclass for this Tokenizer subclass to use."""
+
+        if not isinstance(lexer, type):
+            raise TypeError("The 'lexer' argument must reference a Lexer subclass!")
+        elif not issubclass(lexer, Lexer):
+            raise TypeError("The 'lexer' argument must reference a Lexer subclass!")
+
+        cls._lexer_subclass = lexer
+
+        # The fingerprints include the registered Lexer subclass, so are computed again
+        cls._fingerprints.clear()
+
+    @classmethod
+    def register_store(cls, store: type[TokenStore] | None):
+        """Supports registering a TokenStore subclass for this Tokenizer subclass to hold
+        its tokens in, rather than a list of Token instances, or None to use a list."""
+
+        if store is None:
+            pass
+        elif not isinstance(store, type):
+            raise TypeError(
+                "The 'store' argument must reference a TokenStore subclass or None!"
+            )
+        elif not issubclass(store, TokenStore):
+            raise TypeError(
+                "The 'store' argument must reference a TokenStore subclass or None!"
+            )
+
+        cls._store_subclass = store
+
+    @classmethod
+    def register_interned(cls, *types: Type):
+        """Supports registering the token types, such as identifiers and keywords, whose
+        text should be interned by this Tokenizer subclass, so that the text of tokens of
+        those types that repeat throughout a source text is held as a single string."""
+
+        for type in types:
+            if not isinstance(type, Type):
+                raise TypeError(
+                    "The 'types' arguments must reference Type enumeration class options!"
+                )
+
+        # The types are held as a bitmask over their identifiers rather than as a set, as
+        # the Type options hash by value, which distinct registered options may share
+        cls._interned = TypeTable.mask(*types)
+
+    @classmethod
+    def register_cache(cls, cache: TokenCache | None):
+        """Supports registering a TokenCache for this Tokenizer subclass to hold the tokens
+        of the texts it tokenizes in, keyed by a hash of each text, so that a repeated text
+        is not tokenized again, or None to disable caching. Only the tokens of texts lexed
+        by a Lexer that can locate any position are cached."""
+
+        if cache is None:
+            pass
+        elif not isinstance(cache, TokenCache):
+            raise TypeError(
+                "The 'cache' argument must reference a TokenCache class instance or None!"
+            )
+
+        cls._token_cache = cache
+
+    @classmethod
+    def register_disk_cache(cls, cache: DiskTokenCache | str | None):
+        """Supports registering a DiskTokenCache, or the path of a directory to create one
+        for, for this Tokenizer subclass to hold the tokens of the files it tokenizes in, so
+        that unchanged files are not lexed again, or None to disable the caching."""
+
+        if cache is None or isinstance(cache, DiskTokenCache):
+            pass
+        elif isinstance(cache, str):
+            cache = DiskTokenCache(directory=cache)
+        else:
+            raise TypeError(
+                "The 'cache' argument must reference a DiskTokenCache class instance, a directory path string, or None!"
+            )
+
+        cls._disk_cache = cache
+
+    @classmethod
+    def fingerprint(cls) -> str:
+        """Returns the fingerprint of this Tokenizer subclass, identifying the version of
+        the tokenization it performs, as used to invalidate cached tokens; the fingerprint
+        is a hash of the version of the library, of the names and the source code of the
+        Tokenizer subclasses in the class hierarchy, and of the registered Lexer subclass.
+        Subclasses whose tokenization depends on other state may extend the fingerprint by
+        overriding the '_fingerprint()' class method."""
+
+        if (fingerprint := cls._fingerprints.get(cls)) is None:
+            fingerprint = cls._fingerprints[cls] = hashlib.sha256(
+                json.dumps(cls._fingerprint()).encode("utf-8", "surrogatepass")
+            ).hexdigest()
+
+        return fingerprint
+
+    @classmethod
+    def _fingerprint(cls) -> list[str]:
+        """Returns the values from which the fingerprint of the subclass is computed."""
+
+        try:
+            with open(
+                os.path.join(os.path.dirname(os.path.dirname(__file__)), "version.txt")
+            ) as file:
+                values: list[str] = [file.read().strip()]
+        except OSError:
+            values: list[str] = [""]
+
+        for subclass in cls.__mro__:
+            if not (isinstance(subclass, type) and issubclass(subclass, Tokenizer)):
+                continue
+
+            values.append(f"{subclass.__module__}.{subclass.__qualname__}")
+
+            try:
+                values.append(inspect.getsource(subclass))
+            except (OSError, TypeError):
+                pass
+
+        lexer: type[Lexer] = cls._lexer_subclass
+
+        values.append(f"{lexer.__module__}.{lexer.__qualname__}")
+
+        return values
+
+    @classmethod
+    def register_boundary(cls, pattern: str | re.Pattern):
+        """Supports registering the regular expression pattern matching the boundaries at
+        which the text tokenized by this Tokenizer subclass may be safely split, such as
+        a new line outside of a string, or a statement terminator, so that the text either
+        side of a boundary can be tokenized independently, as by the ParallelTokenizer.
+        """
+
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
+        elif not isinstance(pattern, re.Pattern):
+            raise TypeError(
+                "The 'pattern' argument must have a string or compiled pattern value!"
+            )
+
+        if pattern.match("") is not None:
+            raise TokenizerError(
+                f"The 'pattern' argument, {pattern.pattern!r}, must not match the empty string!"
+            )
+
+        cls._boundary = pattern
+
+    @classmethod
+    def boundary(cls, text: str, index: int) -> int | None:
+        """Returns the offset of the first safe boundary in the text at or after the index,
+        being the offset just after the text matched by the registered boundary pattern,
+        or None if there is no boundary after the index. At a safe boundary tokenization
+        must be able to start afresh, at level 0, and produce the same tokens as when the
+        whole of the text is tokenized; subclasses may override this method where finding
+        a boundary needs more than a pattern, such as to skip new lines within strings.
+        """
+
+        if cls._boundary is None:
+            return None
+
+        if match := cls._boundary.search(text, index):
+            return match.end()
+
+    @classmethod
+    async def stream(
+        cls,
+        stream: asyncio.StreamReader | AsyncIterable[str | bytes],
+        encoding: str = None,
+        errors: str = "strict",
+        chunk: int = 65536,
+        window: int = 4096,
+    ) -> AsyncIterator[Token]:
+        """Supports asynchronously tokenizing the text received from the provided stream,
+        such as an asyncio.StreamReader or any asynchronous iterable of text strings or
+        bytes, yielding each Token as soon as it has been emitted, so that tokenization
+        overlaps the receipt of the text. The Tokenizer subclass' synchronous 'parse()'
+        method is run in a worker thread over an AsyncLexer, which receives more text via
+        the event loop only when the 'parse()' method needs it."""
+
+        lexer = AsyncLexer(
+            stream=stream, encoding=encoding, errors=errors, chunk=chunk, window=window
+        )
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        finished: object = object()
+
+        def tokenize():
+            # The listener is assigned before the initializer runs the 'parse()' method
+            # so that each Token is passed to the event loop as soon as it is emitted
+            tokenizer: Tokenizer = cls.__new__(cls)
+            tokenizer._listener = lambda token: loop.call_soon_threadsafe(
+                queue.put_nowait, token
+            )
+
+            try:
+                tokenizer.__init__(lexer=lexer)
+
+                # A generator-based 'parse()' method is run through to its completion
+                tokenizer._pull()
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, finished)
+
+        future: asyncio.Future = loop.run_in_executor(None, tokenize)
+
+        try:
+            while (token := await queue.get()) is not finished:
+                yield token
+
+            # Propagate any exception raised by the 'parse()' method in the worker thread
+            await future
+        finally:
+            lexer.close()
+
+    @classmethod
+    def tokenize_many(
+        cls,
+        texts: Iterable[str],
+        executor: Executor | str = None,
+        workers: int = None,
+        batch: int = 64,
+        ordered: bool = True,
+    ) -> Iterator[Tokenizer | tuple[int, Tokenizer]]:
+        """Supports tokenizing many text strings, such as short queries, yielding a fully
+        tokenized instance of this Tokenizer subclass for each text. The arguments are
+        validated once for all of the texts, rather than once per text, and the Lexer
+        and Tokenizer for each text are created without the validation performed by their
+        initializers. The texts are tokenized in the calling process by default, or if the
+        'executor' argument is set to 'thread' or 'process', or to an Executor instance,
+        the texts are tokenized in batches of the specified size by the worker threads or
+        processes of the pool, where a pool created for the call has the specified number
+        of workers; the tokens tokenized by worker processes are returned in a compact form
+        and the Tokenizers are then assembled in the calling process. The Tokenizers are
+        yielded in the order of the texts, or if the 'ordered' argument is set to False,
+        as (index, Tokenizer) tuples as each batch of texts completes.
+
+        The compiled state of the subclass is shared by all of the texts, but the Lexer and
+        Tokenizer instances are not pooled for reuse, as each Tokenizer, along with its
+        Lexer, is handed to the caller, and creating them without validation costs little
+        compared to tokenizing their texts."""
+
+        from lexographer.tokenizer.parallel import (
+            _dispatch,
+            _tokenize_batch,
+            _tokenize_remote,
+            _tokenize_finish,
+        )
+
+        return _dispatch(
+            cls,
+            texts,
+            executor=executor,
+            workers=workers,
+            batch=batch,
+            ordered=ordered,
+            local=_tokenize_batch,
+            remote=_tokenize_remote,
+            finish=_tokenize_finish,
+        )
+
+    @classmethod
+    def load(
+        cls, source: str | bytes | BinaryIO | TokenFile, text: str = None
+    ) -> Tokenizer:
+        """Supports creating an instance of this Tokenizer subclass holding the tokens that
+        were serialized by the 'dump()' method, from the path of a token file, which is
+        memory-mapped, from the bytes of a token file, from a binary file object, or from
+        a TokenFile instance, without tokenizing the text again. The source text is taken
+        from the token file, or if the token file does not hold the source text, must be
+        provided via the 'text' argument. The token file must have been created by this
+        Tokenizer subclass, or by one that it derives from or that derives from it, and
+        its tokens must lie within the text, otherwise a TokenizerError is raised."""
+
+        from lexographer.tokenizer.parallel import _merge
+
+        if isinstance(source, TokenFile):
+            reader: TokenFile = source
+        elif isinstance(source, str):
+            reader: TokenFile = TokenFile.open(source)
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            reader: TokenFile = TokenFile(source)
+        elif callable(getattr(source, "read", None)):
+            reader: TokenFile = TokenFile(source.read())
+        else:
+            raise TypeError(
+                "The 'source' argument must have a file path string, bytes-like, binary file object or TokenFile value!"
+            )
+
+        try:
+            if text is None and (text := reader.source) is None:
+                raise TokenizerError(
+                    "The token file does not hold the source text, so the 'text' argument must be specified!"
+                )
+            elif not isinstance(text, str):
+                raise TypeError("The 'text' argument must have a string value!")
+
+            name: str = reader.attributes.get("tokenizer")
+
+            if name is not None and not cls._related(name):
+                raise TokenizerError(
+                    f"The token file was created by the {name} class, which is unrelated to the {cls.__module__}.{cls.__qualname__} class!"
+                )
+
+            typeids, starts, lengths, levels = reader.columns()
+
+            if len(starts) > 0 and (
+                min(starts) < 0 or max(map(operator.add, starts, lengths)) > len(text)
+            ):
+                raise TokenizerError(
+                    "The token file holds tokens that lie beyond the end of the text!"
+                )
+
+            tokenizer: Tokenizer = cls.__new__(cls)
+            tokenizer._setup(cls._create_lexer(text))
+
+            try:
+                _merge(tokenizer, 0, *reader.result())
+            except AttributeError as exception:
+                raise TokenizerError(
+                    f"The token file references a type or context that is not registered: {exception}!"
+                ) from exception
+        finally:
+            if not reader is source:
+                reader.close()
+
+        return tokenizer
+
+    @classmethod
+    def _related(cls, name: str) -> bool:
+        """Returns whether the named Tokenizer subclass, as recorded by the 'dump()' method,
+        is this subclass, one of the subclasses that it derives from, or one of those that
+        derive from it, whose tokens may therefore be loaded into this subclass."""
+
+        # The base Tokenizer class is excluded, as every subclass derives from it
+        related: list[type] = [
+            subclass
+            for subclass in cls.__mro__
+            if isinstance(subclass, type)
+            and issubclass(subclass, Tokenizer)
+            and not subclass is Tokenizer
+        ]
+
+        pending: list[type] = [cls]
+
+        while pending:
+            related.extend(subclasses := pending.pop().__subclasses__())
+            pending.extend(subclasses)
+
+        return any(
+            f"{subclass.__module__}.{subclass.__qualname__}" == name
+            for subclass in related
+        )
+
+    @classmethod
+    def _create(cls, text: str, cache: TokenCache = None) -> Tokenizer:
+        """Creates an instance of this Tokenizer subclass for the specified text string,
+        without the validation performed by the initializer, for use where many Tokenizers
+        are created, such as by the 'tokenize_many()' class method; the TokenCache, if any,
+        is used rather than any TokenCache registered for the subclass."""
+
+        tokenizer: Tokenizer = cls.__new__(cls)
+
+        if cache is not None:
+            tokenizer._token_cache = cache
+
+        tokenizer._setup(cls._create_lexer(text))
+        tokenizer._begin()
+
+        return tokenizer
+
+    @classmethod
+    def _create_lexer(cls, text: str, subclass: type[Lexer] = None) -> Lexer:
+        """Creates an instance of the registered, or the specified, Lexer subclass for the
+        specified text; subclasses that do not override the initializer, such as the
+        FastLexer class, are created without the validation performed by the initializer,
+        while any other Lexer subclass is created via its initializer."""
+
+        if subclass is None:
+            subclass: type[Lexer] = cls._lexer_subclass
+
+        if subclass.__init__ is Lexer.__init__:
+            return subclass._create(text)
+
+        return subclass(text=text)
+
+    def __init__(
+        self,
+        text: str | bytes | bytearray | memoryview = None,
+        file: str = None,
+        lexer: Lexer = None,
+        encoding: str = None,
+        errors: str = None,
+    ):
+        """Supports initializing the Tokenizer class with the provided text string, bytes
+        or file contents, or with a Lexer instance, such as a StreamLexer, to tokenize;
+        the optional 'encoding' and 'errors' arguments are passed to the Lexer created by
+        the Tokenizer for decoding the file contents or bytes.
+
+        The 'parse()' method is called during initialization, and if it is implemented as
+        a generator, tokenization happens lazily: the generator is only advanced as far
+        as is needed to provide the tokens requested from the Tokenizer, so tokenization
+        stops early if the caller stops requesting tokens, such as after a parse error.
+        """
+
+        if text is None and file is None and lexer is None:
+            raise TokenizerError(
+                "The Tokenizer must be instantiated with either a text string, a valid file path or a Lexer instance!"
+            )
+
+        if lexer is None:
+            pass
+        elif not isinstance(lexer, Lexer):
+            raise TypeError(
+                "The 'lexer' argument, if specified, must reference a Lexer class instance!"
+            )
+        elif not (text is None and file is None):
             raise TokenizerError(
-                "The Tokenizer must be instantiated with either a text string or a valid file path!"
+                "The 'lexer' argument cannot be specified along with a text string or file path!"
             )
 
         if text is None:
             pass
-        elif not isinstance(text, str):
-            raise TypeError("The 'text' argument must have a string value!")
+        elif not isinstance(text, (str, bytes, bytearray, memoryview)):
+            raise TypeError(
+                "The 'text' argument must have a string, bytes, bytearray or memoryview value!"
+            )
 
         if file is None:
             pass
@@ -56,8 +523,56 @@ class Tokenizer(object):
                 f"The 'file' argument, {file}, must reference a valid file!"
             )
 
-        self._lexer = Lexer(text=text, file=file)
-        self._tokens: list[Token] = []
+        if encoding is None:
+            pass
+        elif not isinstance(encoding, str):
+            raise TypeError(
+                "The 'encoding' argument, if specified, must have a string value!"
+            )
+
+        if errors is None:
+            pass
+        elif not isinstance(errors, str):
+            raise TypeError(
+                "The 'errors' argument, if specified, must have a string value!"
+            )
+
+        if lexer is None:
+            subclass: type[Lexer] = self.__class__._lexer_subclass
+
+            # Bytes-like values are lexed directly by a BytesLexer without being decoded
+            if isinstance(text, (bytes, bytearray, memoryview)) and not issubclass(
+                subclass, BytesLexer
+            ):
+                subclass = BytesLexer
+
+            arguments: dict[str, str] = {}
+
+            if encoding is not None:
+                arguments["encoding"] = encoding
+
+            if errors is not None:
+                arguments["errors"] = errors
+
+            lexer = subclass(text=text, file=file, **arguments)
+
+        self._setup(lexer)
+        self._begin()
+
+    def _setup(self, lexer: Lexer):
+        """Prepares the Tokenizer's state for tokenizing the text of the specified Lexer,
+        without tokenizing the text, as needed by the initializer and the drivers, such as
+        the ParallelTokenizer, that assemble the tokens of a Tokenizer by other means.
+        """
+
+        self._lexer = lexer
+        self._strings: dict[str, str] = {}
+
+        if (store := self.__class__._store_subclass) is None:
+            self._tokens: list[Token] = []
+        else:
+            self._tokens: TokenStore = store(self)
+
         self._context: Context = Context.Unknown
         self._index: int = 0
         self._line: int = 1
@@ -65,11 +580,95 @@ class Tokenizer(object):
         self._length: int = 0
         self._level: int = 0
 
-        self.parse()
+    def _begin(self):
+        """Starts tokenizing the Lexer's text via the 'parse()' method, unless a TokenCache
+        holds the tokens of the same text, or a DiskTokenCache holds the tokens of the same
+        unchanged file, in which case the tokens are assembled from the cached result; the
+        tokens are added to the registered caches once the 'parse()' method, or the
+        generator it returns, has run to completion."""
+
+        lexer: Lexer = self._lexer
+
+        memory: TokenCache = self._token_cache
+
+        disk: DiskTokenCache = self._disk_cache if lexer.file is not None else None
+
+        if (memory is not None or disk is not None) and lexer.locatable is True:
+            from lexographer.tokenizer.parallel import _merge
+
+            # The text is hashed once, for the key of the TokenCache and the attributes
+            # of the DiskTokenCache, both when looking up and when saving the tokens
+            self._key = (self.__class__, TokenCache.digest(lexer.text))
+
+            if memory is not None:
+                result: tuple = memory.get(self._key)
+            else:
+                result: tuple = None
+
+            if result is None and disk is not None:
+                if (result := disk.load(self.__class__, lexer.file, self._key[1])) and (
+                    memory is not None
+                ):
+                    memory.put(self._key, result)
+
+            if result is not None:
+                self._key = None
+
+                _merge(self, 0, *result)
+
+                return
+
+        if inspect.isgenerator(generator := self.parse()):
+            self._generator = generator
+        elif self._key is not None:
+            self._remember()
+
+    def _remember(self):
+        """Adds the tokens of the text, in their compact form, to the registered caches."""
+
+        from lexographer.tokenizer.parallel import _compact
+
+        result: tuple = _compact(self, resolved=True)
+
+        if self._token_cache is not None:
+            self._token_cache.put(self._key, result)
+
+        if self._disk_cache is not None and (file := self._lexer.file) is not None:
+            self._disk_cache.save(self.__class__, file, self._key[1], result)
+
+        self._key = None
+
+    def _pull(self, length: int = None):
+        """Advances a generator-based 'parse()' method until the specified number of tokens
+        are available, or if no length is specified, until the generator is exhausted.
+        Any Token yielded by the generator is added as per the 'token' property setter.
+        The generator is detached while it is being advanced so that calls made from the
+        'parse()' method to methods that would otherwise advance it return immediately.
+        """
+
+        while (generator := self._generator) is not None and (
+            length is None or self._length < length
+        ):
+            self._generator = None
+
+            try:
+                token: Token | None = next(generator)
+            except StopIteration:
+                if self._key is not None:
+                    self._remember()
+
+                break
+
+            self._generator = generator
+
+            if token is not None:
+                self.token = token
 
     def __len__(self) -> int:
         logger.debug("%s.__len__()", self.__class__.__name__)
 
+        self._pull()
+
         return self._length
 
     def __iter__(self) -> Tokenizer:
@@ -87,6 +686,9 @@ class Tokenizer(object):
 
         token: Token = None
 
+        if self._index + offset >= self._length:
+            self._pull(self._index + offset + 1)
+
         if 0 <= (self._index + offset) < self._length:
             token = self._tokens[(self._index + offset)]
 
@@ -97,6 +699,8 @@ class Tokenizer(object):
         return token
 
     def __getitem__(self, index: int) -> Token:
+        self._pull(None if index < 0 else index + 1)
+
         if index < self._length:
             return self._tokens[index]
         else:
@@ -117,7 +721,9 @@ class Tokenizer(object):
         return self.lexer.file
 
     @property
-    def tokens(self) -> list[Token]:
+    def tokens(self) -> list[Token] | TokenStore:
+        self._pull()
+
         return self._tokens
 
     @property
@@ -139,6 +745,8 @@ class Tokenizer(object):
 
     @property
     def length(self) -> int:
+        self._pull()
+
         return self._length
 
     @property
@@ -163,10 +771,108 @@ class Tokenizer(object):
                 "The 'token' argument must reference a Token class instance!"
             )
 
+        if self._interned and (self._interned >> token.type.id) & 1:
+            token._text = self.intern(token.text)
+
+        self._tokens.append(token)
+
+        self._length += 1
+
+        if self._listener is not None:
+            self._listener(token)
+
+    def intern(self, text: str) -> str:
+        """Returns the single instance of the specified text string held by the Tokenizer
+        for the text of the tokens, adding the text string if it has not yet been held.
+        """
+
+        if (interned := self._strings.get(text)) is None:
+            interned = self._strings[text] = text
+
+        return interned
+
+    def emit(self, type: Type, start: int, end: int) -> Token:
+        """Creates a Token of the specified type for the text between the specified start
+        and end offsets of the Lexer's text, and appends it to the list of tokens, as per
+        the 'token' property setter, returning the new Token. Unlike instantiating Token
+        directly, the arguments are not validated, so the 'emit()' method is intended for
+        use in the hot loops of trusted 'parse()' method implementations. The Token takes
+        the Tokenizer's current level, and its Position and text are derived on first
+        access, so a Lexer that supports locating any position, such as a Lexer or a
+        FastLexer, is needed; the text of interned token types is interned right away.
+        """
+
+        lexer: Lexer = self._lexer
+
+        if lexer.locatable is False:
+            raise TokenizerError(
+                f"The 'emit()' method requires a Lexer that can locate any position, which the {lexer.__class__.__name__} cannot!"
+            )
+
+        # The text of the token is only sliced from the source text on first access, other
+        # than for the token types whose text is interned by the Tokenizer
+        if self._interned and (self._interned >> type.id) & 1:
+            text: str = self.intern(lexer.text[start:end])
+        else:
+            text: str = None
+
+        token: Token = Token._create(self, type, start, end, text, self._level)
+
         self._tokens.append(token)
 
         self._length += 1
 
+        if self._listener is not None:
+            self._listener(token)
+
+        return token
+
+    def emit_many(self, spans: Iterable[tuple[Type, int, int]]) -> int:
+        """Creates a Token for each of the provided (type, start, end) spans, as per the
+        'emit()' method, and appends them to the list of tokens in a single operation,
+        returning the number of tokens appended."""
+
+        lexer: Lexer = self._lexer
+
+        if lexer.locatable is False:
+            raise TokenizerError(
+                f"The 'emit_many()' method requires a Lexer that can locate any position, which the {lexer.__class__.__name__} cannot!"
+            )
+
+        create: Callable = Token._create
+        text: str = lexer.text
+        level: int = self._level
+
+        if interned := self._interned:
+            intern: Callable = self.intern
+
+            tokens: list[Token] = [
+                create(
+                    self,
+                    type,
+                    start,
+                    end,
+                    intern(text[start:end]) if (interned >> type.id) & 1 else None,
+                    level,
+                )
+                for type, start, end in spans
+            ]
+        else:
+            tokens: list[Token] = [
+                create(self, type, start, end, None, level)
+                for type, start, end in spans
+            ]
+
+        self._tokens.extend(tokens)
+
+        self._length += (count := len(tokens))
+
+        if self._listener is not None:
+            for token in tokens:
+                self._listener(token)
+
+        return count
+
     def next(self, offset: int = 0) -> Token | None:
         if not isinstance(offset, int):
             raise TypeError("The 'offset' argument must have an integer value!")
@@ -196,6 +902,8 @@ class Tokenizer(object):
 
         token: Token = None
 
+        self._pull(self._index + offset + 1)
+
         if (self._index + offset) <= self._length:
             token = self._tokens[self._index + offset]
 
@@ -217,13 +925,412 @@ class Tokenizer(object):
 
         return token
 
+    def mark(self) -> Mark:
+        """Returns a Mark recording a snapshot of the Tokenizer's state, including the
+        Lexer's cursor position, the number of tokens, the level and the context, which
+        can later be passed to the 'rollback()' method to restore the state and discard
+        any tokens emitted since the Mark was made, or to the 'commit()' method once the
+        Mark is no longer needed. The Mark may also be used as a context manager, which
+        rolls back the Mark if an exception is raised within the context, or otherwise
+        commits the Mark when the context exits."""
+
+        if self._marks is None:
+            self._marks = []
+
+        return Mark(
+            owner=self,
+            state=(
+                self._lexer.mark(),
+                self._length,
+                self._index,
+                self._level,
+                self._context,
+            ),
+            marks=self._marks,
+        )
+
+    def rollback(self, mark: Mark) -> None:
+        """Restores the Tokenizer's state recorded by the specified Mark, discarding any
+        tokens emitted since the Mark was made, and releasing the Mark as well as any
+        Marks that were made after it."""
+
+        self._verify(mark)
+
+        lexer, length, index, level, context = mark.state
+
+        if lexer.active is True:
+            self._lexer.rollback(lexer)
+
+        del self._tokens[length:]
+
+        self._length = length
+        self._index = index
+        self._level = level
+        self._context = context
+
+        mark._release()
+
+    def commit(self, mark: Mark) -> None:
+        """Releases the specified Mark, as well as any Marks that were made after it,
+        keeping any tokens emitted since the Mark was made."""
+
+        self._verify(mark)
+
+        if (lexer := mark.state[0]).active is True:
+            self._lexer.commit(lexer)
+
+        mark._release()
+
+    def _verify(self, mark: Mark):
+        """Verifies that the Mark was made by this Tokenizer and is still active."""
+
+        if not isinstance(mark, Mark):
+            raise TypeError("The 'mark' argument must reference a Mark class instance!")
+        elif not mark.owner is self:
+            raise TokenizerError(
+                "The 'mark' argument must reference a Mark made by this Tokenizer!"
+            )
+        elif mark.active is False:
+            raise TokenizerError(
+                "The 'mark' argument references a Mark that has already been released!"
+            )
+
+    def dump(
+        self, file: str | BinaryIO = None, source: bool = True, packed: bool = False
+    ) -> bytes | None:
+        """Serializes the tokens of the Tokenizer into the compact binary format of the
+        TokenFile class, tokenizing any remaining text first, along with the source text
+        unless the 'source' argument is set to False, and with the start offsets, lengths
+        and levels delta and varint encoded if the 'packed' argument is set to True, which
+        typically takes a quarter of the space but is slower to write and read. The bytes
+        are returned, or if a file path or binary file object is specified, are written
+        to the file. The tokens may be restored via the 'load()' class method."""
+
+        from lexographer.tokenizer.parallel import _compact
+
+        if not isinstance(source, bool):
+            raise TypeError("The 'source' argument must have a boolean value!")
+
+        if self._lexer.locatable is False:
+            raise TokenizerError(
+                "The tokens can only be dumped if the Lexer can locate any position!"
+            )
+
+        self._pull()
+
+        data: bytes = TokenFile.dumps(
+            _compact(self),
+            source=self._lexer.text if source is True else None,
+            packed=packed,
+            attributes={
+                "tokenizer": f"{self.__class__.__module__}.{self.__class__.__qualname__}",
+            },
+        )
+
+        if file is None:
+            return data
+        elif isinstance(file, str):
+            with open(file, "wb") as handle:
+                handle.write(data)
+        elif callable(getattr(file, "write", None)):
+            file.write(data)
+        else:
+            raise TypeError(
+                "The 'file' argument must have a file path string, binary file object or None value!"
+            )
+
+    def apply_edit(
+        self, start: int, end: int, replacement: str
+    ) -> tuple[int, int, int]:
+        """Applies an edit to the source text, replacing the text between the specified
+        start and end offsets with the replacement text, and updates the tokens without
+        tokenizing the whole of the text again: tokenization restarts from the last safe
+        restart point before the edit, and stops as soon as a newly tokenized token, after
+        the edit, matches a token from before the edit, at which point the remainder of
+        the tokens are reused, with their offsets shifted by the change in length.
+
+        Returns a tuple of the index of the first replaced token, the number of tokens that
+        were removed, and the number of tokens that were inserted in their place. Tokens
+        that were removed keep the text and Position that they had before the edit, as
+        they are located against the text before the edit on removal. The Lexer must be able to locate any position,
+        and a TokenizerError is raised if the edited text cannot be tokenized, in which
+        case the text and tokens are left as they were before the edit."""
+
+        if not isinstance(replacement, str):
+            raise TypeError("The 'replacement' argument must have a string value!")
+
+        lexer: Lexer = self._lexer
+
+        if lexer.locatable is False:
+            raise TokenizerError(
+                f"The 'apply_edit()' method requires a Lexer that can locate any position, which the {lexer.__class__.__name__} cannot!"
+            )
+
+        # The remainder of a lazily tokenized text must be tokenized before the edit
+        self._pull()
+
+        text: str = lexer.text
+
+        # The Lexer validates the offsets before any of the tokens are changed
+        lexer.replace(start, end, replacement)
+
+        tokens: list[Token] | TokenStore = self._tokens
+        length: int = len(tokens)
+
+        if isinstance(tokens, TokenStore):
+            starts: Sequence[int] = tokens.starts
+        else:
+            starts: Sequence[int] = _Offsets(tokens)
+
+        # Find the restart point, from the token containing the start of the edit, or the
+        # token preceding it, stepping back over the lookback tokens, and then over any
+        # tokens that are not restartable
+        first: int = max(bisect_right(starts, start) - 1 - self._lookback, 0)
+
+        while first > 0 and not self._restartable(tokens[first]):
+            first -= 1
+
+        offset: int = starts[first] if first > 0 else 0
+
+        # The tokens from the restart point until the first token starting at or after the
+        # end of the edit are replaced, as well as any tokens after the edit that are not
+        # matched by a newly tokenized token
+        stop: int = max(bisect_left(starts, end), first)
+
+        delta: int = len(replacement) - (end - start)
+        limit: int = start + len(replacement)
+
+        inserted: list[Token] = []
+
+        try:
+            for token in self._relex(offset):
+                if (index := token.index) >= limit:
+                    while stop < length and starts[stop] + delta < index:
+                        stop += 1
+
+                    if stop < length and starts[stop] + delta == index:
+                        previous: Token = tokens[stop]
+
+                        if (
+                            previous.type is token.type
+                            and previous.length == token.length
+                            and previous.level == token.level
+                            and self._restartable(previous)
+                        ):
+                            break
+
+                if self._interned and (self._interned >> token.type.id) & 1:
+                    token._text = self.intern(token.text)
+
+                inserted.append(token)
+            else:
+                stop = length
+        except BaseException:
+            lexer.replace(start, limit, text[start:end])
+            raise
+
+        if isinstance(tokens, TokenStore):
+            tokens.splice(first, stop, inserted, delta)
+        else:
+            # The removed tokens keep their text and Position, as located in the source text
+            # before the edit, as the source text they span has changed, and their offsets
+            # are no longer shifted by subsequent edits; the restart point precedes the edit
+            # so its Position is the same in the source text before and after the edit
+            anchor: Position = lexer.locate(offset)
+            line: int = anchor.line
+            column: int = anchor.column
+            previous: int = offset
+
+            for token in tokens[first:stop]:
+                if token._text is None:
+                    token._text = text[token.index : token._end]
+
+                if token._position is None:
+                    if (index := token.index) < previous:
+                        line, column, previous = anchor.line, anchor.column, offset
+
+                    if newlines := text.count("\n", previous, index):
+                        line += newlines
+                        column = index - text.rfind("\n", previous, index)
+                    else:
+                        column += index - previous
+
+                    previous = index
+
+                    token._position = Position._make(index, line, column)
+
+                token._epoch = None
+
+            tokens[first:stop] = inserted
+
+        # The offsets of the following tokens are shifted when they are next accessed, by
+        # replaying the log of edits made since their offsets were last current, so that
+        # the cost of an edit does not depend on the number of tokens following it
+        if self._edits is None:
+            self._edits: list[tuple[int, int]] = []
+
+        self._edits.append((end, delta))
+        self._epoch = epoch = self._epoch + 1
+
+        for token in inserted:
+            token._epoch = epoch
+
+        if len(self._edits) >= self._history:
+            self._compact_edits()
+
+        self._length += len(inserted) - (stop - first)
+
+        return (first, stop - first, len(inserted))
+
+    def _compact_edits(self):
+        """Shifts the offsets of all of the tokens past the edits recorded in the log of
+        edits, and then empties the log, so that the log does not grow without bound, and
+        so that no token replays more than the limited history of edits when accessed.
+        """
+
+        epoch: int = self._epoch
+
+        # The offsets held by a TokenStore are shifted as each edit is applied, so only a
+        # list of tokens holds tokens whose offsets may not yet have been shifted
+        if not isinstance(self._tokens, TokenStore):
+            for token in self._tokens:
+                if token._epoch != epoch:
+                    token._resolve()
+
+        self._compacted = epoch
+        self._edits = []
+
+    def _restartable(self, token: Token) -> bool:
+        """Returns whether tokenization can restart from the start of the specified token,
+        as needed by the 'apply_edit()' method; by default tokenization can restart from
+        any token at level 0, and subclasses whose tokenization depends on other state,
+        such as within a multi-line string, may override this method."""
+
+        return token.level == 0
+
+    def _relex(self, offset: int) -> Iterator[Token]:
+        """Yields the tokens of the Lexer's text from the specified offset, as needed by
+        the 'apply_edit()' method, by tokenizing from the offset via another instance of
+        this Tokenizer subclass, over a Lexer of the edited text positioned at the offset,
+        without consulting any registered caches. A generator-based 'parse()' method is
+        only advanced as far as the tokens are consumed; any other 'parse()' method is
+        stopped once it has produced a budget of tokens, and if more tokens are consumed,
+        is run again from the offset with double the budget, so that the work done remains
+        proportional to the extent of the edit rather than to the length of the text.
+        Subclasses may override this method to tokenize more efficiently from the offset,
+        as the RuleTokenizer class does."""
+
+        if offset >= self._lexer.length:
+            return
+
+        generator: bool = inspect.isgeneratorfunction(self.parse)
+
+        count: int = 0
+        budget: int = self._budget
+
+        while True:
+            tokenizer: Tokenizer = self._restart(offset)
+
+            finished: bool = True
+
+            if generator is True:
+                tokenizer._generator = tokenizer.parse()
+            else:
+
+                def listener(token: Token):
+                    if tokenizer._length >= budget:
+                        raise _Interrupt()
+
+                tokenizer._listener = listener
+
+                try:
+                    tokenizer.parse()
+                except _Interrupt:
+                    finished = False
+
+            # The tokens emitted since the earliest active Mark of an interrupted 'parse()'
+            # method may yet be rolled back, so are only yielded by a later run
+            if finished is False and tokenizer._marks:
+                length: int = min(mark.state[1] for mark in tokenizer._marks)
+            else:
+                length: int = None
+
+            while length is None or count < length:
+                tokenizer._pull(count + 1)
+
+                if count >= tokenizer._length:
+                    break
+
+                token: Token = tokenizer._tokens[count]
+
+                yield Token._create(
+                    self,
+                    token.type,
+                    token.index,
+                    token.index + token.length,
+                    token._text,
+                    token.level,
+                )
+
+                count += 1
+
+            if finished is True:
+                return
+
+            budget *= 2
+
+    def _restart(self, offset: int) -> Tokenizer:
+        """Returns another instance of this Tokenizer subclass, over a Lexer of the text
+        positioned at the specified offset, ready for its 'parse()' method to tokenize the
+        text from the offset, as needed by the '_relex()' method; the offsets of the tokens
+        are those within the whole of the text."""
+
+        lexer: Lexer = self.__class__._create_lexer(
+            self._lexer.text, subclass=self._lexer.__class__
+        )
+
+        position: Position = self._lexer.locate(offset)
+
+        lexer._index = offset
+        lexer._line = position.line
+        lexer._column = position.column
+
+        tokenizer: Tokenizer = self.__class__.__new__(self.__class__)
+        tokenizer._setup(lexer)
+
+        return tokenizer
+
     @abstractmethod
     def parse(self):
         """Parse over the individual characters of the provided contents string via the
         Lexer, generating a list of Tokens that represent each part of the successfully
         parsed text. Should raise a TokenizerError if unexpected input is encountered.
-        """
+        The method may be implemented as a generator, yielding each Token, or None after
+        adding tokens via the 'token' property or 'emit()' method, in which case the
+        tokenization happens lazily as the tokens are requested from the Tokenizer."""
 
         raise NotImplementedError(
             "The 'parse' method must be implemented in a subclass!"
         )
+
+
+class _Offsets(object):
+    """The _Offsets class provides a sequence of the start offsets of a list of Tokens
+    for bisection, without building a list of the offsets of every token."""
+
+    __slots__ = ("_tokens",)
+
+    def __init__(self, tokens: list[Token]):
+        self._tokens = tokens
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def __getitem__(self, index: int) -> int:
+        return self._tokens[index].index
+
+
+class _Interrupt(BaseException):
+    """Raised to stop a 'parse()' method that is not generator-based once it has produced
+    the tokens needed, as by the '_relex()' method; it derives from BaseException so it is
+    not caught by the handlers of 'parse()' methods that catch any Exception."""
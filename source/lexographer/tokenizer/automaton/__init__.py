@@ -0,0 +1,1055 @@
+from __future__ import annotations
+
+from lexographer.logging import logger
+from lexographer.exceptions import TokenizerError
+from lexographer.tokenizer.rules import Rule, RuleTokenizer
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Generator
+from functools import cache
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import unicodedata
+
+logger = logger.getChild(__name__)
+
+# The largest code point, plus one, marking the end of the alphabet of the automata
+_LIMIT: int = 0x110000
+
+
+@cache
+def _category(name: str, ascii: bool) -> tuple[tuple[int, int]]:
+    """Returns the intervals of the code points within the named category, of 'd', 'w'
+    or 's', per the semantics of the corresponding regular expression escapes."""
+
+    tests: dict[str, callable] = {
+        "d": lambda character: character.isdecimal(),
+        "w": lambda character: character.isalnum() or character == "_",
+        "s": lambda character: character.isspace(),
+    }
+
+    test: callable = tests[name]
+
+    intervals: list[tuple[int, int]] = []
+
+    start: int = None
+
+    for code in range(128 if ascii else _LIMIT):
+        if test(chr(code)):
+            if start is None:
+                start = code
+        elif start is not None:
+            intervals.append((start, code - 1))
+            start = None
+
+    if start is not None:
+        intervals.append((start, code))
+
+    return tuple(intervals)
+
+
+def _union(*intervals: tuple[tuple[int, int]]) -> tuple[tuple[int, int]]:
+    """Returns the sorted union of the specified intervals, merging adjacent intervals."""
+
+    merged: list[list[int]] = []
+
+    for start, end in sorted(interval for group in intervals for interval in group):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+
+    return tuple((start, end) for start, end in merged)
+
+
+def _complement(intervals: tuple[tuple[int, int]]) -> tuple[tuple[int, int]]:
+    """Returns the intervals of the code points that are not within the intervals."""
+
+    complement: list[tuple[int, int]] = []
+
+    start: int = 0
+
+    for first, last in _union(intervals):
+        if first > start:
+            complement.append((start, first - 1))
+        start = last + 1
+
+    if start < _LIMIT:
+        complement.append((start, _LIMIT - 1))
+
+    return tuple(complement)
+
+
+class _Parser(object):
+    """The _Parser class parses the supported subset of the regular expression syntax into
+    a tree of nodes, of character sets, sequences, alternations and repetitions, raising a
+    TokenizerError for any syntax that cannot be expressed by a finite automaton."""
+
+    _pattern: str = None
+    _flags: int = None
+    _index: int = None
+
+    def __init__(self, pattern: str, flags: int = 0):
+        self._pattern = pattern
+        self._flags = flags
+        self._index = 0
+
+    def _error(self, message: str):
+        raise TokenizerError(
+            f"The pattern, {self._pattern!r}, cannot be compiled into an automaton, as {message}!"
+        )
+
+    def _peek(self) -> str | None:
+        if self._index < len(self._pattern):
+            return self._pattern[self._index]
+
+    def _read(self) -> str:
+        if self._index >= len(self._pattern):
+            self._error("it ends unexpectedly")
+
+        character: str = self._pattern[self._index]
+
+        self._index += 1
+
+        return character
+
+    def parse(self) -> tuple:
+        """Returns the tree of nodes parsed from the pattern."""
+
+        node: tuple = self._alternation()
+
+        if self._index < len(self._pattern):
+            self._error(f"it has an unbalanced ')' at offset {self._index}")
+
+        return node
+
+    def _alternation(self) -> tuple:
+        branches: list[tuple] = [self._sequence()]
+
+        while self._peek() == "|":
+            self._index += 1
+            branches.append(self._sequence())
+
+        return ("alt", branches) if len(branches) > 1 else branches[0]
+
+    def _sequence(self) -> tuple:
+        items: list[tuple] = []
+
+        while (character := self._peek()) is not None and not character in "|)":
+            items.append(self._quantified())
+
+        return ("cat", items)
+
+    def _quantified(self) -> tuple:
+        node: tuple = self._atom()
+
+        character: str = self._peek()
+
+        if character == "*":
+            bounds = (0, None)
+        elif character == "+":
+            bounds = (1, None)
+        elif character == "?":
+            bounds = (0, 1)
+        elif character == "{" and (bounds := self._bounds()):
+            pass
+        else:
+            return node
+
+        self._index += 1
+
+        if (character := self._peek()) and character in "?+":
+            self._error("lazy and possessive quantifiers are not supported")
+
+        return ("repeat", node, *bounds)
+
+    def _bounds(self) -> tuple[int, int | None] | None:
+        """Returns the bounds of the '{m,n}' quantifier at the current offset, leaving the
+        offset on the closing brace, or None if the brace does not open a quantifier."""
+
+        if not (
+            match := re.compile(r"\{(\d*)(,?)(\d*)\}").match(self._pattern, self._index)
+        ):
+            return None
+
+        minimum, comma, maximum = match.groups()
+
+        if not (minimum or maximum):
+            return None
+
+        minimum: int = int(minimum or 0)
+        maximum: int | None = int(maximum) if maximum else (None if comma else minimum)
+
+        self._index = match.end() - 1
+
+        return (minimum, maximum)
+
+    def _atom(self) -> tuple:
+        character: str = self._read()
+
+        if character == "(":
+            if self._peek() == "?":
+                if self._pattern.startswith("?:", self._index):
+                    self._index += 2
+                else:
+                    self._error(
+                        "only non-capturing '(?:...)' extension groups are supported"
+                    )
+
+            node: tuple = self._alternation()
+
+            if self._read() != ")":
+                self._error("it has an unbalanced '('")
+
+            return node
+        elif character == "[":
+            return ("set", self._class())
+        elif character == ".":
+            if self._flags & re.DOTALL:
+                return ("set", ((0, _LIMIT - 1),))
+            return ("set", _complement(((10, 10),)))
+        elif character == "\\":
+            return ("set", self._escape(within=False))
+        elif character in "^$":
+            self._error("anchors are not supported")
+        else:
+            return ("set", ((ord(character), ord(character)),))
+
+    def _class(self) -> tuple[tuple[int, int]]:
+        """Returns the intervals of the character class at the current offset."""
+
+        negate: bool = False
+
+        if self._peek() == "^":
+            negate = True
+            self._index += 1
+
+        intervals: list[tuple[tuple[int, int]]] = []
+
+        first: bool = True
+
+        while (character := self._read()) != "]" or first:
+            first = False
+
+            if character == "\\":
+                members: tuple[tuple[int, int]] = self._escape(within=True)
+            else:
+                members: tuple[tuple[int, int]] = ((ord(character), ord(character)),)
+
+            # A hyphen between two single characters, other than at the end, is a range
+            if (
+                self._peek() == "-"
+                and self._pattern[self._index + 1 : self._index + 2] not in ("]", "")
+                and len(members) == 1
+                and members[0][0] == members[0][1]
+            ):
+                self._index += 1
+
+                if (character := self._read()) == "\\":
+                    until: tuple[tuple[int, int]] = self._escape(within=True)
+                else:
+                    until: tuple[tuple[int, int]] = ((ord(character), ord(character)),)
+
+                members = ((members[0][0], until[0][1]),)
+
+            intervals.append(members)
+
+        members = _union(*intervals)
+
+        return _complement(members) if negate else members
+
+    def _escape(self, within: bool) -> tuple[tuple[int, int]]:
+        """Returns the intervals of the code points matched by the escape sequence at the
+        current offset, either within or outside of a character class."""
+
+        character: str = self._read()
+
+        ascii: bool = bool(self._flags & re.ASCII)
+
+        if character in "dws":
+            return _category(character, ascii)
+        elif character in "DWS":
+            return _complement(_category(character.lower(), ascii))
+        elif character == "b" and within:
+            code: int = 8
+        elif character in "abfnrtv":
+            if character == "b":
+                self._error("word boundary anchors are not supported")
+            code: int = ord("\a\b\f\n\r\t\v"["abfnrtv".index(character)])
+        elif character in "xuU":
+            digits: int = {"x": 2, "u": 4, "U": 8}[character]
+            value: str = self._pattern[self._index : self._index + digits]
+
+            if len(value) < digits or not all(
+                digit in "0123456789abcdefABCDEF" for digit in value
+            ):
+                self._error(
+                    f"the '\\{character}' escape sequence must be followed by {digits} hexadecimal digits"
+                )
+
+            if (code := int(value, 16)) > 0x10FFFF:
+                self._error(
+                    f"the '\\{character}{value}' escape sequence is out of range"
+                )
+
+            self._index += digits
+        elif character == "N":
+            if self._peek() != "{" or (end := self._pattern.find("}", self._index)) < 0:
+                self._error("the '\\N' escape sequence must be followed by '{name}'")
+
+            name: str = self._pattern[self._index + 1 : end]
+
+            try:
+                code: int = ord(unicodedata.lookup(name))
+            except KeyError:
+                self._error(f"the '\\N{{{name}}}' escape sequence names no character")
+
+            self._index = end + 1
+        elif character == "0":
+            code: int = 0
+        elif character.isdigit():
+            self._error("backreferences are not supported")
+        elif character.isalpha():
+            self._error(f"the '\\{character}' escape sequence is not supported")
+        else:
+            code: int = ord(character)
+
+        return ((code, code),)
+
+
+class _Builder(object):
+    """The _Builder class holds the state of a nondeterministic finite automaton, built by
+    Thompson's construction from the trees of nodes parsed from the patterns of the rules,
+    where each state holds its epsilon transitions and its transitions on sets of code
+    points; state 0 is the start state, with an epsilon transition to each rule's start.
+    """
+
+    _epsilon: list[list[int]] = None
+    _edges: list[list[tuple[tuple[tuple[int, int]], int]]] = None
+    _accepts: dict[int, int] = None
+
+    def __init__(self):
+        self._epsilon = []
+        self._edges = []
+        self._accepts = {}
+
+        self._state()
+
+    def _state(self) -> int:
+        self._epsilon.append([])
+        self._edges.append([])
+
+        return len(self._epsilon) - 1
+
+    def add(self, node: tuple, rule: int):
+        """Adds the tree of nodes for the rule at the specified index to the automaton."""
+
+        start, end = self._build(node)
+
+        self._epsilon[0].append(start)
+
+        self._accepts[end] = rule
+
+    def _build(self, node: tuple) -> tuple[int, int]:
+        kind: str = node[0]
+
+        if kind == "set":
+            start, end = self._state(), self._state()
+
+            self._edges[start].append((node[1], end))
+        elif kind == "cat":
+            start = end = self._state()
+
+            for item in node[1]:
+                first, last = self._build(item)
+
+                self._epsilon[end].append(first)
+
+                end = last
+        elif kind == "alt":
+            start, end = self._state(), self._state()
+
+            for branch in node[1]:
+                first, last = self._build(branch)
+
+                self._epsilon[start].append(first)
+                self._epsilon[last].append(end)
+        elif kind == "repeat":
+            _, item, minimum, maximum = node
+
+            start = end = self._state()
+
+            for _ in range(minimum):
+                first, last = self._build(item)
+
+                self._epsilon[end].append(first)
+
+                end = last
+
+            if maximum is None:
+                hub: int = self._state()
+
+                first, last = self._build(item)
+
+                self._epsilon[end].append(hub)
+                self._epsilon[hub].append(first)
+                self._epsilon[last].append(hub)
+
+                end = hub
+            else:
+                for _ in range(maximum - minimum):
+                    first, last = self._build(item)
+
+                    following: int = self._state()
+
+                    self._epsilon[end].extend((first, following))
+                    self._epsilon[last].append(following)
+
+                    end = following
+
+        return (start, end)
+
+
+class Automaton(object):
+    """The Automaton class holds the tables of a minimized deterministic finite automaton
+    compiled from the patterns of a set of lexical rules, which matches the longest token
+    starting at each offset through a text in a single pass per token, without any of the
+    backtracking of a regular expression engine. Where several rules match the longest
+    token, the rule declared first wins. The code points of the text are first mapped to
+    character classes, each holding the code points that every rule treats identically,
+    and the transitions are held in a flat table indexed by state and character class.
+
+    The tables can be serialized via the 'dumps()' method and restored via the 'loads()'
+    class method, and the 'build()' class method caches the compiled tables in memory, and
+    optionally in a directory on disk, keyed by a hash of the patterns and flags, so that
+    subsequent processes can skip the compilation.
+
+    The patterns support literals, escapes, character classes, the '.' wildcard, groups,
+    alternation and the '*', '+', '?' and '{m,n}' quantifiers; anchors, lookarounds,
+    backreferences, and lazy or possessive quantifiers cannot be expressed by a finite
+    automaton, and raise a TokenizerError, as do all flags other than re.ASCII and
+    re.DOTALL."""
+
+    _version: int = 1
+
+    # The number of states beyond which compilation is abandoned, as the subset
+    # construction can produce exponentially many states for some patterns
+    _limit: int = 10000
+
+    # The largest number of characters classified at a time while scanning a text
+    _block: int = 65536
+
+    # The compiled automata, cached in memory by their fingerprint
+    _automata: dict[str, Automaton] = {}
+
+    _fingerprint: str = None
+    _boundaries: list[int] = None
+    _classes: array = None
+    _transitions: list[list[int]] = None
+    _accepts: list[int] = None
+
+    # The runtime tables, derived from the tables above when the automaton is created,
+    # and held, like the character classes, in arrays of machine integers
+    _latin: bytes | list[int] = None
+    _table: array = None
+    _final: array = None
+
+    def __init__(self, patterns: list[str], flags: int = 0):
+        """Compiles the specified patterns, in order of precedence, into a new Automaton."""
+
+        if not isinstance(patterns, (list, tuple)) or not all(
+            isinstance(pattern, str) for pattern in patterns
+        ):
+            raise TypeError(
+                "The 'patterns' argument must have a list of string values!"
+            )
+
+        if not isinstance(flags, int):
+            raise TypeError("The 'flags' argument must have an integer value!")
+        elif flags & ~(re.ASCII | re.DOTALL):
+            raise TokenizerError(
+                "The 'flags' argument may only hold the re.ASCII and re.DOTALL flags!"
+            )
+
+        builder = _Builder()
+
+        for index, pattern in enumerate(patterns):
+            builder.add(_Parser(pattern, flags).parse(), index)
+
+        classes, boundaries, members = self._partition(builder)
+
+        transitions, accepts = self._determinize(builder, members, max(classes) + 1)
+
+        transitions, accepts = self._minimize(transitions, accepts)
+
+        if accepts[0] >= 0:
+            raise TokenizerError("The patterns must not match the empty string!")
+
+        self._setup(
+            self.digest(patterns, flags),
+            boundaries,
+            classes,
+            transitions,
+            accepts,
+        )
+
+    def __repr__(self) -> str:
+        """Returns a string representation of current Automaton instance for debugging."""
+
+        return "<%s(states: %d, classes: %d)>" % (
+            self.__class__.__name__,
+            len(self._accepts),
+            self.width,
+        )
+
+    @classmethod
+    def digest(cls, patterns: list[str], flags: int = 0) -> str:
+        """Returns the hash identifying the automaton compiled from the patterns and flags,
+        which includes the version of the table format."""
+
+        return hashlib.sha256(
+            json.dumps([cls._version, flags, list(patterns)]).encode("utf-8")
+        ).hexdigest()
+
+    @classmethod
+    def build(cls, patterns: list[str], flags: int = 0, cache: str = None) -> Automaton:
+        """Returns the Automaton compiled from the specified patterns and flags, reusing
+        an automaton compiled earlier in the process, or one held in the cache directory,
+        if specified, and saving any newly compiled automaton into the cache directory.
+        """
+
+        fingerprint: str = cls.digest(patterns, flags)
+
+        if automaton := cls._automata.get(fingerprint):
+            return automaton
+
+        if cache is not None:
+            if not isinstance(cache, str):
+                raise TypeError("The 'cache' argument must have a string value!")
+
+            filepath: str = os.path.join(cache, f"automaton-{fingerprint}.json")
+
+            try:
+                with open(filepath, "rb") as file:
+                    automaton = cls.loads(file.read())
+
+                if automaton.fingerprint != fingerprint:
+                    raise TokenizerError("its fingerprint does not match its patterns")
+                elif max(automaton._accepts) >= len(patterns):
+                    raise TokenizerError("its accepting states reference unknown rules")
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, TokenizerError) as exception:
+                logger.warning(
+                    "The cached automaton, %s, could not be loaded, and will be recompiled: %s",
+                    filepath,
+                    exception,
+                )
+
+                automaton = None
+
+        if automaton is None:
+            automaton = cls(patterns, flags)
+
+            if cache is not None:
+                automaton.save(filepath)
+
+        return cls._automata.setdefault(fingerprint, automaton)
+
+    @classmethod
+    def loads(cls, data: bytes | str) -> Automaton:
+        """Returns the Automaton restored from the tables serialized by 'dumps()'."""
+
+        if not isinstance(data, (bytes, str)):
+            raise TypeError("The 'data' argument must have a bytes or string value!")
+
+        tables: dict = json.loads(data)
+
+        if not isinstance(tables, dict) or tables.get("version") != cls._version:
+            raise TokenizerError(
+                "The serialized automaton was created by an incompatible version!"
+            )
+
+        automaton = object.__new__(cls)
+
+        try:
+            cls._validate(
+                tables["boundaries"],
+                tables["classes"],
+                tables["transitions"],
+                tables["accepts"],
+            )
+
+            automaton._setup(
+                tables["fingerprint"],
+                tables["boundaries"],
+                tables["classes"],
+                tables["transitions"],
+                tables["accepts"],
+            )
+        except (KeyError, IndexError, TypeError, ValueError) as exception:
+            raise TokenizerError(
+                f"The serialized automaton is invalid: {exception}!"
+            ) from exception
+
+        return automaton
+
+    @staticmethod
+    def _validate(
+        boundaries: list[int],
+        classes: list[int],
+        transitions: list[list[int]],
+        accepts: list[int],
+    ):
+        """Checks that the serialized tables describe a valid automaton, so that a stale or
+        corrupt serialization is rejected when it is loaded, rather than failing with an
+        IndexError, or matching incorrectly, while a text is being scanned."""
+
+        def integers(values: list) -> bool:
+            return isinstance(values, list) and all(
+                type(value) is int for value in values
+            )
+
+        if not (integers(boundaries) and integers(classes) and integers(accepts)):
+            raise ValueError("the tables must hold lists of integers")
+
+        if not (len(boundaries) == len(classes) > 0 and boundaries[0] == 0):
+            raise ValueError("the character classes do not cover the alphabet")
+
+        if any(start >= end for start, end in zip(boundaries, boundaries[1:])):
+            raise ValueError("the character class boundaries are not in order")
+
+        if min(classes) < 0:
+            raise ValueError("the character classes must not be negative")
+
+        width: int = max(classes) + 1
+        states: int = len(accepts)
+
+        if not (isinstance(transitions, list) and len(transitions) == states > 0):
+            raise ValueError("the transitions do not match the states")
+
+        for row in transitions:
+            if not (integers(row) and len(row) == width):
+                raise ValueError("the transitions do not match the character classes")
+            elif any(not -1 <= state < states for state in row):
+                raise ValueError("the transitions lead to unknown states")
+
+        if min(accepts) < -1:
+            raise ValueError("the accepting states must reference rules")
+        elif accepts[0] >= 0:
+            raise ValueError("the start state must not accept the empty string")
+
+    def dumps(self) -> bytes:
+        """Returns the tables of the Automaton serialized into bytes."""
+
+        return json.dumps(
+            {
+                "version": self._version,
+                "fingerprint": self._fingerprint,
+                "boundaries": self._boundaries,
+                "classes": list(self._classes),
+                "transitions": self._transitions,
+                "accepts": self._accepts,
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+    def save(self, filepath: str):
+        """Saves the serialized tables into the specified file, atomically replacing any
+        existing file, so that concurrent processes never read a partially written file;
+        failures are logged rather than raised, as the cache is only an optimization."""
+
+        directory: str = os.path.dirname(filepath) or "."
+
+        try:
+            os.makedirs(directory, exist_ok=True)
+
+            descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+            try:
+                with os.fdopen(descriptor, "wb") as file:
+                    file.write(self.dumps())
+
+                os.replace(temporary, filepath)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+        except OSError as exception:
+            logger.warning(
+                "The automaton could not be saved to %s: %s", filepath, exception
+            )
+
+    @property
+    def fingerprint(self) -> str:
+        """Returns the hash of the patterns and flags that the Automaton was compiled from."""
+
+        return self._fingerprint
+
+    @property
+    def states(self) -> int:
+        """Returns the number of states of the Automaton."""
+
+        return len(self._accepts)
+
+    @property
+    def width(self) -> int:
+        """Returns the number of character classes of the Automaton."""
+
+        return max(self._classes) + 1
+
+    def _setup(
+        self,
+        fingerprint: str,
+        boundaries: list[int],
+        classes: list[int],
+        transitions: list[list[int]],
+        accepts: list[int],
+    ):
+        """Assigns the tables and derives the runtime tables, where the transition table
+        is flattened, with each state being represented by the offset of its row, so that
+        each transition takes a single addition and index; -1 represents the dead state.
+        """
+
+        width: int = max(classes) + 1
+
+        if len(boundaries) != len(classes) or len(transitions) != len(accepts):
+            raise TokenizerError("The tables of the automaton are inconsistent!")
+
+        table: array = array("l")
+
+        for row in transitions:
+            if len(row) != width:
+                raise TokenizerError("The tables of the automaton are inconsistent!")
+
+            table.extend(state * width if state >= 0 else -1 for state in row)
+
+        final: array = array("l", [-1]) * len(table)
+
+        for state, rule in enumerate(accepts):
+            final[state * width] = rule
+
+        self._fingerprint = fingerprint
+        self._boundaries = list(boundaries)
+        self._classes = array("l", classes)
+        self._transitions = [list(row) for row in transitions]
+        self._accepts = list(accepts)
+        self._table = table
+        self._final = final
+
+        latin: list[int] = [self.classify(code) for code in range(256)]
+
+        self._latin = bytes(latin) if width <= 256 else latin
+
+    def classify(self, code: int) -> int:
+        """Returns the character class of the specified code point."""
+
+        return self._classes[bisect_right(self._boundaries, code) - 1]
+
+    def _classify(self, text: str) -> bytes | list[int]:
+        """Returns the character class of each character in the text, translating the
+        text via the Latin-1 table in a single call where it holds no other characters,
+        and as bytes wherever the character classes fit within a byte."""
+
+        latin: bytes | list[int] = self._latin
+
+        if isinstance(latin, bytes):
+            try:
+                return text.encode("latin-1").translate(latin)
+            except UnicodeEncodeError:
+                pass
+
+        classify: callable = self.classify
+
+        classes: list[int] = [
+            latin[code] if code < 256 else classify(code) for code in map(ord, text)
+        ]
+
+        return bytes(classes) if isinstance(latin, bytes) else classes
+
+    def scan(
+        self, text: str, start: int = 0
+    ) -> Generator[tuple[int, int, int], None, None]:
+        """Yields the index of the rule matching the longest token at each successive
+        offset through the text, from the specified start offset, along with the token's
+        start and end offsets, stopping at the end of the text, or at the first offset at
+        which no rule matches. The characters are classified in blocks, of a size that
+        doubles up to the '_block' size, as they are reached, so that scanning only a few
+        tokens from the start offset only classifies the characters near that offset."""
+
+        table: array = self._table
+        final: array = self._final
+        total: int = len(text)
+        block: int = 1024
+
+        # The offsets of the classified characters are relative to the 'base' offset
+        base: int = start
+        classes: bytes | list[int] = self._classify(text[base : base + block])
+        length: int = len(classes)
+        index: int = 0
+
+        while base + index < total:
+            state: int = 0
+            rule: int = -1
+            offset: int = index
+            end: int = index
+
+            # Advance from the start state until the dead state, or the end of the text,
+            # noting the rule and the end of the longest token matched along the way
+            while True:
+                while offset < length:
+                    if (state := table[state + classes[offset]]) < 0:
+                        break
+
+                    offset += 1
+
+                    if final[state] >= 0:
+                        rule = final[state]
+                        end = offset
+                else:
+                    # Classify the following block of characters, dropping those before
+                    # the current token, and continue matching from the current state
+                    if base + length < total:
+                        block = min(block * 2, self._block)
+
+                        classes = classes[index:] + self._classify(
+                            text[base + length : base + length + block]
+                        )
+
+                        base += index
+                        offset -= index
+                        end -= index
+                        index = 0
+                        length = len(classes)
+
+                        continue
+
+                break
+
+            if rule < 0:
+                return
+
+            yield (rule, base + index, base + end)
+
+            index = end
+
+    @staticmethod
+    def _partition(
+        builder: _Builder,
+    ) -> tuple[list[int], list[int], dict[int, set[int]]]:
+        """Partitions the alphabet into the character classes, by splitting it at each of
+        the boundaries of the sets of code points of the transitions, and then merging the
+        intervals that are members of the same sets, returning the class of each interval,
+        the start of each interval, and the classes that each transition's set holds."""
+
+        sets: list[tuple[tuple[int, int]]] = list(
+            {members for edges in builder._edges for members, _ in edges}
+        )
+
+        boundaries: set[int] = {0, _LIMIT}
+
+        for members in sets:
+            for start, end in members:
+                boundaries.update((start, end + 1))
+
+        boundaries: list[int] = sorted(boundaries)
+
+        # The indices of the sets that each of the intervals between boundaries is within
+        signatures: list[list[int]] = [[] for _ in range(len(boundaries) - 1)]
+
+        for index, members in enumerate(sets):
+            for start, end in members:
+                for interval in range(
+                    bisect_left(boundaries, start), bisect_left(boundaries, end + 1)
+                ):
+                    signatures[interval].append(index)
+
+        identifiers: dict[tuple[int], int] = {}
+
+        classes: list[int] = []
+        starts: list[int] = []
+        members: dict[tuple[tuple[int, int]], set[int]] = {
+            members: set() for members in sets
+        }
+
+        for interval, signature in enumerate(signatures):
+            identifier: int = identifiers.setdefault(tuple(signature), len(identifiers))
+
+            for index in signature:
+                members[sets[index]].add(identifier)
+
+            if not classes or classes[-1] != identifier:
+                classes.append(identifier)
+                starts.append(boundaries[interval])
+
+        return (classes, starts, members)
+
+    def _determinize(
+        self,
+        builder: _Builder,
+        members: dict[tuple[tuple[int, int]], set[int]],
+        width: int,
+    ) -> tuple[list[list[int]], list[int]]:
+        """Converts the nondeterministic automaton into a deterministic automaton via the
+        subset construction, returning the transitions and accepted rule of each state.
+        """
+
+        epsilon: list[list[int]] = builder._epsilon
+        edges: list[list[tuple]] = builder._edges
+        accepting: dict[int, int] = builder._accepts
+
+        def closure(states: set[int]) -> frozenset[int]:
+            pending: list[int] = list(states)
+            states: set[int] = set(states)
+
+            while pending:
+                for state in epsilon[pending.pop()]:
+                    if not state in states:
+                        states.add(state)
+                        pending.append(state)
+
+            return frozenset(states)
+
+        subsets: list[frozenset[int]] = [closure({0})]
+        identifiers: dict[frozenset[int], int] = {subsets[0]: 0}
+        transitions: list[list[int]] = []
+        accepts: list[int] = []
+
+        while len(transitions) < len(subsets):
+            subset: frozenset[int] = subsets[len(transitions)]
+
+            moves: dict[int, set[int]] = {}
+
+            for state in subset:
+                for sets, target in edges[state]:
+                    for identifier in members[sets]:
+                        moves.setdefault(identifier, set()).add(target)
+
+            row: list[int] = [-1] * width
+
+            for identifier, targets in moves.items():
+                target: frozenset[int] = closure(targets)
+
+                if not target in identifiers:
+                    if len(subsets) >= self._limit:
+                        raise TokenizerError(
+                            f"The patterns produce an automaton of more than {self._limit} states!"
+                        )
+
+                    identifiers[target] = len(subsets)
+                    subsets.append(target)
+
+                row[identifier] = identifiers[target]
+
+            transitions.append(row)
+
+            rules: list[int] = [
+                accepting[state] for state in subset if state in accepting
+            ]
+
+            accepts.append(min(rules) if rules else -1)
+
+        return (transitions, accepts)
+
+    @staticmethod
+    def _minimize(
+        transitions: list[list[int]], accepts: list[int]
+    ) -> tuple[list[list[int]], list[int]]:
+        """Minimizes the deterministic automaton by partition refinement, initially
+        partitioning the states by their accepted rule, and then splitting the blocks
+        until the states in each block transition to the same blocks, returning the
+        transitions and accepted rule of each block, with the start state in block 0."""
+
+        identifiers: dict[int, int] = {}
+
+        blocks: list[int] = [
+            identifiers.setdefault(rule, len(identifiers)) for rule in accepts
+        ]
+
+        count: int = len(identifiers)
+
+        while True:
+            signatures: dict[tuple, int] = {}
+
+            refined: list[int] = [
+                signatures.setdefault(
+                    (
+                        blocks[state],
+                        tuple(blocks[target] if target >= 0 else -1 for target in row),
+                    ),
+                    len(signatures),
+                )
+                for state, row in enumerate(transitions)
+            ]
+
+            blocks = refined
+
+            if len(signatures) == count:
+                break
+
+            count = len(signatures)
+
+        minimized: list[list[int]] = [None] * count
+        accepted: list[int] = [-1] * count
+
+        for state, block in enumerate(blocks):
+            if minimized[block] is None:
+                minimized[block] = [
+                    blocks[target] if target >= 0 else -1
+                    for target in transitions[state]
+                ]
+                accepted[block] = accepts[state]
+
+        return (minimized, accepted)
+
+
+class DFATokenizer(RuleTokenizer):
+    """The DFATokenizer class tokenizes via the same declared rules as the RuleTokenizer
+    class, but compiles the rules into a minimized deterministic finite automaton rather
+    than a regular expression, which matches each token in time proportional to its
+    length without any backtracking, so that the time taken to tokenize a text is
+    predictable even for untrusted input. Rather than the first rule to match winning,
+    the rule matching the longest token wins, with the rule declared first, or with the
+    higher priority, winning where several rules match the longest token, so rules for
+    keywords should be declared before the rule for identifiers.
+
+    The automaton is compiled once per set of rules in each process, when the subclass
+    is created; if the '_cache' class attribute is set to the path of a directory, the
+    compiled tables are saved into, and subsequently loaded from, that directory, keyed
+    by a hash of the rules' patterns, so that other processes skip the compilation.
+
+    The rules' patterns are limited to the syntax supported by the Automaton class, and
+    the '_flags' class attribute to the re.ASCII and re.DOTALL flags."""
+
+    _cache: str = None
+
+    # The automaton compiled from the declared rules of each DFATokenizer subclass
+    _automaton: Automaton = None
+
+    @classmethod
+    def _compile(cls, rules: tuple[Rule]):
+        """Compiles the ordered rules into the automaton, or loads it from the cache."""
+
+        cls._automaton = Automaton.build(
+            [rule.pattern for rule in rules], flags=cls._flags, cache=cls._cache
+        )
+
+    def _spans(self, offset: int = 0) -> Generator[tuple[Rule, int, int], None, None]:
+        """Yields the rule matching the longest token at each successive offset through
+        the text, from the specified offset, along with the token's start and end offsets,
+        raising a TokenizerError if no rule matches at an offset before the end of the
+        text."""
+
+        text: str = self.lexer.text
+        rules: tuple[Rule] = self._ordered
+        end: int = offset
+
+        for rule, start, end in self._automaton.scan(text, offset):
+            yield (rules[rule], start, end)
+
+        if end < len(text):
+            self._unmatched(end)
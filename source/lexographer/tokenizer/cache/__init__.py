@@ -0,0 +1,395 @@
+from __future__ import annotations
+
+from lexographer.logging import logger
+from lexographer.enumerations import Context, Type
+from lexographer.exceptions import TokenizerError
+from lexographer.tokenizer.serialization import TokenFile
+
+from array import array
+from collections import OrderedDict
+from collections.abc import Hashable
+
+import hashlib
+import os
+import tempfile
+import threading
+
+logger = logger.getChild(__name__)
+
+
+class TokenCache(object):
+    """The TokenCache class is a bounded, least recently used, cache of tokenization results
+    which can be registered for Tokenizer and Parser subclasses via their class methods
+    'register_cache()'. The results are held in the same compact form that is used to pass
+    tokens between processes, as arrays of the type identifiers, offsets, lengths and levels
+    of the tokens, keyed by the Tokenizer subclass and a hash of the source text, so that
+    a repeated text is tokenized by assembling a new Tokenizer from the cached result rather
+    than by lexing the text again; as the cached results are never modified, each Tokenizer
+    assembled from a result holds its own tokens and may be used, or edited, independently.
+
+    The cache is bounded both by the number of results held and by the total size of the
+    arrays held by the results, evicting the least recently used results once either bound
+    is exceeded, and it records the number of hits, misses and evictions; the cache may be
+    shared between Tokenizer subclasses, and between threads."""
+
+    _capacity: int = None
+    _limit: int = None
+    _entries: OrderedDict[Hashable, tuple[object, int]] = None
+    _size: int = 0
+    _hits: int = 0
+    _misses: int = 0
+    _evictions: int = 0
+    _lock: threading.Lock = None
+
+    def __init__(self, capacity: int = 1024, limit: int = 64 * 1024 * 1024):
+        """Supports initializing the TokenCache class with the maximum number of results
+        to hold, and the maximum total size, in bytes, of the tokens of those results.
+        """
+
+        if not (isinstance(capacity, int) and capacity >= 1):
+            raise TypeError(
+                "The 'capacity' argument must have a positive integer value!"
+            )
+
+        if not (isinstance(limit, int) and limit >= 1):
+            raise TypeError("The 'limit' argument must have a positive integer value!")
+
+        self._capacity = capacity
+        self._limit = limit
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of results held by the TokenCache."""
+
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Returns whether a result is held for the key, without counting a hit or miss."""
+
+        return key in self._entries
+
+    def __repr__(self) -> str:
+        """Returns a string representation of current TokenCache instance for debugging."""
+
+        return (
+            "<%s(entries: %d/%d, size: %d/%d, hits: %d, misses: %d, evictions: %d)>"
+            % (
+                self.__class__.__name__,
+                len(self._entries),
+                self._capacity,
+                self._size,
+                self._limit,
+                self._hits,
+                self._misses,
+                self._evictions,
+            )
+        )
+
+    @property
+    def capacity(self) -> int:
+        """Returns the maximum number of results held by the TokenCache."""
+
+        return self._capacity
+
+    @property
+    def limit(self) -> int:
+        """Returns the maximum total size, in bytes, of the results held."""
+
+        return self._limit
+
+    @property
+    def size(self) -> int:
+        """Returns the total size, in bytes, of the results currently held."""
+
+        return self._size
+
+    @property
+    def hits(self) -> int:
+        """Returns the number of lookups that found a result."""
+
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Returns the number of lookups that did not find a result."""
+
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Returns the number of results evicted to keep the cache within its bounds."""
+
+        return self._evictions
+
+    @classmethod
+    def digest(cls, text: str) -> bytes:
+        """Returns the hash of the specified text used to key its tokenization results."""
+
+        return hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+
+    @classmethod
+    def measure(cls, result: tuple) -> int:
+        """Returns the size, in bytes, of the arrays and strings held by the result."""
+
+        size: int = 0
+
+        for value in result:
+            if isinstance(value, array):
+                size += len(value) * value.itemsize
+            elif isinstance(value, dict):
+                size += sum(
+                    len(string) for string in value.values() if isinstance(string, str)
+                )
+
+        return size
+
+    def get(self, key: Hashable) -> tuple | None:
+        """Returns the result held for the key, marking it as the most recently used, or
+        None if no result is held for the key."""
+
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                self._misses += 1
+
+                return None
+
+            self._entries.move_to_end(key)
+
+            self._hits += 1
+
+        return entry[0]
+
+    def put(self, key: Hashable, result: tuple):
+        """Holds the result for the key, as the most recently used result, evicting the
+        least recently used results as needed to keep the cache within its bounds; a result
+        larger than the cache's size limit is not held."""
+
+        if not isinstance(result, tuple):
+            raise TypeError("The 'result' argument must have a tuple value!")
+
+        if (size := self.measure(result)) > self._limit:
+            return
+
+        with self._lock:
+            if (previous := self._entries.pop(key, None)) is not None:
+                self._size -= previous[1]
+
+            self._entries[key] = (result, size)
+            self._size += size
+
+            while len(self._entries) > self._capacity or self._size > self._limit:
+                _, (_, evicted) = self._entries.popitem(last=False)
+
+                self._size -= evicted
+                self._evictions += 1
+
+    def clear(self):
+        """Removes all of the results held, and resets the counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+
+class DiskTokenCache(object):
+    """The DiskTokenCache class is a persistent cache of the tokens of files, held in a
+    directory, which can be registered for a Tokenizer subclass via its class method
+    'register_disk_cache()', so that files that have not changed since they were last
+    tokenized, such as the unchanged source files of a build, are not lexed again. The
+    tokens of each file are held in a cache file, in the binary format of the TokenFile
+    class, named after the Tokenizer subclass and the absolute path of the file, along
+    with the size and modification time of the file, a hash of its decoded text, and the
+    fingerprint of the Tokenizer subclass, and the cached tokens are only used if all of
+    these still match, so the cache is invalidated automatically whenever the file, or
+    the Tokenizer subclass, changes.
+
+    The cache files are replaced atomically, and a cache file that cannot be read, such
+    as one that is corrupt or was written by an incompatible version, is treated as a miss
+    and is replaced; failures to write a cache file are logged rather than raised."""
+
+    _directory: str = None
+    _hits: int = 0
+    _misses: int = 0
+
+    def __init__(self, directory: str):
+        """Supports initializing the DiskTokenCache class with the path of the directory
+        to hold the cache files in, which is created as needed."""
+
+        if not isinstance(directory, str):
+            raise TypeError("The 'directory' argument must have a string value!")
+        elif len(directory) == 0:
+            raise ValueError(
+                "The 'directory' argument must have a non-empty string value!"
+            )
+
+        self._directory = os.path.abspath(directory)
+
+    def __repr__(self) -> str:
+        """Returns a string representation of current DiskTokenCache instance for debugging."""
+
+        return "<%s(directory: %r, hits: %d, misses: %d)>" % (
+            self.__class__.__name__,
+            self._directory,
+            self._hits,
+            self._misses,
+        )
+
+    @property
+    def directory(self) -> str:
+        """Returns the absolute path of the directory holding the cache files."""
+
+        return self._directory
+
+    @property
+    def hits(self) -> int:
+        """Returns the number of lookups that found valid cached tokens."""
+
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Returns the number of lookups that did not find valid cached tokens."""
+
+        return self._misses
+
+    def filepath(self, subclass: type, file: str) -> str:
+        """Returns the path of the cache file for the tokens of the file as tokenized by
+        the specified Tokenizer subclass."""
+
+        name: str = f"{subclass.__module__}.{subclass.__qualname__}"
+
+        digest: str = hashlib.sha256(
+            f"{name}\0{os.path.abspath(file)}".encode("utf-8", "surrogatepass")
+        ).hexdigest()
+
+        return os.path.join(self._directory, f"tokens-{digest[:32]}.bin")
+
+    def load(self, subclass: type, file: str, digest: bytes) -> tuple | None:
+        """Returns the cached tokens of the file, whose decoded text has the specified hash,
+        as computed by the 'TokenCache.digest()' class method, in their compact form, if
+        the cached tokens are still valid for the file, its text and the Tokenizer
+        subclass, or otherwise returns None."""
+
+        filepath: str = self.filepath(subclass, file)
+
+        try:
+            status: os.stat_result = os.stat(file)
+
+            reader: TokenFile = TokenFile.open(filepath)
+        except OSError:
+            self._misses += 1
+
+            return None
+        except TokenizerError as exception:
+            logger.warning(
+                "The cached tokens, %s, could not be loaded, and will be replaced: %s",
+                filepath,
+                exception,
+            )
+
+            self._misses += 1
+
+            return None
+
+        with reader:
+            # The attributes are checked before the tokens are read from the mapped file
+            if reader.attributes != self._attributes(subclass, file, digest, status):
+                self._misses += 1
+
+                return None
+
+            try:
+                names, *arrays, texts, context, level = reader.result()
+
+                # The names of the types and the context are resolved while the tokens can
+                # still be treated as a miss, such as if a type is no longer registered
+                result: tuple = (
+                    {typeid: getattr(Type, name) for typeid, name in names.items()},
+                    *arrays,
+                    texts,
+                    getattr(Context, context),
+                    level,
+                )
+            except (AttributeError, TokenizerError) as exception:
+                logger.warning(
+                    "The cached tokens, %s, could not be loaded, and will be replaced: %s",
+                    filepath,
+                    exception,
+                )
+
+                self._misses += 1
+
+                return None
+
+        self._hits += 1
+
+        return result
+
+    def save(self, subclass: type, file: str, digest: bytes, result: tuple):
+        """Saves the tokens of the file, whose decoded text has the specified hash, in their
+        compact form, atomically replacing any existing cache file for the file."""
+
+        filepath: str = self.filepath(subclass, file)
+
+        try:
+            data: bytes = TokenFile.dumps(
+                result,
+                attributes=self._attributes(subclass, file, digest, os.stat(file)),
+            )
+
+            os.makedirs(self._directory, exist_ok=True)
+
+            descriptor, temporary = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+
+            try:
+                with os.fdopen(descriptor, "wb") as handle:
+                    handle.write(data)
+
+                os.replace(temporary, filepath)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+        except OSError as exception:
+            logger.warning(
+                "The tokens of %s could not be saved to %s: %s",
+                file,
+                filepath,
+                exception,
+            )
+
+    def _attributes(
+        self, subclass: type, file: str, digest: bytes, status: os.stat_result
+    ) -> dict[str, str]:
+        """Returns the attributes that the cached tokens of the file are only valid for;
+        the hash of the text is computed once by the caller, and is shared with the key
+        of any TokenCache, rather than being computed again for each of the attributes.
+        """
+
+        return {
+            "path": os.path.abspath(file),
+            "size": str(status.st_size),
+            "mtime": str(status.st_mtime_ns),
+            "fingerprint": subclass.fingerprint(),
+            "digest": digest.hex(),
+        }
+
+    def clear(self):
+        """Removes all of the cache files from the directory."""
+
+        try:
+            filenames: list[str] = os.listdir(self._directory)
+        except FileNotFoundError:
+            return
+
+        for filename in filenames:
+            if filename.startswith("tokens-") and filename.endswith(".bin"):
+                try:
+                    os.unlink(os.path.join(self._directory, filename))
+                except FileNotFoundError:
+                    pass
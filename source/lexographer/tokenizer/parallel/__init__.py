@@ -0,0 +1,580 @@
+from __future__ import annotations
+
+from lexographer.logging import logger
+from lexographer.enumerations import Context, Type, TypeTable
+from lexographer.exceptions import TokenizerError
+from lexographer.lexer import Lexer
+from lexographer.tokenizer import Tokenizer
+from lexographer.tokenizer.token import Token
+from lexographer.tokenizer.store import TokenStore
+
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import islice
+
+import os
+
+logger = logger.getChild(__name__)
+
+
+class ParallelTokenizer(object):
+    """The ParallelTokenizer class supports tokenizing large texts across several worker
+    processes via a Tokenizer subclass that declares the safe boundaries at which its text
+    may be split, via the 'register_boundary()' class method or by overriding the class
+    method 'boundary()'. The text is split into ranges of about the chunk size, each ending
+    at a safe boundary, and each range is tokenized by an instance of the Tokenizer subclass
+    in a worker process of a ProcessPoolExecutor, with the tokens being returned as compact
+    arrays of their types, offsets, lengths and levels. The tokens of each range are then
+    merged back in order into a single instance of the Tokenizer subclass over the whole of
+    the text, with their offsets shifted by the start of their range, so that their indices,
+    lines and columns are derived from the whole text, as for the tokens of a serial run.
+    No more than two ranges per worker are held in flight at a time, so the copies of the
+    ranges, and their tokens, are not all held in memory at once.
+
+    The Tokenizer subclass, and the token types that it uses, must be importable by the
+    worker processes, and its Lexer must be able to locate any position. The result is the
+    same as for a serial run as long as the tokenization of the text after each boundary
+    does not depend on the text before the boundary, and the tokens of a text that is no
+    longer than the chunk size, or that has no boundaries, are tokenized in the process.
+    """
+
+    _tokenizer: type[Tokenizer] = None
+    _workers: int = None
+    _chunk: int = None
+    _executor: Executor = None
+    _owned: bool = False
+
+    def __init__(
+        self,
+        tokenizer: type[Tokenizer],
+        workers: int = None,
+        chunk: int = 1048576,
+        executor: Executor = None,
+    ):
+        """Supports initializing the ParallelTokenizer class with the Tokenizer subclass to
+        tokenize with, and optionally the number of worker processes, which defaults to the
+        number of processors, the approximate number of characters in each range of text,
+        and an existing executor to submit the ranges to rather than creating a pool."""
+
+        if not isinstance(tokenizer, type):
+            raise TypeError(
+                "The 'tokenizer' argument must reference a Tokenizer subclass!"
+            )
+        elif not issubclass(tokenizer, Tokenizer):
+            raise TypeError(
+                "The 'tokenizer' argument must reference a Tokenizer subclass!"
+            )
+
+        if (
+            tokenizer._boundary is None
+            and tokenizer.boundary.__func__ is Tokenizer.boundary.__func__
+        ):
+            raise TokenizerError(
+                f"The {tokenizer.__name__} class must declare the boundaries at which its text can be split, via the 'register_boundary()' class method!"
+            )
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        elif not (isinstance(workers, int) and workers >= 1):
+            raise TypeError(
+                "The 'workers' argument, if specified, must have a positive integer value!"
+            )
+
+        if not (isinstance(chunk, int) and chunk >= 1):
+            raise TypeError("The 'chunk' argument must have a positive integer value!")
+
+        if executor is None:
+            pass
+        elif not isinstance(executor, Executor):
+            raise TypeError(
+                "The 'executor' argument, if specified, must reference an Executor class instance!"
+            )
+
+        self._tokenizer = tokenizer
+        self._workers = workers
+        self._chunk = chunk
+        self._executor = executor
+
+    def __enter__(self) -> ParallelTokenizer:
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    @property
+    def tokenizer(self) -> type[Tokenizer]:
+        """Returns the Tokenizer subclass used to tokenize each range of the text."""
+
+        return self._tokenizer
+
+    @property
+    def workers(self) -> int:
+        """Returns the number of worker processes to tokenize the ranges of text in."""
+
+        return self._workers
+
+    @property
+    def chunk(self) -> int:
+        """Returns the approximate number of characters in each range of the text."""
+
+        return self._chunk
+
+    def close(self):
+        """Shuts down the pool of worker processes, if one was created by this instance."""
+
+        if self._owned is True:
+            self._executor.shutdown()
+            self._executor = None
+            self._owned = False
+
+    def split(self, text: str) -> list[tuple[int, int]]:
+        """Returns the (start, end) offsets of the ranges that the text is split into, with
+        each range, other than the last, ending at the first safe boundary found after the
+        chunk size is reached."""
+
+        if not isinstance(text, str):
+            raise TypeError("The 'text' argument must have a string value!")
+
+        ranges: list[tuple[int, int]] = []
+
+        start: int = 0
+        length: int = len(text)
+
+        while start < length:
+            if (index := start + self._chunk) >= length:
+                end: int = length
+            elif (end := self._tokenizer.boundary(text, index)) is None:
+                end: int = length
+            elif not start < end <= length:
+                raise TokenizerError(
+                    f"The {self._tokenizer.__name__} class returned an invalid boundary, {end}, for the index, {index}!"
+                )
+
+            ranges.append((start, end))
+
+            start = end
+
+        return ranges
+
+    def tokenize(
+        self,
+        text: str = None,
+        file: str = None,
+        encoding: str = None,
+        errors: str = None,
+    ) -> Tokenizer:
+        """Tokenizes the provided text string or file contents, decoded as per the optional
+        'encoding' and 'errors' arguments, across the worker processes, and returns an
+        instance of the Tokenizer subclass holding the tokens of the whole of the text.
+        """
+
+        if text is None and file is None:
+            raise TokenizerError(
+                "The ParallelTokenizer must be given either a text string or a valid file path!"
+            )
+        elif not (text is None or file is None):
+            raise TokenizerError(
+                "The 'text' and 'file' arguments cannot both be specified!"
+            )
+
+        if text is None:
+            pass
+        elif not isinstance(text, str):
+            raise TypeError("The 'text' argument must have a string value!")
+
+        arguments: dict[str, str] = {}
+
+        if encoding is not None:
+            arguments["encoding"] = encoding
+
+        if errors is not None:
+            arguments["errors"] = errors
+
+        subclass: type[Tokenizer] = self._tokenizer
+
+        lexer: Lexer = subclass._lexer_subclass(text=text, file=file, **arguments)
+
+        if lexer.locatable is False:
+            raise TokenizerError(
+                f"The {self.__class__.__name__} requires a Lexer that can locate any position, which the {lexer.__class__.__name__} cannot!"
+            )
+
+        text: str = lexer.text
+
+        ranges: list[tuple[int, int]] = self.split(text)
+
+        if len(ranges) <= 1 or self._workers == 1:
+            return subclass(lexer=lexer)
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._workers)
+            self._owned = True
+
+        tokenizer: Tokenizer = subclass.__new__(subclass)
+        tokenizer._setup(lexer)
+
+        # The ranges are submitted via the '_process()' function, which holds no more
+        # than two ranges per worker in flight, so that the copies of the ranges of the
+        # text, and their results, are not all held in memory at once
+        results: Iterator[tuple | TokenizerError] = _process(
+            subclass,
+            (text[start:end] for start, end in ranges),
+            self._executor,
+            self._workers,
+            1,
+            True,
+            _tokenize_ranges,
+            _tokenize_ranges,
+            None,
+        )
+
+        try:
+            for (start, end), result in zip(ranges, results):
+                if isinstance(result, TokenizerError):
+                    position = lexer.locate(start)
+
+                    raise TokenizerError(
+                        f"Failed to tokenize the range of the text starting at line {position.line}, column {position.column}: {result}"
+                    ) from result
+
+                _merge(tokenizer, start, *result)
+        finally:
+            results.close()
+
+        return tokenizer
+
+
+def _merge(
+    tokenizer: Tokenizer,
+    offset: int,
+    names: dict[int, str | Type],
+    typeids: array,
+    starts: array,
+    lengths: array,
+    levels: array,
+    texts: dict[int, str],
+    context: str | Context,
+    level: int,
+):
+    """Appends the tokens of a range of the text, as returned by a worker process, or as
+    held by a cache, to the tokens of the Tokenizer, shifting their offsets by the start
+    of the range."""
+
+    # The type identifiers of a worker are assigned by the TypeTable of the worker process,
+    # so each is mapped back to the Type option of the same name in this process, unless
+    # the types have already been resolved, as for the tokens held by a TokenCache
+    types: dict[int, Type] = {
+        typeid: name if isinstance(name, Type) else getattr(Type, name)
+        for typeid, name in names.items()
+    }
+
+    if offset > 0:
+        starts = array("q", [start + offset for start in starts])
+
+    tokens: list[Token] | TokenStore = tokenizer._tokens
+
+    if isinstance(tokens, TokenStore):
+        identifiers: dict[int, int] = {
+            typeid: TypeTable.typeid(type) for typeid, type in types.items()
+        }
+
+        if any(typeid != identifier for typeid, identifier in identifiers.items()):
+            typeids = array("H", [identifiers[typeid] for typeid in typeids])
+
+        tokens.typeids.extend(typeids)
+        tokens.starts.extend(starts)
+        tokens.lengths.extend(lengths)
+        tokens.levels.extend(levels)
+    else:
+        create: Callable = Token._create
+
+        merged: list[Token] = [
+            create(tokenizer, types[typeid], start, start + length, None, level)
+            for typeid, start, length, level in zip(typeids, starts, lengths, levels)
+        ]
+
+        # Tokens whose text differs from the source text at their offset keep the text
+        for index, text in texts.items():
+            merged[index]._text = text
+
+        if interned := tokenizer._interned:
+            intern: Callable = tokenizer.intern
+
+            for token in merged:
+                if (interned >> token.type.id) & 1:
+                    token._text = intern(token.text)
+
+        tokens.extend(merged)
+
+    tokenizer._length += len(starts)
+    tokenizer._context = (
+        context if isinstance(context, Context) else getattr(Context, context)
+    )
+    tokenizer._level = level
+
+
+def _tokenize(subclass: type[Tokenizer], text: str) -> tuple | TokenizerError:
+    """Tokenizes a range of text in a worker process via the Tokenizer subclass, returning
+    the compact form of its tokens, as per the '_compact()' function; a TokenizerError is
+    returned rather than raised, so that the range it was raised for can be reported."""
+
+    try:
+        tokenizer: Tokenizer = subclass._create(text)
+        tokenizer._pull()
+    except TokenizerError as exception:
+        return exception
+
+    return _compact(tokenizer)
+
+
+def _tokenize_ranges(
+    subclass: type[Tokenizer], texts: list[str]
+) -> list[tuple | TokenizerError]:
+    """Tokenizes each of the ranges of text submitted together, as per '_tokenize()'."""
+
+    return [_tokenize(subclass, text) for text in texts]
+
+
+def _compact(tokenizer: Tokenizer, resolved: bool = False) -> tuple:
+    """Returns the tokens of the Tokenizer in a compact form, as arrays of their type
+    identifiers, offsets, lengths and levels, along with the names of the types, any token
+    text that differs from the source text, and the final context and level, which may be
+    passed between processes, or held by a cache, and later merged into a Tokenizer; if
+    the 'resolved' argument is True, the Type and Context options are held rather than
+    their names, for use within the same process, saving looking up the names again."""
+
+    tokens: list[Token] | TokenStore = tokenizer._tokens
+    texts: dict[int, str] = {}
+
+    if isinstance(tokens, TokenStore):
+        # The arrays are copied, as the arrays of the store change with any later edits
+        typeids: array = tokens.typeids[:]
+        starts: array = tokens.starts[:]
+        lengths: array = tokens.lengths[:]
+        levels: array = tokens.levels[:]
+    else:
+        text: str = tokenizer._lexer.text
+
+        typeids: array = array("H", [token.type.id for token in tokens])
+        starts: array = array("q", [token.index for token in tokens])
+        lengths: array = array("L", [token.length for token in tokens])
+        levels: array = array("L", [token.level for token in tokens])
+
+        for index, token in enumerate(tokens):
+            if (string := token._text) is not None and not text.startswith(
+                string, starts[index]
+            ):
+                texts[index] = string
+
+    if resolved is True:
+        names: dict[int, Type] = {
+            typeid: TypeTable.type(typeid) for typeid in set(typeids)
+        }
+    else:
+        names: dict[int, str] = {
+            typeid: TypeTable.type(typeid).name for typeid in set(typeids)
+        }
+
+    return (
+        names,
+        typeids,
+        starts,
+        lengths,
+        levels,
+        texts,
+        tokenizer.context if resolved is True else tokenizer.context.name,
+        tokenizer.level,
+    )
+
+
+def _tokenize_batch(subclass: type[Tokenizer], texts: list[str]) -> list[Tokenizer]:
+    """Tokenizes each of the texts of a batch via the Tokenizer subclass, in the calling
+    process or in a worker thread, running any generator-based 'parse()' method through
+    to its completion so that the work happens in the worker rather than on access."""
+
+    tokenizers: list[Tokenizer] = []
+
+    for text in texts:
+        tokenizer: Tokenizer = subclass._create(text)
+        tokenizer._pull()
+
+        tokenizers.append(tokenizer)
+
+    return tokenizers
+
+
+def _tokenize_remote(subclass: type[Tokenizer], texts: list[str]) -> list[tuple]:
+    """Tokenizes each of the texts of a batch in a worker process, returning the compact
+    form of the tokens of each text, as per the '_tokenize()' function."""
+
+    return [_tokenize(subclass, text) for text in texts]
+
+
+def _tokenize_finish(
+    subclass: type[Tokenizer], text: str, result: tuple | TokenizerError
+) -> Tokenizer:
+    """Assembles a Tokenizer for the text in the calling process from the compact form
+    of its tokens returned by a worker process, raising any TokenizerError returned."""
+
+    if isinstance(result, TokenizerError):
+        raise result
+
+    tokenizer: Tokenizer = subclass.__new__(subclass)
+    tokenizer._setup(subclass._create_lexer(text))
+
+    _merge(tokenizer, 0, *result)
+
+    return tokenizer
+
+
+def _parse_batch(subclass: type, texts: list[str]) -> list[object]:
+    """Parses each of the texts of a batch via the Parser subclass, returning the result
+    of the 'parse()' method for each text."""
+
+    return [subclass._create(text).parse() for text in texts]
+
+
+def _dispatch(
+    subclass: type,
+    texts: Iterable[str],
+    executor: Executor | str | None,
+    workers: int | None,
+    batch: int,
+    ordered: bool,
+    local: Callable[[type, list[str]], list],
+    remote: Callable[[type, list[str]], list] = None,
+    finish: Callable[[type, str, object], object] = None,
+) -> Iterator[object | tuple[int, object]]:
+    """Processes the texts in batches, via the 'local' function in the calling process or
+    in a pool of worker threads, or via the 'remote' function in a pool of worker processes,
+    with the 'finish' function, if any, completing each result in the calling process. The
+    results are yielded in the order of the texts, or if the 'ordered' argument is False,
+    as (index, result) tuples as each batch completes. No more than two batches per worker
+    are held in flight, so the texts may be provided by an unbounded iterable."""
+
+    if not isinstance(texts, Iterable) or isinstance(texts, (str, bytes)):
+        raise TypeError("The 'texts' argument must reference an iterable of strings!")
+
+    if executor is None or isinstance(executor, Executor):
+        pass
+    elif not executor in ("thread", "process"):
+        raise TypeError(
+            "The 'executor' argument, if specified, must reference an Executor class instance, or be 'thread' or 'process'!"
+        )
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif not (isinstance(workers, int) and workers >= 1):
+        raise TypeError(
+            "The 'workers' argument, if specified, must have a positive integer value!"
+        )
+
+    if not (isinstance(batch, int) and batch >= 1):
+        raise TypeError("The 'batch' argument must have a positive integer value!")
+
+    if not isinstance(ordered, bool):
+        raise TypeError("The 'ordered' argument must have a boolean value!")
+
+    return _process(
+        subclass, iter(texts), executor, workers, batch, ordered, local, remote, finish
+    )
+
+
+def _process(
+    subclass: type,
+    iterator: Iterator[str],
+    executor: Executor | str | None,
+    workers: int,
+    batch: int,
+    ordered: bool,
+    local: Callable[[type, list[str]], list],
+    remote: Callable[[type, list[str]], list] | None,
+    finish: Callable[[type, str, object], object] | None,
+) -> Iterator[object | tuple[int, object]]:
+    """Processes the texts on behalf of the '_dispatch()' function, which validates the
+    arguments up front, as the processing only starts when the first result is requested.
+    """
+
+    if executor is None:
+        index: int = 0
+
+        while items := list(islice(iterator, batch)):
+            for result in local(subclass, items):
+                yield result if ordered else (index, result)
+
+                index += 1
+
+        return
+
+    owned: bool = False
+
+    if executor == "thread":
+        executor = ThreadPoolExecutor(max_workers=workers)
+        owned = True
+    elif executor == "process":
+        executor = ProcessPoolExecutor(max_workers=workers)
+        owned = True
+
+    if isinstance(executor, ProcessPoolExecutor) and remote is not None:
+        function: Callable = remote
+    else:
+        function: Callable = local
+        finish = None
+
+    pending: deque[tuple[int, list[str], Future]] = deque()
+    submitted: int = 0
+
+    def submit() -> bool:
+        nonlocal submitted
+
+        if not (items := list(islice(iterator, batch))):
+            return False
+
+        pending.append((submitted, items, executor.submit(function, subclass, items)))
+
+        submitted += len(items)
+
+        return True
+
+    try:
+        while len(pending) < workers * 2 and submit():
+            pass
+
+        while pending:
+            if ordered:
+                start, items, future = pending.popleft()
+            else:
+                wait([future for _, _, future in pending], return_when=FIRST_COMPLETED)
+
+                for entry in pending:
+                    if entry[2].done():
+                        break
+
+                pending.remove(entry)
+
+                start, items, future = entry
+
+            results: list = future.result()
+
+            submit()
+
+            for index, (text, result) in enumerate(zip(items, results), start):
+                if finish is not None:
+                    result = finish(subclass, text, result)
+
+                yield result if ordered else (index, result)
+    finally:
+        for _, _, future in pending:
+            future.cancel()
+
+        if owned is True:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,369 @@
+from __future__ import annotations
+
+from lexographer.logging import logger
+from lexographer.enumerations import Context, Type
+from lexographer.exceptions import TokenizerError
+from lexographer.tokenizer import Tokenizer
+from lexographer.tokenizer.token import Token
+
+from collections.abc import Generator, Iterator
+
+import re
+
+logger = logger.getChild(__name__)
+
+# The escapes that Python reads as octal escapes rather than as numbered backreferences
+_OCTAL: re.Pattern = re.compile(r"\\(?:[0-7]{3}|0[0-7]{0,2})")
+
+# The numbered backreferences, of one or two digits, outside of character classes
+_BACKREFERENCE: re.Pattern = re.compile(r"\\([1-9][0-9]?)")
+
+# The group syntax that defines or refers to a group by name, or refers to a group by
+# number within a conditional pattern
+_REFERENCE: re.Pattern = re.compile(r"\(\?(?:P<(\w+)>|P=(\w+)\)|\((\w+)\))")
+
+
+def _embed(pattern: str, index: int, group: int) -> str:
+    """Returns the pattern of the rule at the specified index wrapped in a uniquely named
+    group, for embedding in a master pattern, where the wrapping group is numbered by the
+    'group' argument; as the groups of the pattern are numbered after the wrapping group
+    within the master pattern, any numbered backreferences are offset accordingly, and
+    any named groups, and references to them, are prefixed with the name of the wrapping
+    group, so that the names do not clash with those of the groups of other rules."""
+
+    output: list[str] = []
+    within: bool = False
+    offset: int = 0
+
+    while offset < len(pattern):
+        character: str = pattern[offset]
+
+        if character == "\\":
+            if within is False and not _OCTAL.match(pattern, offset):
+                if match := _BACKREFERENCE.match(pattern, offset):
+                    if (number := group + int(match.group(1))) > 99:
+                        raise TokenizerError(
+                            f"The pattern, {pattern!r}, holds a backreference that cannot be numbered within the master pattern, as it would refer to group {number}!"
+                        )
+
+                    output.append(f"(?:\\{number})")
+                    offset = match.end()
+
+                    continue
+
+            output.append(pattern[offset : offset + 2])
+            offset += 2
+        elif within is True:
+            within = character != "]"
+            output.append(character)
+            offset += 1
+        elif character == "[":
+            # A closing bracket at the start of a character class is a literal member
+            end: int = offset + 1
+
+            if pattern[end : end + 1] == "^":
+                end += 1
+
+            if pattern[end : end + 1] == "]":
+                end += 1
+
+            within = True
+            output.append(pattern[offset:end])
+            offset = end
+        elif character == "(" and (match := _REFERENCE.match(pattern, offset)):
+            defined, referenced, conditional = match.groups()
+
+            if defined is not None:
+                output.append(f"(?P<_r{index}_{defined}>")
+            elif referenced is not None:
+                output.append(f"(?P=_r{index}_{referenced})")
+            elif conditional.isdigit():
+                output.append(f"(?({group + int(conditional)})")
+            else:
+                output.append(f"(?(_r{index}_{conditional})")
+
+            offset = match.end()
+        else:
+            output.append(character)
+            offset += 1
+
+    return f"(?P<_r{index}>{''.join(output)})"
+
+
+class Rule(object):
+    """The Rule class describes a lexical rule for a RuleTokenizer subclass, associating a
+    token type with the regular expression pattern, or the literal text, that matches the
+    tokens of that type. Rules with a higher priority are tried before those with a lower
+    priority, and rules sharing a priority are tried in the order they were declared; the
+    tokens matched by rules marked to be skipped, such as those for whitespace or comments,
+    are consumed but are not emitted."""
+
+    _type: Type = None
+    _pattern: str = None
+    _priority: int = None
+    _skip: bool = None
+
+    def __init__(
+        self,
+        type: Type,
+        pattern: str,
+        priority: int = 0,
+        skip: bool = False,
+        literal: bool = False,
+    ):
+        """Initialize the new Rule class instance with the specified values; if the
+        'literal' argument is set to True, the pattern is matched as literal text."""
+
+        if not isinstance(type, Type):
+            raise TypeError(
+                "The 'type' argument must reference a Type enumeration class option!"
+            )
+
+        if not isinstance(pattern, str):
+            raise TypeError("The 'pattern' argument must have a string value!")
+        elif len(pattern) == 0:
+            raise ValueError(
+                "The 'pattern' argument must have a non-empty string value!"
+            )
+
+        if not isinstance(priority, int):
+            raise TypeError("The 'priority' argument must have an integer value!")
+
+        if not isinstance(skip, bool):
+            raise TypeError("The 'skip' argument must have a boolean value!")
+
+        if not isinstance(literal, bool):
+            raise TypeError("The 'literal' argument must have a boolean value!")
+
+        if literal is True:
+            pattern = re.escape(pattern)
+
+        try:
+            compiled: re.Pattern = re.compile(pattern)
+        except re.error as exception:
+            raise TokenizerError(
+                f"The 'pattern' argument, {pattern!r}, is not a valid regular expression; {exception}!"
+            ) from exception
+
+        # A pattern that matches the empty string would never advance through the text
+        if compiled.match("") is not None:
+            raise TokenizerError(
+                f"The 'pattern' argument, {pattern!r}, must not match the empty string!"
+            )
+
+        self._type = type
+        self._pattern = pattern
+        self._priority = priority
+        self._skip = skip
+
+    def __repr__(self) -> str:
+        """Returns a string representation of current Rule instance for debugging."""
+
+        return "<%s(type: %s, pattern: %r, priority: %d, skip: %s)>" % (
+            self.__class__.__name__,
+            self._type.name,
+            self._pattern,
+            self._priority,
+            self._skip,
+        )
+
+    @property
+    def type(self) -> Type:
+        """Returns the token type of the tokens matched by the Rule."""
+
+        return self._type
+
+    @property
+    def pattern(self) -> str:
+        """Returns the regular expression pattern that matches the tokens."""
+
+        return self._pattern
+
+    @property
+    def priority(self) -> int:
+        """Returns the priority of the Rule, where higher priority rules are tried first."""
+
+        return self._priority
+
+    @property
+    def skip(self) -> bool:
+        """Returns whether the tokens matched by the Rule are skipped, or are emitted."""
+
+        return self._skip
+
+
+class RuleTokenizer(Tokenizer):
+    """The RuleTokenizer class is a declarative alternative to hand-writing the 'parse()'
+    method of a Tokenizer subclass; subclasses declare the lexical rules of their grammar
+    in the '_rules' class attribute, as a list of Rule instances or of (type, pattern)
+    tuples, optionally followed by the priority and skip flag, which are compiled once,
+    when the subclass is created, into a single master regular expression, with a named
+    group for each rule; the numbered backreferences and the named groups of each rule's
+    pattern are rewritten so that they remain distinct within the master pattern. The text is then tokenized by the regular expression engine, matching
+    each token in turn, with the matching rule identified via the index of its group, so
+    the per-character work happens in the regular expression engine rather than a loop.
+
+    As the master pattern is an alternation, the first rule to match at a position wins,
+    rather than the longest match, so rules that match prefixes of other rules, such as
+    identifiers and keywords, or the '=' and '==' operators, should be ordered, or given
+    priorities, so that the more specific rules are tried first. A TokenizerError is
+    raised if no rule matches at a position in the text.
+
+    By default the whole of the text is tokenized when the RuleTokenizer is created, but
+    if the '_lazy' class attribute is set to True, the tokens are matched on demand, per
+    the support for generator-based 'parse()' methods provided by the Tokenizer class.
+    """
+
+    _rules: list[Rule | tuple] = []
+    _flags: int = 0
+    _lazy: bool = False
+
+    # The declared rules, ordered from the highest to the lowest priority, as well as the
+    # compiled master pattern, and the rules indexed by the group of the pattern that each
+    # rule's pattern is held within, as compiled for each RuleTokenizer subclass
+    _ordered: tuple[Rule] = ()
+    _pattern: re.Pattern = None
+    _groups: list[Rule | None] = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Compiles the declared rules of each RuleTokenizer subclass when it is created."""
+
+        super().__init_subclass__(**kwargs)
+
+        cls._ordered = cls._order()
+
+        if len(cls._ordered) > 0:
+            cls._compile(cls._ordered)
+
+    @classmethod
+    def _order(cls) -> tuple[Rule]:
+        """Validates the declared rules, returning them ordered from the highest to the
+        lowest priority, and then in the order that they were declared."""
+
+        if not isinstance(cls._rules, (list, tuple)):
+            raise TypeError(
+                f"The '_rules' attribute of the {cls.__name__} class must hold a list of rules!"
+            )
+
+        rules: list[Rule] = []
+
+        for rule in cls._rules:
+            if isinstance(rule, tuple):
+                rule = Rule(*rule)
+            elif not isinstance(rule, Rule):
+                raise TypeError(
+                    f"The '_rules' attribute of the {cls.__name__} class must only hold Rule instances or tuples!"
+                )
+
+            rules.append(rule)
+
+        return tuple(sorted(rules, key=lambda rule: rule.priority, reverse=True))
+
+    @classmethod
+    def _compile(cls, rules: tuple[Rule]):
+        """Compiles the ordered rules into the master pattern."""
+
+        patterns: list[str] = []
+
+        # The group holding each rule's pattern is numbered after the groups held by the
+        # patterns of the preceding rules, and the match's 'lastindex' reports the group
+        # of the matching rule as the enclosing group is the last of its groups to close
+        groups: list[Rule | None] = [None]
+
+        for index, rule in enumerate(rules):
+            patterns.append(_embed(rule.pattern, index, len(groups)))
+
+            groups.append(rule)
+            groups.extend([None] * re.compile(rule.pattern).groups)
+
+        try:
+            cls._pattern = re.compile("|".join(patterns), cls._flags)
+        except re.error as exception:
+            raise TokenizerError(
+                f"The rules of the {cls.__name__} class cannot be compiled into a master pattern; {exception}!"
+            ) from exception
+
+        cls._groups = groups
+
+    @classmethod
+    def _fingerprint(cls) -> list[str]:
+        """Returns the values from which the fingerprint of the subclass is computed, which
+        include the ordered rules and the flags, as the rules may be declared dynamically.
+        """
+
+        return super()._fingerprint() + [repr(cls._ordered), str(cls._flags)]
+
+    def parse(self) -> Generator[None, None, None] | None:
+        """Tokenizes the text via the rules compiled from the declared rules."""
+
+        if len(self._ordered) == 0:
+            raise TokenizerError(
+                f"The {self.__class__.__name__} class must declare one or more rules!"
+            )
+
+        if self.lexer.locatable is False:
+            raise TokenizerError(
+                f"The {self.__class__.__name__} requires a Lexer that can locate any position, which the {self.lexer.__class__.__name__} cannot!"
+            )
+
+        if self._lazy is True:
+            return self._scan()
+
+        self.context = Context.Start
+
+        self.emit_many(
+            [
+                (rule.type, start, end)
+                for rule, start, end in self._spans()
+                if rule.skip is False
+            ]
+        )
+
+        self.context = Context.Finish
+
+    def _scan(self) -> Generator[None, None, None]:
+        """Tokenizes the text on demand, yielding after each token is emitted."""
+
+        self.context = Context.Start
+
+        for rule, start, end in self._spans():
+            if rule.skip is False:
+                self.emit(rule.type, start, end)
+
+                yield None
+
+        self.context = Context.Finish
+
+    def _relex(self, offset: int) -> Iterator[Token]:
+        """Yields the tokens of the text from the specified offset, as needed by the
+        'apply_edit()' method, matching only as many tokens as are requested."""
+
+        level: int = self._level
+
+        for rule, start, end in self._spans(offset):
+            if rule.skip is False:
+                yield Token._create(self, rule.type, start, end, None, level)
+
+    def _spans(self, offset: int = 0) -> Generator[tuple[Rule, int, int], None, None]:
+        """Yields the rule matching each successive token through the text, from the
+        specified offset, along with the token's start and end offsets, raising a
+        TokenizerError if no rule matches at a position before the end of the text."""
+
+        text: str = self.lexer.text
+        groups: list[Rule | None] = self._groups
+        end: int = offset
+
+        for match in iter(self._pattern.scanner(text, offset).match, None):
+            yield (groups[match.lastindex], match.start(), end := match.end())
+
+        if end < len(text):
+            self._unmatched(end)
+
+    def _unmatched(self, index: int):
+        """Raises a TokenizerError noting the position at which no rule matches."""
+
+        position = self.lexer.locate(index)
+
+        raise TokenizerError(
+            f"No rule matches the text, {self.lexer.text[index:index + 16]!r}, at line {position.line}, column {position.column}!"
+        )
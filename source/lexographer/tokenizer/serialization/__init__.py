@@ -0,0 +1,641 @@
+from __future__ import annotations
+
+from lexographer.logging import logger
+from lexographer.exceptions import TokenizerError
+
+from array import array
+from collections.abc import Iterable
+from itertools import accumulate, chain, repeat
+from operator import add, sub
+
+import mmap
+import struct
+import sys
+
+logger = logger.getChild(__name__)
+
+# The magic number that each token file starts with
+_MAGIC: bytes = b"LXTK"
+
+# The flags marking whether a token file holds the source text, and whether its columns
+# of start offsets, lengths and levels are delta and variable-length encoded
+_SOURCE: int = 0x01
+_PACKED: int = 0x02
+
+# The fixed-size header: the magic number, the version, the flags, the widths in bytes of
+# the type identifiers, start offsets, lengths and levels, two reserved bytes, the number
+# of tokens, and the lengths in bytes of the six sections that follow the header
+_HEADER: struct.Struct = struct.Struct("<4sBBBBBBHQ6Q")
+
+# The typecodes of the arrays that the columns are decoded into, by signedness and width
+_SIGNED: dict[int, str] = {array(code).itemsize: code for code in "qlih"}
+_UNSIGNED: dict[int, str] = {array(code).itemsize: code for code in "QLIHB"}
+
+
+def _align(offset: int) -> int:
+    """Returns the offset rounded up to the next multiple of eight bytes."""
+
+    return (offset + 7) & ~7
+
+
+def _varint(value: int) -> bytes:
+    """Returns the unsigned integer encoded as a variable-length integer, holding seven
+    bits per byte, least significant first, with the high bit set on all but the last.
+    """
+
+    encoded: bytearray = bytearray()
+
+    while value >= 0x80:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+
+    encoded.append(value)
+
+    return bytes(encoded)
+
+
+def _string(value: str) -> bytes:
+    """Returns the string encoded as UTF-8 bytes, prefixed by their length as a varint."""
+
+    encoded: bytes = value.encode("utf-8", "surrogatepass")
+
+    return _varint(len(encoded)) + encoded
+
+
+def _encode(values: Iterable[int]) -> bytes:
+    """Returns the unsigned integers encoded as consecutive variable-length integers; as
+    most values are small, values that all fit within a single byte are encoded at once.
+    """
+
+    values: list[int] = list(values)
+
+    if len(values) == 0 or max(values) < 0x80:
+        return bytes(values)
+
+    encoded: bytearray = bytearray()
+
+    append: callable = encoded.append
+
+    for value in values:
+        while value >= 0x80:
+            append((value & 0x7F) | 0x80)
+            value >>= 7
+
+        append(value)
+
+    return bytes(encoded)
+
+
+def _decode(data: memoryview, count: int) -> Iterable[int]:
+    """Returns the specified number of unsigned integers decoded from the consecutive
+    variable-length integers; if there are as many bytes as integers, each integer was
+    encoded in a single byte, so the bytes are the integers."""
+
+    if len(data) == count:
+        return data
+
+    values: list[int] = []
+
+    value: int = 0
+    shift: int = 0
+
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = shift = 0
+
+    if shift > 0 or len(values) != count:
+        raise TokenizerError("The token file holds invalid variable-length integers!")
+
+    return values
+
+
+def _read(data: memoryview, offset: int) -> tuple[int, int]:
+    """Returns the variable-length integer at the offset, and the offset following it."""
+
+    value: int = 0
+    shift: int = 0
+
+    while True:
+        if offset >= len(data):
+            raise TokenizerError("The token file is truncated!")
+
+        byte: int = data[offset]
+
+        offset += 1
+
+        value |= (byte & 0x7F) << shift
+
+        if not byte & 0x80:
+            return (value, offset)
+
+        shift += 7
+
+
+def _column(typecode: str, signed: bool, width: int, data: memoryview) -> array:
+    """Returns the fixed-width little-endian integers as an array of the typecode, copying
+    the bytes directly if the array has the same width, or otherwise converting them."""
+
+    values: array = array(typecode)
+
+    if values.itemsize == width:
+        values.frombytes(data)
+
+        if sys.byteorder == "big":
+            values.byteswap()
+    else:
+        values = array(
+            typecode,
+            _column((_SIGNED if signed else _UNSIGNED)[width], signed, width, data),
+        )
+
+    return values
+
+
+def _bytes(values: array) -> bytes:
+    """Returns the bytes of the array in little-endian byte order."""
+
+    if sys.byteorder == "big":
+        values = values[:]
+        values.byteswap()
+
+    return values.tobytes()
+
+
+class TokenFile(object):
+    """The TokenFile class reads and writes the compact binary format for the tokens of a
+    tokenized text, as used by the 'dump()' and 'load()' methods of the Tokenizer class and
+    by the DiskTokenCache class. The format is little-endian, and consists of a fixed-size
+    header, holding a magic number, the version, the flags and column widths, the number of
+    tokens, and the lengths of the six sections that follow the header, each starting on
+    an eight byte boundary: the metadata, holding the table of the names of the types of
+    the tokens, the final context and level, the text of any tokens whose text differs from
+    the source text, and any string attributes; the type identifiers of the tokens, as
+    indices into the table of names; the start offsets, lengths and levels of the tokens;
+    and optionally the source text, encoded as UTF-8.
+
+    The start offsets, lengths and levels are either held as fixed-width integers, which
+    can be read at the speed of copying memory, and which support reading any token of a
+    memory-mapped file without decoding the others, or if packed, with each start offset
+    held as the signed difference from the end of the previous token, and each value held
+    as a variable-length integer, which typically needs a single byte per value."""
+
+    _version: int = 1
+    _data: memoryview = None
+    _mapping: mmap.mmap = None
+    _flags: int = 0
+    _widths: tuple[int, int, int, int] = None
+    _count: int = 0
+    _sections: list[memoryview] = None
+    _names: tuple[str] = None
+    _context: str = None
+    _level: int = 0
+    _texts: dict[int, str] = None
+    _attributes: dict[str, str] = None
+    _columns: tuple[array, array, array, array] = None
+
+    def __init__(self, data: bytes | bytearray | memoryview | mmap.mmap):
+        """Supports initializing the TokenFile class with the bytes of a token file, which
+        are read in place, without being copied, so may be a memory-mapped file."""
+
+        if not isinstance(data, (bytes, bytearray, memoryview, mmap.mmap)):
+            raise TypeError(
+                "The 'data' argument must have a bytes, bytearray, memoryview or mmap value!"
+            )
+
+        self._data = memoryview(data).cast("B")
+
+        try:
+            self._setup()
+        except BaseException:
+            # The views onto the data are released so that any memory mapping may be closed
+            self.close()
+            raise
+
+    def _setup(self):
+        """Parses the header and the metadata, and locates the sections of the token file."""
+
+        if len(self._data) < _HEADER.size:
+            raise TokenizerError("The token file is truncated!")
+
+        values: tuple = _HEADER.unpack_from(self._data)
+
+        magic, version, flags = values[0:3]
+
+        widths: tuple[int] = values[3:7]
+        count: int = values[8]
+        lengths: tuple[int] = values[9:]
+
+        if magic != _MAGIC:
+            raise TokenizerError("The data does not hold a token file!")
+        elif version != self._version:
+            raise TokenizerError(
+                "The token file was created by an incompatible version!"
+            )
+
+        self._flags = flags
+        self._widths = widths
+        self._count = count
+        self._sections = []
+
+        offset: int = _HEADER.size
+
+        for length in lengths:
+            offset = _align(offset)
+
+            if offset + length > len(self._data):
+                raise TokenizerError("The token file is truncated!")
+
+            self._sections.append(self._data[offset : offset + length])
+
+            offset += length
+
+        if not widths[0] in (1, 2) or len(self._sections[1]) != count * widths[0]:
+            raise TokenizerError("The token file holds invalid type identifiers!")
+
+        if not self.packed:
+            for section, width in zip(self._sections[2:5], widths[1:]):
+                if not width in _UNSIGNED or len(section) != count * width:
+                    raise TokenizerError("The token file holds invalid columns!")
+
+        self._parse(self._sections[0])
+
+    def _parse(self, data: memoryview):
+        """Parses the metadata section, holding the table of the names of the types, the
+        final context and level, the texts of the tokens, and the attributes."""
+
+        def string(offset: int) -> tuple[str, int]:
+            length, offset = _read(data, offset)
+
+            if offset + length > len(data):
+                raise TokenizerError("The token file is truncated!")
+
+            return (
+                str(data[offset : offset + length], "utf-8", "surrogatepass"),
+                offset + length,
+            )
+
+        try:
+            names: list[str] = []
+
+            count, offset = _read(data, 0)
+
+            for _ in range(count):
+                name, offset = string(offset)
+                names.append(name)
+
+            self._names = tuple(names)
+
+            self._context, offset = string(offset)
+            self._level, offset = _read(data, offset)
+
+            self._texts = {}
+
+            count, offset = _read(data, offset)
+
+            index: int = 0
+
+            for _ in range(count):
+                delta, offset = _read(data, offset)
+
+                index += delta
+
+                self._texts[index], offset = string(offset)
+
+            self._attributes = {}
+
+            count, offset = _read(data, offset)
+
+            for _ in range(count):
+                key, offset = string(offset)
+
+                self._attributes[key], offset = string(offset)
+        except UnicodeDecodeError as exception:
+            raise TokenizerError(
+                f"The token file holds invalid strings: {exception}!"
+            ) from exception
+
+    @classmethod
+    def open(cls, filepath: str) -> TokenFile:
+        """Returns a TokenFile over the memory-mapped contents of the specified file, which
+        should be closed once it is no longer needed, such as by using the TokenFile as a
+        context manager; the tokens are only read from the file as they are accessed."""
+
+        if not isinstance(filepath, str):
+            raise TypeError("The 'filepath' argument must have a string value!")
+
+        with open(filepath, "rb") as handle:
+            try:
+                mapping: mmap.mmap = mmap.mmap(
+                    handle.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except ValueError as exception:
+                raise TokenizerError("The token file is truncated!") from exception
+
+        try:
+            reader: TokenFile = cls(mapping)
+        except BaseException:
+            mapping.close()
+            raise
+
+        reader._mapping = mapping
+
+        return reader
+
+    def close(self):
+        """Releases the data of the TokenFile, closing the memory mapping, if any."""
+
+        for section in self._sections or []:
+            section.release()
+
+        if self._data is not None:
+            self._data.release()
+
+        if self._mapping is not None:
+            self._mapping.close()
+
+        self._mapping = None
+
+    def __enter__(self) -> TokenFile:
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> tuple[str, int, int, int]:
+        """Returns the type name, start offset, length and level of the token at the index;
+        for a file that is not packed, only the token at the index is read."""
+
+        if not isinstance(index, int):
+            raise TypeError("The 'index' argument must have an integer value!")
+
+        if index < 0:
+            index += self._count
+
+        if not 0 <= index < self._count:
+            raise IndexError("The 'index' argument is out of range!")
+
+        if self.packed:
+            typeids, starts, lengths, levels = self.columns()
+
+            return (
+                self._names[typeids[index]],
+                starts[index],
+                lengths[index],
+                levels[index],
+            )
+
+        values: list[int] = [
+            int.from_bytes(
+                section[index * width : (index + 1) * width],
+                "little",
+                signed=(column == 1),
+            )
+            for column, (section, width) in enumerate(
+                zip(self._sections[1:5], self._widths)
+            )
+        ]
+
+        return (self._names[values[0]], *values[1:])
+
+    def __repr__(self) -> str:
+        """Returns a string representation of current TokenFile instance for debugging."""
+
+        return "<%s(version: %d, count: %d, packed: %s, source: %s)>" % (
+            self.__class__.__name__,
+            self._version,
+            self._count,
+            self.packed,
+            self._flags & _SOURCE > 0,
+        )
+
+    @property
+    def version(self) -> int:
+        """Returns the version of the format of the token file."""
+
+        return self._version
+
+    @property
+    def count(self) -> int:
+        """Returns the number of tokens held by the token file."""
+
+        return self._count
+
+    @property
+    def packed(self) -> bool:
+        """Returns whether the columns of the token file are delta and varint encoded."""
+
+        return self._flags & _PACKED > 0
+
+    @property
+    def names(self) -> tuple[str]:
+        """Returns the table of the names of the types, indexed by type identifier."""
+
+        return self._names
+
+    @property
+    def context(self) -> str:
+        """Returns the name of the final context of the tokenization."""
+
+        return self._context
+
+    @property
+    def level(self) -> int:
+        """Returns the final level of the tokenization."""
+
+        return self._level
+
+    @property
+    def texts(self) -> dict[int, str]:
+        """Returns the texts of the tokens whose text differs from the source text."""
+
+        return self._texts
+
+    @property
+    def attributes(self) -> dict[str, str]:
+        """Returns the string attributes recorded when the token file was created."""
+
+        return self._attributes
+
+    @property
+    def source(self) -> str | None:
+        """Returns the source text held by the token file, if any, or otherwise None."""
+
+        if self._flags & _SOURCE:
+            return str(self._sections[5], "utf-8", "surrogatepass")
+
+    def columns(self) -> tuple[array, array, array, array]:
+        """Returns the type identifiers, start offsets, lengths and levels of the tokens as
+        arrays, of the same typecodes as those of the TokenStore class, which are decoded
+        on first use, and which must not be modified."""
+
+        if self._columns is None:
+            typeids, starts, lengths, levels = self._sections[1:5]
+
+            if self._widths[0] == 1:
+                typeids: array = array("H", typeids)
+            else:
+                typeids: array = _column("H", False, 2, typeids)
+
+            if self.packed:
+                lengths: array = array("L", _decode(lengths, self._count))
+                levels: array = array("L", _decode(levels, self._count))
+
+                # Each start offset is held as the zigzag encoded difference from the end
+                # of the previous token, which is usually zero, as tokens are contiguous
+                if any(starts):
+                    gaps: list[int] = [
+                        -((value + 1) >> 1) if value & 1 else value >> 1
+                        for value in _decode(starts, self._count)
+                    ]
+                else:
+                    gaps: Iterable[int] = repeat(0)
+
+                starts: array = array(
+                    "q", map(sub, accumulate(map(add, gaps, lengths)), lengths)
+                )
+
+                if not (len(starts) == len(lengths) == len(levels) == self._count):
+                    raise TokenizerError("The token file holds invalid columns!")
+            else:
+                starts: array = _column("q", True, self._widths[1], starts)
+                lengths: array = _column("L", False, self._widths[2], lengths)
+                levels: array = _column("L", False, self._widths[3], levels)
+
+            if self._count > 0 and max(typeids) >= len(self._names):
+                raise TokenizerError("The token file holds invalid type identifiers!")
+
+            self._columns = (typeids, starts, lengths, levels)
+
+        return self._columns
+
+    def result(self) -> tuple:
+        """Returns the tokens in the compact form that can be merged into a Tokenizer, as
+        held by a TokenCache or returned by the worker processes of a ParallelTokenizer.
+        """
+
+        return (
+            dict(enumerate(self._names)),
+            *self.columns(),
+            dict(self._texts),
+            self._context,
+            self._level,
+        )
+
+    @classmethod
+    def dumps(
+        cls,
+        result: tuple,
+        source: str = None,
+        packed: bool = False,
+        attributes: dict[str, str] = None,
+    ) -> bytes:
+        """Returns the bytes of a token file holding the tokens in their compact form, and
+        optionally the source text, with the start offsets, lengths and levels delta and
+        varint encoded if 'packed' is True, and any string attributes, such as those used
+        to validate the tokens before they are used, which are read without the tokens.
+        """
+
+        if not (source is None or isinstance(source, str)):
+            raise TypeError("The 'source' argument must have a string value or None!")
+
+        if not isinstance(packed, bool):
+            raise TypeError("The 'packed' argument must have a boolean value!")
+
+        if attributes is None:
+            attributes = {}
+        elif not (
+            isinstance(attributes, dict)
+            and all(
+                isinstance(key, str) and isinstance(value, str)
+                for key, value in attributes.items()
+            )
+        ):
+            raise TypeError(
+                "The 'attributes' argument must reference a dictionary of strings!"
+            )
+
+        names, typeids, starts, lengths, levels, texts, context, level = result
+
+        # The type identifiers are mapped onto indices into the table of the type names,
+        # as the identifiers assigned by the TypeTable differ between processes
+        indices: dict[int, int] = {typeid: index for index, typeid in enumerate(names)}
+
+        if len(indices) <= 256:
+            identifiers: bytes = bytes(map(indices.__getitem__, typeids))
+        else:
+            identifiers: bytes = _bytes(array("H", map(indices.__getitem__, typeids)))
+
+        metadata: list[bytes] = [_varint(len(names))]
+
+        for name in names.values():
+            metadata.append(_string(name if isinstance(name, str) else name.name))
+
+        metadata.append(_string(context if isinstance(context, str) else context.name))
+        metadata.append(_varint(level))
+        metadata.append(_varint(len(texts)))
+
+        previous: int = 0
+
+        for index in sorted(texts):
+            metadata.append(_varint(index - previous))
+            metadata.append(_string(texts[index]))
+
+            previous = index
+
+        metadata.append(_varint(len(attributes)))
+
+        for key, value in attributes.items():
+            metadata.append(_string(key))
+            metadata.append(_string(value))
+
+        if packed is True:
+            gaps = map(sub, starts, chain((0,), map(add, starts, lengths)))
+
+            columns: list[bytes] = [
+                _encode(gap << 1 if gap >= 0 else (-gap << 1) - 1 for gap in gaps),
+                _encode(lengths),
+                _encode(levels),
+            ]
+
+            widths: list[int] = [0, 0, 0]
+        else:
+            columns: list[bytes] = [_bytes(starts), _bytes(lengths), _bytes(levels)]
+
+            widths: list[int] = [starts.itemsize, lengths.itemsize, levels.itemsize]
+
+        encoded: bytes = source.encode("utf-8", "surrogatepass") if source else b""
+
+        sections: list[bytes] = [b"".join(metadata), identifiers, *columns, encoded]
+
+        flags: int = (_SOURCE if source is not None else 0) | (_PACKED if packed else 0)
+
+        header: bytes = _HEADER.pack(
+            _MAGIC,
+            cls._version,
+            flags,
+            1 if len(indices) <= 256 else 2,
+            *widths,
+            0,
+            len(starts),
+            *[len(section) for section in sections],
+        )
+
+        data: list[bytes] = [header]
+
+        offset: int = len(header)
+
+        for section in sections:
+            data.append(bytes(_align(offset) - offset))
+            data.append(section)
+
+            offset = _align(offset) + len(section)
+
+        return b"".join(data)
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from lexographer.logging import logger
+from lexographer.enumerations import Type, TypeTable
+from lexographer.exceptions import TokenizerError
+from lexographer.tokenizer.token import Token
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+
+logger = logger.getChild(__name__)
+
+
+class TokenStore(Sequence):
+    """The TokenStore class is a columnar alternative to the list of Token instances held
+    by a Tokenizer, which can be registered for a Tokenizer subclass via its class method
+    'register_store()'. Rather than holding a Token instance for each token, the store
+    holds the type identifier, start offset, length and level of each token in parallel
+    arrays, taking a handful of bytes per token, with Token instances being created as
+    lightweight views onto the source text only when the tokens are accessed by index or
+    via iteration. As Token instances are created on demand, accessing the same token
+    twice returns two distinct but equivalent Token instances.
+
+    As the text of each token is recovered from the source text, the TokenStore requires
+    a Lexer that can locate any position, such as a Lexer or FastLexer, and the text of
+    each token added to the store must be the text found at its offset in the source."""
+
+    _tokenizer: object = None
+    _text: str = None
+    _typeids: array = None
+    _starts: array = None
+    _lengths: array = None
+    _levels: array = None
+
+    def __init__(self, tokenizer: object):
+        """Supports initializing the TokenStore class for the specified Tokenizer."""
+
+        from lexographer.tokenizer import Tokenizer
+
+        if not isinstance(tokenizer, Tokenizer):
+            raise TypeError(
+                "The 'tokenizer' argument must reference a Tokenizer class instance!"
+            )
+
+        if tokenizer.lexer.locatable is False:
+            raise TokenizerError(
+                f"The {self.__class__.__name__} requires a Lexer that can locate any position, which the {tokenizer.lexer.__class__.__name__} cannot!"
+            )
+
+        self._tokenizer = tokenizer
+        self._text = tokenizer.lexer.text
+        self._typeids = array("H")
+        self._starts = array("q")
+        self._lengths = array("L")
+        self._levels = array("L")
+
+    def __len__(self) -> int:
+        """Returns the number of tokens held by the TokenStore."""
+
+        return len(self._starts)
+
+    def __getitem__(self, index: int | slice) -> Token | list[Token]:
+        """Returns a Token view of the token at the specified index, or a list of Token
+        views of the tokens within the specified slice."""
+
+        if isinstance(index, slice):
+            return [self._view(index) for index in range(*index.indices(len(self)))]
+
+        if not isinstance(index, int):
+            raise TypeError("The 'index' argument must have an integer or slice value!")
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError(
+                f"The index, {index}, is out of range for this {self.__class__.__name__}!"
+            )
+
+        return self._view(index)
+
+    def __delitem__(self, index: int | slice):
+        """Removes the token at the specified index, or the tokens within the slice."""
+
+        del self._typeids[index]
+        del self._starts[index]
+        del self._lengths[index]
+        del self._levels[index]
+
+    def __iter__(self) -> Iterator[Token]:
+        """Supports iterating over Token views of the tokens held by the TokenStore."""
+
+        for index in range(len(self)):
+            yield self._view(index)
+
+    def _view(self, index: int) -> Token:
+        """Returns a new Token view of the token at the specified valid index."""
+
+        start: int = self._starts[index]
+
+        return Token._create(
+            self._tokenizer,
+            TypeTable.type(self._typeids[index]),
+            start,
+            start + self._lengths[index],
+            None,
+            self._levels[index],
+        )
+
+    @property
+    def typeids(self) -> array:
+        """Returns the array of the type identifiers of the tokens."""
+
+        return self._typeids
+
+    @property
+    def starts(self) -> array:
+        """Returns the array of the start offsets of the tokens."""
+
+        return self._starts
+
+    @property
+    def lengths(self) -> array:
+        """Returns the array of the lengths of the tokens."""
+
+        return self._lengths
+
+    @property
+    def levels(self) -> array:
+        """Returns the array of the levels of the tokens."""
+
+        return self._levels
+
+    def typeid(self, type: Type) -> int:
+        """Returns the type identifier for the specified type, as assigned by the TypeTable
+        class, for use in scans over the array of type identifiers."""
+
+        return TypeTable.typeid(type)
+
+    def append(self, token: Token):
+        """Adds the specified Token to the TokenStore, recording its type, start offset,
+        length and level; the Token instance itself is not retained."""
+
+        start: int = token.index
+
+        # The text of tokens holding a span of the source text need not be checked, nor
+        # sliced from the source text, unlike text specified when the token was created
+        if token._text is None:
+            length: int = token.length
+        elif self._text.startswith(text := token.text, start):
+            length: int = len(text)
+        else:
+            raise TokenizerError(
+                f"The text of the token, {text!r}, does not match the source text at its offset, {start}!"
+            )
+
+        self._typeids.append(TypeTable.typeid(token.type))
+        self._starts.append(start)
+        self._lengths.append(length)
+        self._levels.append(token.level)
+
+    def extend(self, tokens: Iterable[Token]):
+        """Adds each of the specified Tokens to the TokenStore."""
+
+        for token in tokens:
+            self.append(token)
+
+    def splice(self, start: int, stop: int, tokens: list[Token], shift: int = 0):
+        """Replaces the tokens between the specified start and stop indices with the
+        specified Tokens, and shifts the start offsets of the tokens after them by the
+        specified number of characters, as needed after an edit to the source text; as
+        the offsets are shifted right away, the cost of an edit grows with the number of
+        tokens after it, although the offsets are shifted without a Python-level loop.
+
+        The specified Tokens are recorded as they are, so their start offsets must be
+        absolute offsets into the edited source text, rather than offsets relative to
+        the start of the splice, and their levels must be the absolute nesting levels at
+        which they occur in the edited text, rather than levels relative to the token
+        they follow; the shift is only applied to the tokens after the stop index, which
+        retain the offsets and levels recorded before the edit, and never to the Tokens
+        being inserted."""
+
+        store = self.__class__.__new__(self.__class__)
+        store._text = self._text = self._tokenizer.lexer.text
+        store._typeids = array("H")
+        store._starts = array("q")
+        store._lengths = array("L")
+        store._levels = array("L")
+        store.extend(tokens)
+
+        if shift:
+            following: array = self._starts[stop:]
+
+            self._starts[stop:] = array("q", map(shift.__add__, following))
+
+        self._typeids[start:stop] = store._typeids
+        self._starts[start:stop] = store._starts
+        self._lengths[start:stop] = store._lengths
+        self._levels[start:stop] = store._levels
+
+    def clear(self):
+        """Removes all of the tokens from the TokenStore."""
+
+        del self[:]
@@ -2,19 +2,42 @@ from __future__ import annotations
 
 from lexographer.logging import logger
 from lexographer.enumerations import Context, Type
+from lexographer.exceptions import TokenizerError
 from lexographer.lexer import Lexer, Position
 
+from collections.abc import Callable
+
 logger = logger.getChild(__name__)
 
 
 class Token(object):
-    """The Token class represents a lexed token from the provided contents string."""
-
-    _tokenizer: Tokenizer = None
-    _type: Type = None
-    _position: Position = None
-    _text: str = None
-    _level: int = None
+    """The Token class represents a lexed token from the provided contents string. The
+    Token class holds its values in slots rather than an instance dict, so that each of
+    the potentially many Token instances takes up less memory. Tokens created via the
+    Tokenizer's 'emit()' method hold the span of their text within the source text, and
+    only slice their text from the source text on first access. The offsets of tokens
+    following an edit applied via the Tokenizer's 'apply_edit()' method are shifted on
+    their next access, rather than when the edit is applied."""
+
+    __slots__ = (
+        "_tokenizer",
+        "_type",
+        "_position",
+        "_index",
+        "_end",
+        "_text",
+        "_level",
+        "_epoch",
+    )
+
+    _tokenizer: Tokenizer
+    _type: Type
+    _position: Position | None
+    _index: int | None
+    _end: int | None
+    _text: str | None
+    _level: int
+    _epoch: int | None
 
     def __init__(
         self,
@@ -34,6 +57,10 @@ class Token(object):
             )
 
         self._tokenizer = tokenizer
+        self._position = None
+        self._index = None
+        self._end = None
+        self._epoch = tokenizer._epoch
 
         if not isinstance(type, Type):
             raise TypeError(
@@ -52,11 +79,24 @@ class Token(object):
             )
 
         if position is None:
-            self._position = self.lexer.position.copy().adjust(offset=(0 - self.length))
+            lexer: Lexer = self.lexer
+
+            if lexer.locatable is True:
+                # Only the token's start offset is recorded, and its Position is derived
+                # from the Lexer's table of new line offsets on first access, if at all
+                self._index = lexer.index - self.length
+            else:
+                length: int = self.length
+
+                # The token's Position is built directly from the Lexer's cursor position
+                # as Lexers that cannot locate other positions must be queried right away
+                self._position = Position._make(
+                    lexer.index - length, lexer.line, lexer.column - length
+                )
         elif isinstance(position, Position):
             self._position = position
         elif isinstance(position, int):
-            if position >= 1:
+            if position >= 0:
                 self._position = Position(index=position)
             elif position < 0:
                 self._position = self.lexer.position.adjust(position)
@@ -74,6 +114,71 @@ class Token(object):
                 "The 'level' argument, if specified, must have a positive integer value!"
             )
 
+    @classmethod
+    def _create(
+        cls,
+        tokenizer: Tokenizer,
+        type: Type,
+        start: int,
+        end: int,
+        text: str | None,
+        level: int,
+    ) -> Token:
+        """Returns a new Token with the specified values without validating them, for use
+        by trusted callers such as the Tokenizer's 'emit()' method; the Token's Position
+        is derived from the specified start offset on first access, and if no text is
+        specified, the text is sliced from the source text on first access."""
+
+        token: Token = _new(cls)
+        token._tokenizer = tokenizer
+        token._type = type
+        token._position = None
+        token._index = start
+        token._end = end
+        token._text = text
+        token._level = level
+        token._epoch = tokenizer._epoch
+
+        return token
+
+    def _resolve(self):
+        """Shifts the Token's offsets past any edits applied to the source text since the
+        Token's offsets were last current, as recorded in the Tokenizer's log of edits of
+        the offset from which the following text was moved, and by how many characters,
+        and discards any cached Position of a Token that the edits moved past; the offsets
+        of a Token that has been removed from its Tokenizer by an edit are not shifted, as
+        its text and Position were fixed, against the text before the edit, on removal.
+        """
+
+        if (epoch := self._epoch) is None:
+            return
+
+        tokenizer: Tokenizer = self._tokenizer
+
+        if (index := self._index) is None:
+            index = self._position.index
+
+        start: int = index
+
+        # The log of edits is compacted once it grows long, by shifting the offsets of all
+        # of the Tokenizer's tokens, so only a Token that is not held by the Tokenizer, such
+        # as a view onto a TokenStore, may predate the edits remaining in the log
+        if epoch < tokenizer._compacted:
+            raise TokenizerError(
+                "The Token's offsets predate the edits recorded by its Tokenizer, so cannot be shifted; tokens viewed from a TokenStore should be accessed again after edits!"
+            )
+
+        for offset, delta in tokenizer._edits[epoch - tokenizer._compacted :]:
+            if index >= offset:
+                index += delta
+                self._position = None
+
+        if (end := self._end) is not None:
+            self._end = end + index - start
+
+        self._index = index
+        self._epoch = tokenizer._epoch
+
     def __str__(self) -> str:
         """Returns a string representation of current Token instance for debugging."""
 
@@ -121,21 +226,56 @@ class Token(object):
 
     @property
     def position(self) -> Position:
-        """Returns the Token instance's text position within the source text string."""
+        """Returns the Token instance's text position within the source text string, which
+        if not specified during instantiation, is derived on first access and cached."""
+
+        if self._epoch != self._tokenizer._epoch:
+            self._resolve()
+
+        if (position := self._position) is None:
+            position = self._position = self.lexer.locate(self._index)
+
+        return position
 
-        return self._position
+    @property
+    def index(self) -> int:
+        """Returns the Token instance's zero-indexed start offset within the source text."""
+
+        if self._epoch != self._tokenizer._epoch:
+            self._resolve()
+
+        if (index := self._index) is None:
+            index = self._index = self._position.index
+
+        return index
 
     @property
     def length(self) -> int:
         """Returns the Token instance's text length."""
 
-        return len(self._text) if isinstance(self._text, str) else 0
+        if (text := self._text) is None:
+            return self._end - self._index
+
+        return len(text) if isinstance(text, str) else 0
 
     @property
     def text(self) -> str:
-        """Returns the Token instance's text as specified during instantiation."""
+        """Returns the Token instance's text as specified during instantiation, or as
+        sliced from the source text on first access and then cached."""
+
+        if (text := self._text) is None:
+            if self._epoch != self._tokenizer._epoch:
+                self._resolve()
 
-        return self._text
+            text = self._text = self._tokenizer.lexer.text[self._index : self._end]
+
+        return text
+
+    @property
+    def span(self) -> tuple[int, int]:
+        """Returns the start and end offsets of the Token instance's text."""
+
+        return (self.index, self.index + self.length)
 
     @property
     def level(self) -> int:
@@ -162,3 +302,7 @@ class Token(object):
         """Returns the Token instance's context in overridden implementations."""
 
         raise NotImplementedError
+
+
+# The allocation function used to build Token instances without calling the initializer
+_new: Callable[[type], object] = object.__new__
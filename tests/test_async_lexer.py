@@ -0,0 +1,128 @@
+import pytest
+import lexographer
+import asyncio
+
+from lexographer import Context, Type, Token, LexerError, AsyncLexer
+from examples.text import Tokenizer
+
+
+async def chunks(*values: str | bytes, delay: float = 0):
+    """Yields the provided values asynchronously, as if received over a network."""
+
+    for value in values:
+        await asyncio.sleep(delay)
+
+        yield value
+
+
+def test_async_lexer_over_async_iterator():
+    """Test the AsyncLexer class' asynchronous methods over an asynchronous iterator."""
+
+    async def main():
+        lexer = AsyncLexer(stream=chunks("ab", "c\nd", "ef"))
+
+        # Ensure that the AsyncLexer class instance has the expected types
+        assert isinstance(lexer, AsyncLexer)
+        assert isinstance(lexer, lexographer.StreamLexer)
+
+        # Ensure that no text is received until it is needed
+        assert lexer.length == 0
+
+        # Ensure that the text is awaited across chunk boundaries as needed
+        assert await lexer.apeek(offset=1, length=3) == "bc\n"
+        assert await lexer.aread(length=4) == "abc\n"
+        assert lexer.line == 2
+        assert lexer.column == 1
+
+        assert await lexer.alookahead("de") is True
+        assert await lexer.aexpect("def") == "def"
+        assert await lexer.aread() == ""
+        assert lexer.exhausted is True
+
+    asyncio.run(main())
+
+
+def test_async_lexer_over_stream_reader():
+    """Test the AsyncLexer class over an asyncio.StreamReader fed with encoded bytes."""
+
+    async def main():
+        reader = asyncio.StreamReader()
+
+        data: bytes = "ça – va".encode("utf-8")
+
+        # Feed the encoded bytes in single bytes, splitting the multi-byte characters
+        for index in range(len(data)):
+            reader.feed_data(data[index : index + 1])
+
+        reader.feed_eof()
+
+        lexer = AsyncLexer(stream=reader, chunk=1)
+
+        # Ensure that the bytes are decoded incrementally into whole characters
+        assert [character async for character in lexer] == list("ça – va")
+
+    asyncio.run(main())
+
+
+def test_async_lexer_sync_methods_on_event_loop():
+    """Test that the synchronous methods cannot wait for text on the event loop."""
+
+    async def main():
+        lexer = AsyncLexer(stream=chunks("abc"))
+
+        with pytest.raises(LexerError):
+            lexer.read()
+
+        # Once the text has been awaited, the synchronous methods may be used
+        assert await lexer.wait(3) is True
+        assert lexer.read(length=3) == "abc"
+
+    asyncio.run(main())
+
+    # Ensure that the AsyncLexer requires a running event loop
+    with pytest.raises(LexerError):
+        AsyncLexer(stream=chunks("abc"))
+
+    with pytest.raises(TypeError):
+        AsyncLexer(stream="abc")
+
+
+def test_tokenizer_stream(data: callable):
+    """Test asynchronously tokenizing the text received from a stream."""
+
+    text: str = data("sample.txt")
+
+    async def main() -> list[Token]:
+        stream = chunks(
+            *[text[i : i + 5].encode() for i in range(0, len(text), 5)], delay=0.001
+        )
+
+        return [token async for token in Tokenizer.stream(stream, chunk=5, window=5)]
+
+    tokens: list[Token] = asyncio.run(main())
+
+    tokenizer = Tokenizer(text=text)
+
+    # Ensure that the tokens yielded via the stream match those tokenized from the text
+    assert len(tokens) == len(tokenizer) == 18
+
+    for index in range(len(tokenizer)):
+        assert tokens[index].type is tokenizer[index].type
+        assert tokens[index].text == tokenizer[index].text
+        assert tokens[index].position == tokenizer[index].position
+
+
+def test_tokenizer_stream_exception():
+    """Test that exceptions raised while tokenizing are propagated to the consumer."""
+
+    class FailingTokenizer(Tokenizer):
+        def parse(self):
+            self.lexer.read()
+
+            raise lexographer.TokenizerError("Unexpected input!")
+
+    async def main():
+        return [token async for token in FailingTokenizer.stream(chunks("abc"))]
+
+    with pytest.raises(lexographer.TokenizerError):
+        asyncio.run(main())
@@ -0,0 +1,159 @@
+import pytest
+import lexographer
+
+from lexographer import Context, Type, Token, LexerError, BytesLexer
+from examples.text import Tokenizer, Parser
+
+
+def test_bytes_lexer_instantiation():
+    """Test the instantiation of the BytesLexer class with bytes-like values."""
+
+    for value in [b"abc", bytearray(b"abc"), memoryview(b"abc")]:
+        # Create an instance of the BytesLexer class
+        lexer = BytesLexer(text=value)
+
+        # Ensure that the BytesLexer class instance has the expected types
+        assert isinstance(lexer, BytesLexer)
+        assert isinstance(lexer, lexographer.Lexer)
+
+        # Ensure that the text and length are reported as expected
+        assert lexer.text == "abc"
+        assert lexer.length == len(lexer) == 3
+        assert lexer.size == 3
+
+    # Ensure that text strings are rejected as they do not need a BytesLexer
+    with pytest.raises(TypeError):
+        BytesLexer(text="abc")
+
+
+def test_bytes_lexer_multibyte_characters():
+    """Test lexing over bytes holding multi-byte UTF-8 characters."""
+
+    lexer = BytesLexer(text="ça – va\nbién".encode("utf-8"))
+
+    # The length reports the number of characters, rather than the number of bytes
+    assert lexer.length == 12
+
+    # Ensure that reads decode whole characters, advancing the character index and the
+    # byte offset by their respective amounts
+    assert lexer.read(length=2) == "ça"
+    assert lexer.index == 2
+    assert lexer.offset == 3
+
+    # Ensure that look-aheads compare the encoded bytes for both strings and bytes
+    assert lexer.lookahead(" – ") is True
+    assert lexer.lookahead(" – ".encode("utf-8")) is True
+    assert lexer.lookahead("–", offset=1) is True
+    assert lexer.lookahead("-", offset=1) is False
+
+    # Ensure that expect consumes the expected number of characters
+    assert lexer.expect(" – va\nb") == " – va\nb"
+    assert lexer.index == 9
+    assert lexer.offset == 12
+    assert lexer.line == 2
+    assert lexer.column == 2
+
+    assert lexer.peek(length=2) == "ié"
+    assert lexer.peek(offset=-2, length=2) == "\nb"
+
+    # Ensure that pushing back over the new line restores the line and column numbers
+    assert lexer.push(length=4) == "va\nb"
+    assert lexer.line == 1
+    assert lexer.column == 6
+
+    # Ensure that the column counts characters rather than bytes after a new line
+    lexer.read(length=7)
+
+    assert lexer.line == 2
+    assert lexer.column == 5
+
+
+def test_bytes_lexer_without_decoding():
+    """Test lexing over bytes without decoding, returning memoryview slices."""
+
+    data: bytes = b"key=value\nnext"
+
+    lexer = BytesLexer(text=data, decode=False)
+
+    assert lexer.decode is False
+
+    # Ensure that the returned values are memoryview slices of the source bytes
+    assert isinstance(read := lexer.read(length=3), memoryview)
+    assert read == b"key"
+    assert read.obj is data
+
+    assert lexer.expect(b"=") == b"="
+    assert lexer.peek(length=5) == b"value"
+
+    # Ensure that the line and column numbers are tracked without decoding
+    assert lexer.read(length=7) == b"value\nn"
+    assert lexer.line == 2
+    assert lexer.column == 2
+
+    # Ensure that unmatched results are empty memoryview slices rather than strings
+    for result in [
+        lexer.expect(b"?"),
+        lexer.match(rb"\d+"),
+        lexer.peek(length=10),
+        lexer.peek(offset=-20),
+    ]:
+        assert isinstance(result, memoryview)
+        assert result == b""
+
+
+def test_bytes_lexer_tokenizer_and_parser(data: callable):
+    """Test tokenizing and parsing bytes without first decoding them."""
+
+    text: str = data("sample.txt")
+
+    # Ensure that the Tokenizer uses a BytesLexer when provided with bytes
+    tokenizer = Tokenizer(text=text.encode("utf-8"))
+
+    assert isinstance(tokenizer.lexer, BytesLexer)
+
+    # Ensure that the same tokens are generated as when tokenizing the text string
+    assert [token.text for token in tokenizer.tokens] == [
+        token.text for token in Tokenizer(text=text).tokens
+    ]
+
+    # Ensure that the Parser also accepts bytes, passing them through to the Tokenizer
+    parser = Parser(text=memoryview(text.encode("utf-8")))
+
+    assert parser.parse() == "The•quick•brown•fox•jumped•over•the•lazy•corgi!"
+
+
+def test_bytes_lexer_scanning():
+    """Test the BytesLexer class' scanning methods over the source bytes."""
+
+    lexer = BytesLexer(text="ça  va\tbién -> fin".encode("utf-8"))
+
+    # Ensure that predicates are checked against the decoded characters
+    assert lexer.scan_while(str.isalpha) == "ça"
+    assert lexer.index == 2
+    assert lexer.offset == 3
+
+    # Ensure that runs of characters from a string of characters are consumed
+    assert lexer.scan_while(" ") == "  "
+    assert lexer.match(r"[a-z]+") == "va"
+    assert lexer.scan_while(b"\t") == "\t"
+
+    # Ensure that character sets holding multi-byte characters are supported
+    assert lexer.scan_while("bién") == "bién"
+    assert lexer.index == 11
+    assert lexer.offset == 13
+
+    # Ensure that delimiters are found in the source bytes
+    assert lexer.scan_until(["->", "-"]) == " "
+    assert lexer.expect("-> ") == "-> "
+    assert lexer.scan_until(";") == "fin"
+    assert lexer.index == lexer.length == 18
+    assert lexer.column == 19
+
+    # Ensure that memoryview slices are returned when decoding has been disabled
+    lexer = BytesLexer(text=b"key=value", decode=False)
+
+    assert lexer.scan_until(b"=") == b"key"
+    assert isinstance(lexer.characters, memoryview)
+
+    # Ensure that delimiters may be specified as a mixture of strings and bytes
+    assert lexer.scan_until([b"lu", "x"]) == b"=va"
@@ -0,0 +1,319 @@
+import pytest
+import json
+import os
+import re
+
+from array import array
+
+from lexographer import (
+    Type,
+    Rule,
+    RuleTokenizer,
+    DFATokenizer,
+    Automaton,
+    TokenizerError,
+)
+from examples.text import Tokenizer
+
+Type.register("Keyword")
+Type.register("Identifier")
+Type.register("Integer")
+Type.register("String")
+
+
+class QueryTokenizer(DFATokenizer):
+    """Sample DFATokenizer subclass declaring the rules for a simple query language, where
+    the keywords need no word boundary as the longest match wins."""
+
+    _rules = [
+        Rule(Type.Keyword, r"SELECT|FROM|WHERE"),
+        (Type.Identifier, r"[A-Za-z_]\w*"),
+        (Type.Integer, r"\d+"),
+        Rule(Type.Equals, "=", literal=True),
+        Rule(Type.EqualsEquals, "==", literal=True),
+        Rule(Type.Comma, ",", literal=True),
+        Rule(Type.Spacing, r"\s+", skip=True),
+    ]
+
+
+class WordTokenizer(DFATokenizer):
+    """Sample DFATokenizer subclass matching the tokens of the sample Tokenizer."""
+
+    _rules = [
+        (Type.Word, r"[^\W\d_]+(?:'[^\W\d_]*)*"),
+        (Type.Spacing, r"[^\S\n\r\t]+"),
+        (Type.Period, r"\."),
+        (Type.NewLine, r"\n"),
+        (Type.Unknown, r"."),
+    ]
+
+
+def test_dfa_tokenizer():
+    """Test tokenizing a text via the automaton compiled from the declared rules."""
+
+    tokenizer = QueryTokenizer(text="SELECT a, b FROM table WHERE SELECTED == 10")
+
+    assert isinstance(tokenizer, RuleTokenizer)
+
+    assert [(token.type, token.text) for token in tokenizer.tokens] == [
+        (Type.Keyword, "SELECT"),
+        (Type.Identifier, "a"),
+        (Type.Comma, ","),
+        (Type.Identifier, "b"),
+        (Type.Keyword, "FROM"),
+        (Type.Identifier, "table"),
+        (Type.Keyword, "WHERE"),
+        (Type.Identifier, "SELECTED"),
+        (Type.EqualsEquals, "=="),
+        (Type.Integer, "10"),
+    ]
+
+    assert tokenizer[5].position.index == 17
+    assert tokenizer[5].position.column == 18
+
+
+def test_dfa_tokenizer_matches_tokenizer(data: callable):
+    """Test that a DFATokenizer produces the same tokens as the sample Tokenizer."""
+
+    text: str = data("sample.txt") * 10
+
+    expected = Tokenizer(text=text)
+    tokenizer = WordTokenizer(text=text)
+
+    assert len(tokenizer) == len(expected)
+
+    for token, other in zip(tokenizer.tokens, expected.tokens):
+        assert token.type is other.type
+        assert token.text == other.text
+        assert token.position == other.position
+
+
+def test_dfa_tokenizer_lazy():
+    """Test that a DFATokenizer may match its tokens on demand."""
+
+    class LazyQueryTokenizer(QueryTokenizer):
+        _lazy = True
+
+    tokenizer = LazyQueryTokenizer(text="SELECT a FROM b WHERE ?")
+
+    assert tokenizer.next().text == "SELECT"
+    assert tokenizer.next().text == "a"
+
+    with pytest.raises(TokenizerError):
+        len(tokenizer)
+
+
+def test_dfa_tokenizer_errors():
+    """Test the errors raised for unmatched text and for unsupported rules."""
+
+    with pytest.raises(TokenizerError) as error:
+        QueryTokenizer(text="SELECT a\nFROM ?")
+
+    assert "line 2, column 6" in str(error.value)
+
+    for pattern in [r"^a", r"a\b", r"a(?=b)", r"(a)\1", r"a+?"]:
+        with pytest.raises(TokenizerError):
+
+            class UnsupportedTokenizer(DFATokenizer):
+                _rules = [(Type.Word, pattern)]
+
+    # Ensure that malformed escape sequences are reported rather than raising ValueError
+    for pattern in [
+        r"\x4",
+        r"\xZZ",
+        r"\u12G4",
+        r"\U00110000",
+        r"\N{LATIN",
+        r"\Nx",
+        r"\N{NO SUCH}",
+    ]:
+        with pytest.raises(TokenizerError):
+            Automaton([pattern])
+
+    with pytest.raises(TokenizerError):
+
+        class FlaggedTokenizer(DFATokenizer):
+            _rules = [(Type.Word, r"[a-z]+")]
+            _flags = re.IGNORECASE
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r"a(?:b|c)*d",
+        r"x{2,4}",
+        r"x{2,}",
+        r"[]a-c-]+",
+        r"[^abc\d]",
+        r"\.\d+(?:e[+-]?\d+)?",
+        r"(?:ab|a)c?",
+        r"\x41é+",
+        r"\w+",
+        r"[\s,]+",
+    ],
+)
+def test_automaton_matches_regular_expression(pattern: str):
+    """Test that an automaton matches the same strings as the regular expression."""
+
+    automaton = Automaton([pattern])
+
+    for text in [
+        "abcd",
+        "ad",
+        "x",
+        "xx",
+        "xxxxx",
+        "a-c]",
+        "]",
+        "z",
+        "5",
+        ".5e-3",
+        ".5e",
+        "abc",
+        "ac",
+        "Aéé",
+        "naïve_2",
+        " ,\t",
+    ]:
+        matches: list[tuple] = list(automaton.scan(text))
+
+        assert (re.fullmatch(pattern, text) is not None) == (
+            len(matches) == 1 and matches[0][2] == len(text)
+        )
+
+
+def test_automaton_serialization():
+    """Test that the tables of an automaton can be serialized and restored."""
+
+    automaton = Automaton([r"[a-z]+", r"\d+", r"\s+"])
+
+    restored = Automaton.loads(automaton.dumps())
+
+    # Ensure that the tables are held in arrays, and restored into arrays
+    for tables in [automaton, restored]:
+        assert isinstance(tables._classes, array)
+        assert isinstance(tables._table, array)
+        assert isinstance(tables._final, array)
+
+    assert restored.fingerprint == automaton.fingerprint
+    assert restored.states == automaton.states
+    assert restored.width == automaton.width
+
+    assert list(restored.scan("abc 123")) == [(0, 0, 3), (2, 3, 4), (1, 4, 7)]
+
+    with pytest.raises(TokenizerError):
+        Automaton.loads(b'{"version": 0}')
+
+    # Ensure that inconsistent or out of range tables are rejected when loaded, rather
+    # than failing while scanning
+    tables: dict = json.loads(automaton.dumps())
+
+    for key, value in [
+        ("transitions", tables["transitions"][:-1]),
+        (
+            "transitions",
+            [[len(tables["accepts"])] * automaton.width] * automaton.states,
+        ),
+        ("transitions", [row[:-1] for row in tables["transitions"]]),
+        ("accepts", [0] + tables["accepts"][1:]),
+        ("accepts", [-2] + tables["accepts"][1:]),
+        ("boundaries", list(reversed(tables["boundaries"]))),
+        ("classes", [-1] * len(tables["classes"])),
+        ("classes", [str(value) for value in tables["classes"]]),
+    ]:
+        with pytest.raises(TokenizerError):
+            Automaton.loads(json.dumps({**tables, key: value}))
+
+
+def test_automaton_cache(tmp_path):
+    """Test that compiled automata are saved into and loaded from the cache directory."""
+
+    patterns: list[str] = [r"[a-z]+\d*", r"\s+"]
+
+    automaton = Automaton.build(patterns, cache=str(tmp_path))
+
+    filepath: str = os.path.join(
+        tmp_path, f"automaton-{Automaton.digest(patterns)}.json"
+    )
+
+    assert os.path.exists(filepath)
+
+    # Ensure that the automaton is reused from memory within the same process
+    assert Automaton.build(patterns, cache=str(tmp_path)) is automaton
+
+    # Ensure that the automaton is loaded from the cache directory when not in memory
+    Automaton._automata.pop(automaton.fingerprint)
+
+    loaded = Automaton.build(patterns, cache=str(tmp_path))
+
+    assert loaded is not automaton
+    assert loaded.dumps() == automaton.dumps()
+
+    # Ensure that a corrupt cache file is replaced by recompiling the automaton
+    Automaton._automata.pop(automaton.fingerprint)
+
+    with open(filepath, "wb") as file:
+        file.write(b"corrupt")
+
+    assert Automaton.build(patterns, cache=str(tmp_path)).dumps() == automaton.dumps()
+
+    with open(filepath, "rb") as file:
+        assert file.read() == automaton.dumps()
+
+    # Ensure that a cache file whose tables reference rules beyond the patterns, such as
+    # one that was saved for other patterns under the same name, is replaced
+    Automaton._automata.pop(automaton.fingerprint)
+
+    tables: dict = json.loads(automaton.dumps())
+    tables["accepts"] = [
+        value + 5 if value >= 0 else value for value in tables["accepts"]
+    ]
+
+    with open(filepath, "w") as file:
+        json.dump(tables, file)
+
+    assert Automaton.build(patterns, cache=str(tmp_path)).dumps() == automaton.dumps()
+
+
+def test_dfa_tokenizer_apply_edit():
+    """Test that a DFATokenizer re-tokenizes only the edited text, via its automaton."""
+
+    text: str = "SELECT a, b FROM table WHERE c == 10\n" * 100
+
+    tokenizer = QueryTokenizer(text=text)
+
+    # Ensure that typing onto a keyword re-tokenizes it as an identifier
+    assert tokenizer.apply_edit(6, 6, "ED") == (0, 1, 1)
+
+    assert tokenizer[0].type.name == "Identifier"
+    assert tokenizer[0].text == "SELECTED"
+    assert tokenizer[1].index == 9
+
+    edited: str = text[:6] + "ED" + text[6:]
+
+    assert [(token.type, token.span) for token in tokenizer.tokens] == [
+        (token.type, token.span) for token in QueryTokenizer(text=edited).tokens
+    ]
+
+
+@pytest.mark.parametrize("length", [1500, 5000, 70000])
+def test_dfa_tokenizer_block_boundaries(length: int):
+    """Test that tokens crossing the boundaries of the blocks of classified characters,
+    including the first token of the text, before any rule has matched, are matched; the
+    lengths cross the initial block size, several doubled block sizes, and the largest.
+    """
+
+    class StringTokenizer(DFATokenizer):
+        _rules = [
+            (Type.String, r'"[^"]*"'),
+            Rule(Type.Spacing, r"\s+", skip=True),
+        ]
+
+    string: str = '"' + "x" * length + '"'
+
+    tokenizer = StringTokenizer(text=string + " " + string)
+
+    assert [(token.index, token.length) for token in tokenizer.tokens] == [
+        (0, length + 2),
+        (length + 3, length + 2),
+    ]
@@ -0,0 +1,110 @@
+import pytest
+import lexographer
+import codecs
+import io
+
+from lexographer import LexerError, Lexer, StreamLexer
+from examples.text import Tokenizer, Parser
+
+
+def test_lexer_encoding_detection(tmp_path):
+    """Test that the encoding of a file is detected from its byte order mark."""
+
+    text: str = "ça – va\nbién"
+
+    for bom, encoding in [
+        (b"", "utf-8"),
+        (codecs.BOM_UTF8, "utf-8"),
+        (codecs.BOM_UTF16_LE, "utf-16-le"),
+        (codecs.BOM_UTF16_BE, "utf-16-be"),
+        (codecs.BOM_UTF32_LE, "utf-32-le"),
+        (codecs.BOM_UTF32_BE, "utf-32-be"),
+    ]:
+        (file := tmp_path / "sample.txt").write_bytes(bom + text.encode(encoding))
+
+        lexer = Lexer(file=str(file))
+
+        # Ensure that the byte order mark is skipped, and the text decoded as expected
+        assert lexer.text == text
+        assert lexer.encoding == encoding
+
+        # Ensure that a byte order mark in the same family as the encoding is skipped
+        if bom:
+            family: str = "utf-8-sig" if encoding == "utf-8" else encoding[:6]
+
+            assert Lexer(file=str(file), encoding=family).text == text
+
+
+def test_lexer_encoding_and_errors(tmp_path):
+    """Test decoding files with the specified encoding and error handling scheme."""
+
+    (file := tmp_path / "sample.txt").write_bytes("ça va".encode("latin-1"))
+
+    assert Lexer(file=str(file), encoding="latin-1").text == "ça va"
+
+    # Ensure that decoding errors are raised as a LexerError by default
+    with pytest.raises(LexerError):
+        Lexer(file=str(file))
+
+    # Ensure that the error handling scheme is used when specified
+    assert Lexer(file=str(file), errors="replace").text == "�a va"
+
+    with pytest.raises(LexerError):
+        Lexer(file=str(file), encoding="unknown")
+
+    with pytest.raises(LexerError):
+        Lexer(file=str(file), errors="unknown")
+
+    with pytest.raises(TypeError):
+        Lexer(file=str(file), encoding=8)
+
+
+def test_lexer_new_line_translation(tmp_path):
+    """Test that new lines are translated as per text mode, for files that are loaded
+    whole and for files that are streamed in chunks."""
+
+    (file := tmp_path / "sample.txt").write_bytes(b"ab\r\ncd\re\r\n\r\nf")
+
+    assert Lexer(file=str(file)).text == "ab\ncd\ne\n\nf"
+
+    (wide := tmp_path / "wide.txt").write_bytes("ab\r\ncd\r".encode("utf-16"))
+
+    assert Lexer(file=str(wide)).text == "ab\ncd\n"
+
+    # Ensure that files are also translated when streamed in chunks
+    with StreamLexer(file=str(file), chunk=2) as lexer:
+        assert "".join(lexer) == "ab\ncd\ne\n\nf"
+
+
+def test_stream_lexer_bytes(tmp_path):
+    """Test the StreamLexer class decoding streams of bytes incrementally."""
+
+    data: bytes = codecs.BOM_UTF16_LE + "ça – va".encode("utf-16-le")
+
+    # Ensure that bytes chunks splitting the characters are decoded as expected
+    lexer = StreamLexer(stream=(data[i : i + 1] for i in range(len(data))))
+
+    assert lexer.read(length=7) == "ça – va"
+    assert lexer.encoding == "utf-16-le"
+
+    # Ensure that binary file objects are decoded with the specified encoding
+    lexer = StreamLexer(stream=io.BytesIO("ça va".encode("latin-1")), encoding="cp1252")
+
+    assert lexer.read(length=5) == "ça va"
+
+    with pytest.raises(LexerError):
+        StreamLexer(stream=io.BytesIO(b"\xe7a"), chunk=1).read(length=2)
+
+
+def test_parser_encoding(tmp_path):
+    """Test that the Parser passes its encoding and errors on to the Tokenizer."""
+
+    (file := tmp_path / "sample.txt").write_bytes("The café.".encode("latin-1"))
+
+    parser = Parser(file=str(file), encoding="latin-1")
+
+    assert parser.encoding == "latin-1"
+    assert parser.tokenizer.lexer.encoding == "latin-1"
+    assert parser.parse() == "The•café!"
+
+    assert Tokenizer(file=str(file), errors="replace").text == "The caf�."
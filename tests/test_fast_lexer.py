@@ -0,0 +1,97 @@
+import pytest
+import lexographer
+
+from lexographer import Context, LexerError, Lexer, FastLexer
+from examples.text import Tokenizer
+
+
+def test_fast_lexer_instantiation(data: callable):
+    """Test the instantiation of the FastLexer class."""
+
+    lexer = FastLexer(text=data("sample.txt"))
+
+    # Ensure that the FastLexer class instance has the expected types
+    assert isinstance(lexer, FastLexer)
+    assert isinstance(lexer, lexographer.Lexer)
+
+    # Ensure that the arguments are still validated during instantiation
+    with pytest.raises(TypeError):
+        FastLexer(text=42)
+
+    with pytest.raises(ValueError):
+        FastLexer(text="")
+
+
+def test_fast_lexer_compatibility():
+    """Test that the FastLexer class behaves as the Lexer class for valid arguments."""
+
+    text: str = "The quick brown\nfox jumped\nover the lazy corgi."
+
+    lexers: list[Lexer] = [Lexer(text=text), FastLexer(text=text)]
+
+    # Define a sequence of lexing method calls and their arguments to compare
+    calls: list[tuple[str, dict]] = [
+        ("read", dict()),
+        ("peek", dict(offset=2, length=3)),
+        ("lookahead", dict(text="he ")),
+        ("lookahead", dict(text="he", consume=True)),
+        ("expect", dict(text=" quick")),
+        ("expect", dict(text="purple")),
+        ("lookbehind", dict(text="k", offset=-1)),
+        ("read", dict(length=6)),
+        ("read", dict()),
+        ("consume", dict(length="fox jumped\n")),
+        ("push", dict(length=2)),
+        ("peek", dict(offset=-2, length=2)),
+        ("consume", dict(length=2)),
+        ("advance", dict(length=4)),
+        ("peek", dict(offset=100)),
+        ("read", dict(length=100)),
+        ("read", dict()),
+    ]
+
+    for method, arguments in calls:
+        results: list = [getattr(lexer, method)(**arguments) for lexer in lexers]
+
+        # Ensure that each method call returns the same result and position
+        assert results[0] == results[1], (method, arguments)
+        assert lexers[0].index == lexers[1].index
+        assert lexers[0].line == lexers[1].line
+        assert lexers[0].column == lexers[1].column
+
+    # Ensure that iteration produces the same characters
+    assert list(lexers[0]) == list(lexers[1])
+
+    # Ensure that the same errors are raised with the same contexts
+    for lexer in lexers:
+        with pytest.raises(LexerError) as exception:
+            lexer.read(length=100, raises=True)
+
+        assert exception.value.context is Context.Finish
+
+        with pytest.raises(LexerError) as exception:
+            lexer.expect("purple", raises=True)
+
+        assert exception.value.context is Context.NotFound
+
+
+def test_fast_lexer_tokenizer(data: callable):
+    """Test the FastLexer class when used by a Tokenizer subclass."""
+
+    class FastTokenizer(Tokenizer):
+        _lexer_subclass = FastLexer
+
+    text: str = data("sample.txt")
+
+    fast = FastTokenizer(text=text)
+    tokenizer = Tokenizer(text=text)
+
+    assert isinstance(fast.lexer, FastLexer)
+
+    # Ensure that the tokens generated via each Lexer are the same
+    assert len(fast) == len(tokenizer) == 18
+
+    for index in range(len(tokenizer)):
+        assert fast[index].type is tokenizer[index].type
+        assert fast[index].text == tokenizer[index].text
+        assert fast[index].position == tokenizer[index].position
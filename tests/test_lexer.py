@@ -1,5 +1,6 @@
 import pytest
 import lexographer
+import re
 
 from lexographer import Context, Type, Token
 
@@ -430,3 +431,207 @@ def text_lexer_expect(lexer: lexographer.Lexer):
         assert lexer.expect("purple fox", raises=True) == ""
 
         assert exception.context is Context.NotFound
+
+
+def test_lexer_indexed():
+    """Test the Lexer class' indexed mode, where line and column numbers are derived from
+    a table of the new line offsets only when they are requested."""
+
+    # Create an instance of the Lexer class with indexing enabled
+    lexer = lexographer.Lexer(text="ab\ncd\n\nef", indexed=True)
+
+    assert lexer.indexed is True
+
+    # Before any calls to .read() or .consume() the cursor index should be at 0
+    assert lexer.index == 0
+    assert lexer.column == 1
+    assert lexer.line == 1
+
+    # Consume a span of text holding several new lines, and ensure that the line and
+    # column numbers are exact, rather than only being advanced by a single line
+    assert lexer.consume(length=7) == "ab\ncd\n\n"
+    assert lexer.index == 7
+    assert lexer.line == 4
+    assert lexer.column == 1
+
+    assert lexer.read() == "e"
+    assert lexer.position == lexographer.Position(index=8, line=4, column=2)
+
+    # Push back over several new lines and ensure that the positions remain exact
+    assert lexer.push(length=4) == "d\n\ne"
+    assert lexer.index == 4
+    assert lexer.line == 2
+    assert lexer.column == 2
+
+
+def test_lexer_locate():
+    """Test the Lexer class' .locate() method."""
+
+    # Create an instance of the Lexer class without indexing enabled
+    lexer = lexographer.Lexer(text="ab\ncd\n\nef")
+
+    assert lexer.indexed is False
+
+    # Ensure that arbitrary positions can be located, including those of new lines
+    assert lexer.locate(0) == lexographer.Position(index=0, line=1, column=1)
+    assert lexer.locate(2) == lexographer.Position(index=2, line=1, column=3)
+    assert lexer.locate(3) == lexographer.Position(index=3, line=2, column=1)
+    assert lexer.locate(6) == lexographer.Position(index=6, line=3, column=1)
+    assert lexer.locate(9) == lexographer.Position(index=9, line=4, column=3)
+
+    # Ensure that locating positions does not switch the Lexer into indexed mode
+    assert lexer.indexed is False
+
+
+def test_lexer_replace():
+    """Test the Lexer class' .replace() method."""
+
+    lexer = lexographer.Lexer(text="ab\ncd\n\nef", indexed=True)
+
+    lexer.read(length=7)
+
+    # Replace text spanning a new line, with text holding two new lines
+    assert lexer.replace(1, 4, "x\ny\nz") == "b\nc"
+
+    assert lexer.text == "ax\ny\nzd\n\nef"
+    assert lexer.length == 11
+
+    # Ensure that the cursor moved along with the text following the replaced text
+    assert lexer.index == 9
+    assert lexer.peek() == "e"
+
+    # Ensure that the table of new line offsets was updated to match the new text
+    for index in range(len(lexer.text)):
+        assert lexer.locate(index) == lexographer.Lexer(text=lexer.text).locate(index)
+
+    # Ensure that a cursor within the replaced text is moved to the start of the edit
+    lexer = lexographer.Lexer(text="ab\ncd")
+    lexer.read(length=4)
+
+    assert lexer.replace(2, 5, "") == "\ncd"
+    assert lexer.index == 2
+    assert lexer.line == 1
+    assert lexer.column == 3
+
+    with pytest.raises(ValueError):
+        lexer.replace(2, 10, "")
+
+    with pytest.raises(TypeError):
+        lexer.replace(0, 1, None)
+
+
+def test_lexer_match():
+    """Test the Lexer class' .match() method."""
+
+    lexer = lexographer.Lexer(text="count = 42;\nnext")
+
+    # Ensure that a pattern that matches is consumed, and that the cursor is moved
+    assert lexer.match(r"[a-z]+") == "count"
+    assert lexer.index == 5
+
+    # Ensure that a pattern that does not match returns an empty string
+    assert lexer.match(r"\d+") == ""
+    assert lexer.index == 5
+
+    # Ensure that matches can be peeked at without being consumed
+    assert lexer.match(re.compile(r"\s*=\s*"), consume=False) == " = "
+    assert lexer.index == 5
+
+    # Ensure that the line and column numbers are updated over matched new lines
+    assert lexer.match(r"[ =]+\d+;\n") == " = 42;\n"
+    assert lexer.index == 12
+    assert lexer.line == 2
+    assert lexer.column == 1
+
+    with pytest.raises(TypeError):
+        lexer.match(42)
+
+
+def test_lexer_scan_while():
+    """Test the Lexer class' .scan_while() method."""
+
+    lexer = lexographer.Lexer(text="  \t word2 1234,5\n ")
+
+    # Ensure that runs of characters from a string of characters are consumed
+    assert lexer.scan_while(" \t") == "  \t "
+    assert lexer.index == 4
+
+    # Ensure that runs of characters matching known predicates are consumed
+    assert lexer.scan_while(str.isalnum) == "word2"
+    assert lexer.scan_while(str.isspace) == " "
+    assert lexer.scan_while(str.isdecimal) == "1234"
+
+    # Ensure that runs of characters matching other predicates are consumed
+    assert lexer.scan_while(lambda character: character in ",5") == ",5"
+
+    # Ensure that runs of characters matching a single character pattern are consumed
+    assert lexer.scan_while(re.compile(r"\s")) == "\n "
+    assert lexer.line == 2
+    assert lexer.column == 2
+
+    # Ensure that no characters are consumed at the end of the text
+    assert lexer.scan_while(str.isspace) == ""
+
+    with pytest.raises(ValueError):
+        lexer.scan_while("")
+
+    with pytest.raises(TypeError):
+        lexer.scan_while(42)
+
+    # Ensure that bytes are rejected, as the Lexer class lexes over text
+    with pytest.raises(TypeError) as error:
+        lexographer.Lexer(text="abc def").scan_while(b"abc")
+
+    assert "rather than bytes" in str(error.value)
+
+
+def test_lexer_scan_until():
+    """Test the Lexer class' .scan_until() method."""
+
+    lexer = lexographer.Lexer(text="one, two -> three\nfour")
+
+    # Ensure that characters are consumed up to, but not including, the delimiter
+    assert lexer.scan_until(",") == "one"
+    assert lexer.expect(", ") == ", "
+
+    # Ensure that the earliest of several delimiters is found, and that the longest of
+    # several delimiters starting at the same position takes precedence
+    assert lexer.scan_until(["\n", "->", "-"]) == "two "
+    assert lexer.expect("->") == "->"
+
+    assert lexer.scan_until("\n") == " three"
+    assert lexer.line == 1
+
+    # Ensure that the remainder of the text is consumed when no delimiter is found
+    assert lexer.scan_until("\n") == ""
+    assert lexer.read() == "\n"
+    assert lexer.scan_until(";") == "four"
+    assert lexer.line == 2
+    assert lexer.column == 5
+
+    with pytest.raises(ValueError):
+        lexer.scan_until([])
+
+    # Ensure that bytes are rejected, as the Lexer class lexes over text
+    for delimiters in [b" ", [b" "], [" ", b"-"]]:
+        with pytest.raises(TypeError):
+            lexographer.Lexer(text="abc def").scan_until(delimiters)
+
+
+def test_lexer_pattern_cache():
+    """Test that the compiled scanning patterns are held in a bounded cache."""
+
+    limit: int = lexographer.Lexer._build.cache_info().maxsize
+
+    # Ensure that scanning for many distinct delimiters evicts the least recently used
+    for number in range(limit + 10):
+        lexer = lexographer.Lexer(text=f"key={number};")
+
+        assert lexer.scan_until([f"={number};", "\n"]) == "key"
+
+    assert lexographer.Lexer._build.cache_info().currsize == limit
+
+    # Ensure that a pattern is compiled once and then reused from the cache
+    lexer = lexographer.Lexer(text="abc")
+
+    assert lexer._compile("while", "abc") is lexer._compile("while", "abc")
@@ -0,0 +1,172 @@
+import pytest
+import lexographer
+
+from lexographer import (
+    Context,
+    Type,
+    Token,
+    LexerError,
+    Literals,
+    Lexer,
+    BytesLexer,
+    FastLexer,
+    StreamLexer,
+)
+
+
+def test_literals_instantiation():
+    """Test the instantiation of the Literals class."""
+
+    # Create an instance of the Literals class with literals mapped to their types
+    literals = Literals({"=": Type.Equals, "==": Type.EqualsEquals, "<": Type.LessThan})
+
+    assert len(literals) == 3
+    assert "==" in literals
+    assert literals["<"] is Type.LessThan
+    assert literals.longest == 2
+    assert literals.binary is False
+
+    # Create an instance of the Literals class with literals which are their own values
+    literals = Literals([">", ">=", ">>="])
+
+    assert literals[">="] == ">="
+    assert literals.longest == 3
+
+    # Ensure that the longest literal is matched at the specified index
+    assert literals.match("a >>= b", 2) == (">>=", ">>=")
+    assert literals.match("a >= b", 2) == (">=", ">=")
+    assert literals.match("a > b", 2) == (">", ">")
+    assert literals.match("a > b", 0) is None
+    assert literals.match("a > b", 10) is None
+
+    # Ensure that the literals can be encoded for matching against bytes
+    encoded = literals.encode("utf-8")
+
+    assert encoded.binary is True
+    assert encoded is literals.encode("utf-8")
+    assert encoded.match(b"a >= b", 2) == (b">=", ">=")
+
+    with pytest.raises(TypeError):
+        Literals("abc")
+
+    with pytest.raises(TypeError):
+        Literals(["a", b"b"])
+
+    with pytest.raises(ValueError):
+        Literals([])
+
+    with pytest.raises(ValueError):
+        Literals([""])
+
+
+def test_lexer_lookahead_any_and_expect_any():
+    """Test the Lexer class' .lookahead_any() and .expect_any() methods."""
+
+    literals = Literals({"=": "assign", "==": "equal", "=>": "arrow", "!=": "unequal"})
+
+    for cls in [Lexer, FastLexer]:
+        lexer = cls(text="a == b => c != d")
+
+        # Ensure that nothing is matched where none of the literals are present
+        assert lexer.lookahead_any(literals) is None
+        assert lexer.expect_any(literals) is None
+        assert lexer.index == 0
+
+        # Ensure that look-aheads return the value of the longest matching literal
+        assert lexer.lookahead_any(literals, offset=2) == "equal"
+        assert lexer.index == 0
+
+        lexer.read(length=2)
+
+        # Ensure that expect consumes the longest matching literal
+        assert lexer.expect_any(literals) == "equal"
+        assert lexer.index == 4
+        assert lexer.characters == "=="
+
+        lexer.read(length=3)
+
+        assert lexer.expect_any(literals) == "arrow"
+
+        lexer.read(length=3)
+
+        assert lexer.lookahead_any(literals, consume=True) == "unequal"
+        assert lexer.index == 14
+
+        # Ensure that the LexerError is raised when requested if no literals match
+        with pytest.raises(LexerError) as exception:
+            lexer.expect_any(literals, raises=True)
+
+        assert exception.value.context is Context.NotFound
+
+    # Ensure that the Lexer class accepts literals which have not been prebuilt
+    assert Lexer(text=">= 1").expect_any([">", ">="]) == ">="
+
+
+def test_lexer_lookahead_any_via_subclasses():
+    """Test the .lookahead_any() and .expect_any() methods of the Lexer subclasses."""
+
+    literals = Literals({"–": Type.EmDash, "–>": Type.Unknown})
+
+    # Ensure that literals split across the chunks of a stream are matched in full
+    lexer = StreamLexer(stream=iter(["a –", "> b"]))
+
+    assert lexer.read() == "a"
+    assert lexer.lookahead_any(literals, offset=1) is Type.Unknown
+    assert lexer.read() == " "
+    assert lexer.expect_any(literals) is Type.Unknown
+    assert lexer.read() == " "
+
+    # Ensure that literals holding multi-byte characters are matched against bytes
+    lexer = BytesLexer(text="a –> b –".encode("utf-8"))
+
+    assert lexer.read(length=2) == "a "
+    assert lexer.expect_any(literals) is Type.Unknown
+    assert lexer.index == 4
+    assert lexer.offset == 6
+    assert lexer.lookahead_any(literals, offset=3) is Type.EmDash
+
+
+def test_tokenizer_with_literals():
+    """Test a Tokenizer subclass that builds its Literals once as a class attribute."""
+
+    class Tokenizer(lexographer.Tokenizer):
+        _operators = Literals(
+            {
+                "<": Type.LessThan,
+                "<=": Type.LessThanEqual,
+                "=": Type.Equals,
+                ";": Type.SemiColon,
+            }
+        )
+
+        def parse(self):
+            while not self.lexer.index >= self.lexer.length:
+                if type := self.lexer.expect_any(self._operators):
+                    self.token = Token(
+                        tokenizer=self, type=type, text=self.lexer.characters
+                    )
+                elif text := self.lexer.scan_while(str.isspace):
+                    self.token = Token(tokenizer=self, type=Type.Spacing, text=text)
+                else:
+                    text = self.lexer.scan_while(str.isalnum) or self.lexer.read()
+                    self.token = Token(tokenizer=self, type=Type.Unknown, text=text)
+
+    tokenizer = Tokenizer(text="a <= b; c=d<e")
+
+    assert [token.text for token in tokenizer.tokens] == [
+        "a",
+        " ",
+        "<=",
+        " ",
+        "b",
+        ";",
+        " ",
+        "c",
+        "=",
+        "d",
+        "<",
+        "e",
+    ]
+    assert tokenizer[2].type is Type.LessThanEqual
+    assert tokenizer[5].type is Type.SemiColon
+    assert tokenizer[10].type is Type.LessThan
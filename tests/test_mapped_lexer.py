@@ -0,0 +1,125 @@
+import pytest
+import lexographer
+
+from lexographer import Context, Type, Token, LexerError, MappedLexer
+from examples.text import Tokenizer
+
+
+def test_mapped_lexer_instantiation_with_file(path: callable, data: callable):
+    """Test the instantiation of the MappedLexer class with a file path."""
+
+    # Obtain the file path for the sample file
+    file: str = path("sample.txt")
+
+    # Create an instance of the MappedLexer class
+    lexer = MappedLexer(file=file)
+
+    # Ensure that the MappedLexer class instance has the expected types
+    assert isinstance(lexer, MappedLexer)
+    assert isinstance(lexer, lexographer.Lexer)
+
+    # Ensure that the file specified during instantiation is as expected
+    assert lexer.file == file
+
+    # Load the sample text data to compare against the data mapped by the MappedLexer
+    text: str = data("sample.txt")
+
+    # Ensure that the text and length are reported as expected
+    assert lexer.text == text
+    assert lexer.length == len(lexer) == len(text)
+
+    lexer.close()
+
+
+def test_mapped_lexer_instantiation_with_text():
+    """Test that the MappedLexer class cannot be instantiated with a text string."""
+
+    with pytest.raises(LexerError):
+        MappedLexer(text="abc")
+
+
+def test_mapped_lexer_multibyte_characters(tmp_path):
+    """Test lexing over a memory mapped file containing multi-byte UTF-8 characters."""
+
+    # Create a sample file holding a mixture of single and multi-byte characters
+    file = tmp_path / "sample.txt"
+    file.write_bytes("naïve – café\nüber €5".encode("utf-8"))
+
+    with MappedLexer(file=str(file)) as lexer:
+        # The length reports the number of characters, rather than the number of bytes
+        assert lexer.length == 20
+        assert lexer.size == len("naïve – café\nüber €5".encode("utf-8"))
+
+        # Ensure that reads decode whole characters, advancing the character index and
+        # the byte offset by their respective amounts
+        assert lexer.read(length=3) == "naï"
+        assert lexer.index == 3
+        assert lexer.offset == 4
+        assert lexer.column == 4
+
+        # Ensure peeks, including those with negative offsets, decode whole characters
+        assert lexer.peek() == "v"
+        assert lexer.peek(offset=-1) == "ï"
+        assert lexer.peek(offset=3, length=1) == "–"
+
+        # Ensure that lookahead and expect operate over the decoded characters
+        assert lexer.lookahead("ve – ") is True
+        assert lexer.expect("ve – ") == "ve – "
+        assert lexer.index == 8
+        assert lexer.expect("cafe") == ""
+        assert lexer.expect("café\nü") == "café\nü"
+
+        # Ensure the line and column numbers are updated over the consumed new line
+        assert lexer.line == 2
+        assert lexer.column == 2
+
+        # Ensure that pushing back over the new line restores the line and column
+        assert lexer.push(length=3) == "é\nü"
+        assert lexer.line == 1
+        assert lexer.column == 12
+        assert lexer.peek() == "é"
+
+        # Ensure that peeking beyond the end of the file returns an empty string
+        assert lexer.peek(offset=20) == ""
+
+        # Ensure that reading beyond the end of the file raises when requested
+        with pytest.raises(LexerError) as exception:
+            lexer.read(length=100, raises=True)
+
+        assert exception.value.context is Context.Finish
+
+
+def test_mapped_lexer_iterator(tmp_path):
+    """Test the MappedLexer's iterator support."""
+
+    file = tmp_path / "sample.txt"
+    file.write_text("añb\nc", encoding="utf-8")
+
+    with MappedLexer(file=str(file)) as lexer:
+        assert list(lexer) == ["a", "ñ", "b", "\n", "c"]
+
+        # Ensure that iterating again restarts from the beginning of the mapped file
+        assert "".join(lexer) == "añb\nc"
+
+
+def test_mapped_lexer_tokenizer(path: callable, data: callable):
+    """Test the MappedLexer class when registered for use by a Tokenizer subclass."""
+
+    class MappedTokenizer(Tokenizer):
+        pass
+
+    MappedTokenizer.register_lexer(MappedLexer)
+
+    # Tokenize the same sample text via both the default Lexer and the MappedLexer
+    mapped = MappedTokenizer(file=path("sample.txt"))
+    tokenizer = Tokenizer(text=data("sample.txt"))
+
+    assert isinstance(mapped.lexer, MappedLexer)
+
+    # Ensure that the tokens generated via each Lexer are the same
+    assert len(mapped) == len(tokenizer) == 18
+
+    for index in range(len(tokenizer)):
+        assert mapped[index].type is tokenizer[index].type
+        assert mapped[index].text == tokenizer[index].text
+        assert mapped[index].position == tokenizer[index].position
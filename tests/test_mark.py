@@ -0,0 +1,199 @@
+import pytest
+import lexographer
+
+from lexographer import (
+    Context,
+    Type,
+    Token,
+    Mark,
+    LexerError,
+    TokenizerError,
+    Lexer,
+    BytesLexer,
+    FastLexer,
+    StreamLexer,
+)
+from examples.text import Tokenizer
+
+
+def test_lexer_mark_and_rollback():
+    """Test the Lexer class' .mark(), .rollback() and .commit() methods."""
+
+    for cls in [Lexer, FastLexer]:
+        lexer = cls(text="ab\ncd\nef")
+
+        lexer.read()
+
+        # Make a Mark, then move the cursor forward across several new lines
+        mark = lexer.mark()
+
+        assert isinstance(mark, Mark)
+        assert mark.owner is lexer
+        assert mark.active is True
+
+        lexer.consume(length=5)
+
+        assert lexer.index == 6
+
+        # Ensure that rolling back restores the cursor position exactly
+        lexer.rollback(mark)
+
+        assert mark.active is False
+        assert lexer.index == 1
+        assert lexer.line == 1
+        assert lexer.column == 2
+        assert lexer.read() == "b"
+
+        # Ensure that a released Mark cannot be rolled back or committed again
+        with pytest.raises(LexerError):
+            lexer.rollback(mark)
+
+        with pytest.raises(LexerError):
+            lexer.commit(mark)
+
+        # Ensure that a Mark made by another Lexer is rejected
+        with pytest.raises(LexerError):
+            lexer.rollback(cls(text="abc").mark())
+
+        with pytest.raises(TypeError):
+            lexer.rollback(1)
+
+
+def test_lexer_nested_marks():
+    """Test that releasing a Mark also releases any Marks made after it."""
+
+    lexer = Lexer(text="abcdef")
+
+    outer = lexer.mark()
+
+    lexer.read()
+
+    inner = lexer.mark()
+
+    lexer.read()
+
+    # Ensure that committing the inner Mark leaves the outer Mark active
+    inner.commit()
+
+    assert inner.active is False
+    assert outer.active is True
+
+    inner = lexer.mark()
+
+    lexer.read()
+
+    # Ensure that rolling back the outer Mark releases the inner Mark too
+    outer.rollback()
+
+    assert lexer.index == 0
+    assert outer.active is False
+    assert inner.active is False
+
+
+def test_lexer_mark_context_manager():
+    """Test using a Mark as a context manager."""
+
+    lexer = Lexer(text="abcdef")
+
+    # Ensure that the Mark is committed when the context exits normally
+    with lexer.mark() as mark:
+        lexer.read(length=2)
+
+    assert mark.active is False
+    assert lexer.index == 2
+
+    # Ensure that the Mark is rolled back when an exception is raised in the context
+    with pytest.raises(LexerError):
+        with lexer.mark() as mark:
+            lexer.read(length=2)
+            lexer.expect("x", raises=True)
+
+    assert mark.active is False
+    assert lexer.index == 2
+
+    # Ensure that a Mark that has been rolled back within the context is left as is
+    with lexer.mark() as mark:
+        lexer.read(length=2)
+        mark.rollback()
+
+    assert lexer.index == 2
+
+
+def test_lexer_subclass_marks():
+    """Test marks with the BytesLexer and StreamLexer classes."""
+
+    lexer = BytesLexer(text="ça\nva".encode("utf-8"))
+
+    with lexer.mark() as mark:
+        assert lexer.read(length=4) == "ça\nv"
+
+        mark.rollback()
+
+    assert lexer.index == 0
+    assert lexer.offset == 0
+    assert lexer.read(length=2) == "ça"
+
+    # Ensure that the StreamLexer retains the text after an active Mark in its buffer
+    lines: list[str] = [f"{index:04d}\n" for index in range(100)]
+
+    lexer = StreamLexer(stream=iter(lines), chunk=16, window=8)
+
+    lexer.read(length=5)
+
+    mark = lexer.mark()
+
+    assert lexer.read(length=400) == "".join(lines[1:81])
+
+    lexer.rollback(mark)
+
+    assert lexer.index == 5
+    assert lexer.line == 2
+    assert lexer.column == 1
+    assert lexer.read(length=5) == lines[1]
+
+    # Ensure that the buffer is trimmed again once the Mark has been released, as more
+    # text is read from the stream beyond the text already held by the buffer
+    lexer.read(length=400)
+
+    while lexer.read(length=5):
+        assert len(lexer.text) <= 8 + 16 + 5
+
+
+def test_tokenizer_mark_and_rollback(data: callable):
+    """Test the Tokenizer class' .mark(), .rollback() and .commit() methods."""
+
+    tokenizer = Tokenizer(text=data("sample.txt"))
+
+    assert len(tokenizer) == 18
+
+    tokenizer.lexer.push(length=6)
+
+    index: int = tokenizer.lexer.index
+
+    mark = tokenizer.mark()
+
+    # Emit additional tokens after the Mark, and change the level and context
+    tokenizer.token = Token(tokenizer=tokenizer, type=Type.Word, text="corgi")
+    tokenizer.token = Token(tokenizer=tokenizer, type=Type.Period, text=".")
+    tokenizer.level = 2
+    tokenizer.context = Context.Start
+
+    assert len(tokenizer) == 20
+
+    # Ensure that rolling back discards the tokens and restores the state
+    tokenizer.rollback(mark)
+
+    assert len(tokenizer) == len(tokenizer.tokens) == 18
+    assert tokenizer.level == 0
+    assert tokenizer.context is Context.Finish
+    assert tokenizer.lexer.index == index
+    assert mark.state[0].active is False
+
+    # Ensure that committing keeps the emitted tokens
+    with tokenizer.mark():
+        tokenizer.token = Token(tokenizer=tokenizer, type=Type.Word, text="corgi")
+
+    assert len(tokenizer) == 19
+
+    with pytest.raises(TokenizerError):
+        tokenizer.rollback(mark)
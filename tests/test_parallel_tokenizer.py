@@ -0,0 +1,124 @@
+import pytest
+import threading
+
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+
+from lexographer import (
+    Type,
+    Context,
+    TokenStore,
+    ParallelTokenizer,
+    TokenizerError,
+)
+from examples.text import Tokenizer
+
+
+class LineTokenizer(Tokenizer):
+    """Sample Tokenizer subclass whose text may be split after any new line."""
+
+
+LineTokenizer.register_boundary(r"\n")
+
+
+class StoredLineTokenizer(LineTokenizer):
+    """Sample Tokenizer subclass holding its tokens in a TokenStore."""
+
+
+StoredLineTokenizer.register_store(TokenStore)
+
+
+def test_parallel_tokenizer_split():
+    """Test splitting a text into ranges ending at the declared safe boundaries."""
+
+    parallel = ParallelTokenizer(LineTokenizer, workers=2, chunk=4)
+
+    assert parallel.split("ab\ncdefgh\nij\nk") == [(0, 10), (10, 14)]
+    assert parallel.split("abcdefgh") == [(0, 8)]
+    assert parallel.split("") == []
+
+
+@pytest.mark.parametrize("subclass", [LineTokenizer, StoredLineTokenizer])
+def test_parallel_tokenizer(data: callable, subclass: type):
+    """Test that tokenizing across worker processes matches tokenizing serially."""
+
+    text: str = (data("sample.txt") + "\n") * 200
+
+    expected = subclass(text=text)
+
+    with ParallelTokenizer(subclass, workers=2, chunk=1000) as parallel:
+        assert len(parallel.split(text)) > 1
+
+        tokenizer = parallel.tokenize(text=text)
+
+    assert isinstance(tokenizer, subclass)
+    assert tokenizer.context is Context.Finish
+    assert len(tokenizer) == len(expected)
+
+    for token, other in zip(tokenizer.tokens, expected.tokens):
+        assert token.type is other.type
+        assert token.text == other.text
+        assert token.position == other.position
+        assert token.level == other.level
+
+
+class CountingExecutor(Executor):
+    """Sample Executor recording the largest number of its futures held in flight."""
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._lock = threading.Lock()
+        self.flight = 0
+        self.peak = 0
+        self.submitted = 0
+
+    def submit(self, function: callable, *args, **kwargs) -> Future:
+        with self._lock:
+            self.flight += 1
+            self.submitted += 1
+            self.peak = max(self.peak, self.flight)
+
+        future: Future = self._executor.submit(function, *args, **kwargs)
+        future.add_done_callback(self._release)
+
+        return future
+
+    def _release(self, future: Future):
+        with self._lock:
+            self.flight -= 1
+
+    def shutdown(self, wait: bool = True, **kwargs):
+        self._executor.shutdown(wait=wait, **kwargs)
+
+
+def test_parallel_tokenizer_in_flight(data: callable):
+    """Test that only a bounded number of ranges are held in flight at a time."""
+
+    text: str = (data("sample.txt") + "\n") * 400
+
+    executor = CountingExecutor()
+
+    with ParallelTokenizer(
+        LineTokenizer, workers=2, chunk=100, executor=executor
+    ) as parallel:
+        ranges: int = len(parallel.split(text))
+
+        tokenizer = parallel.tokenize(text=text)
+
+    executor.shutdown()
+
+    assert len(tokenizer) == len(LineTokenizer(text=text))
+    assert executor.submitted == ranges > 100
+    assert executor.peak <= 2 * 2
+
+
+def test_parallel_tokenizer_errors():
+    """Test that a Tokenizer subclass must declare the boundaries of its text."""
+
+    with pytest.raises(TokenizerError):
+        ParallelTokenizer(Tokenizer)
+
+    with pytest.raises(TypeError):
+        ParallelTokenizer(LineTokenizer, workers=0)
+
+    with pytest.raises(TokenizerError):
+        ParallelTokenizer(LineTokenizer).tokenize()
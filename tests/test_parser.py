@@ -24,3 +24,18 @@ def test_parser(data: callable):
 
     # Ensure that the text specified during instantiation is as expected
     assert parser.text == text
+
+
+@pytest.mark.parametrize("executor", [None, "thread", "process"])
+def test_parser_parse_many(executor: str):
+    """Test parsing many texts in batches, serially or via a pool of workers."""
+
+    texts: list[str] = [
+        "The " + "very " * index + "quick fox.\nThe lazy corgi!" for index in range(20)
+    ]
+
+    results: list[str] = list(
+        Parser.parse_many(texts, executor=executor, workers=2, batch=4)
+    )
+
+    assert results == [Parser(text=text).parse() for text in texts]
@@ -141,3 +141,71 @@ def test_position_less_than_equal(position: Position):
     assert newposition.index == position.index - 1
     assert newposition.column == position.column - 1
     assert newposition.line == position.line
+
+
+def test_position_adjust_returns_new_position(position: Position):
+    """Test that adjusting a Position returns a new Position, leaving it unmodified."""
+
+    newposition = position.adjust(offset=2, line=7)
+
+    assert not newposition is position
+
+    assert newposition.index == 6
+    assert newposition.column == 7
+    assert newposition.line == 7
+
+    # Ensure that the original position has not been modified
+    assert position.index == 4
+    assert position.column == 5
+    assert position.line == 6
+
+
+def test_position_immutability(position: Position):
+    """Test that the values of a Position class instance cannot be modified."""
+
+    with pytest.raises(AttributeError):
+        position._index = 10
+
+    with pytest.raises(AttributeError):
+        position.other = 10
+
+    with pytest.raises(AttributeError):
+        del position._line
+
+    # Ensure that the Position does not allocate a per-instance dictionary
+    assert not hasattr(position, "__dict__")
+
+
+def test_position_ordering_by_index():
+    """Test that Positions are ordered by index, regardless of line and column numbers."""
+
+    earlier = Position(index=10, line=3, column=9)
+    later = Position(index=11, line=4, column=1)
+
+    assert earlier < later
+    assert earlier <= later
+    assert later > earlier
+    assert later >= earlier
+
+    assert not later < earlier
+    assert not earlier > later
+
+    assert sorted([later, earlier]) == [earlier, later]
+
+
+def test_position_hashing(position: Position):
+    """Test that Positions are hashable, and that equal Positions have equal hashes."""
+
+    assert hash(position) == hash(position.copy())
+
+    assert len({position, position.copy(), position.adjust(offset=1)}) == 2
+
+
+def test_position_pickling(position: Position):
+    """Test that Positions can be pickled and copied."""
+
+    import copy
+    import pickle
+
+    assert pickle.loads(pickle.dumps(position)) == position
+    assert copy.deepcopy(position) == position
@@ -0,0 +1,197 @@
+import pytest
+import lexographer
+
+from lexographer import Type, Token, Rule, RuleTokenizer, TokenizerError
+from examples.text import Tokenizer
+
+Type.register("Keyword")
+Type.register("Identifier")
+Type.register("Integer")
+
+
+class QueryTokenizer(RuleTokenizer):
+    """Sample RuleTokenizer subclass declaring the rules for a simple query language."""
+
+    _rules = [
+        Rule(Type.Keyword, r"(?:SELECT|FROM|WHERE)\b", priority=1),
+        (Type.Identifier, r"[A-Za-z_]\w*"),
+        (Type.Integer, r"\d+"),
+        Rule(Type.EqualsEquals, "==", literal=True),
+        Rule(Type.Equals, "=", literal=True),
+        Rule(Type.Comma, ",", literal=True),
+        Rule(Type.Spacing, r"\s+", skip=True),
+    ]
+
+
+class WordTokenizer(RuleTokenizer):
+    """Sample RuleTokenizer subclass matching the tokens of the sample Tokenizer."""
+
+    _rules = [
+        (Type.Word, r"[^\W\d_]+(?:'[^\W\d_]*)*"),
+        (Type.Spacing, r"[^\S\n\r\t]+"),
+        (Type.Period, r"\."),
+        (Type.NewLine, r"\n"),
+        (Type.Unknown, r"."),
+    ]
+
+
+def test_rule_tokenizer():
+    """Test tokenizing a text via the rules declared by a RuleTokenizer subclass."""
+
+    tokenizer = QueryTokenizer(text="SELECT a, b FROM table WHERE SELECTED == 10")
+
+    assert isinstance(tokenizer, lexographer.Tokenizer)
+
+    assert [(token.type, token.text) for token in tokenizer.tokens] == [
+        (Type.Keyword, "SELECT"),
+        (Type.Identifier, "a"),
+        (Type.Comma, ","),
+        (Type.Identifier, "b"),
+        (Type.Keyword, "FROM"),
+        (Type.Identifier, "table"),
+        (Type.Keyword, "WHERE"),
+        (Type.Identifier, "SELECTED"),
+        (Type.EqualsEquals, "=="),
+        (Type.Integer, "10"),
+    ]
+
+    # Ensure that the rules sharing a value are distinguished via their identifiers
+    assert tokenizer[0].type is Type.Keyword
+    assert tokenizer[1].type is Type.Identifier
+
+    assert tokenizer[5].position.index == 17
+    assert tokenizer[5].position.column == 18
+
+
+def test_rule_tokenizer_matches_tokenizer(data: callable):
+    """Test that a RuleTokenizer produces the same tokens as the sample Tokenizer."""
+
+    text: str = data("sample.txt") * 10
+
+    expected = Tokenizer(text=text)
+    tokenizer = WordTokenizer(text=text)
+
+    assert len(tokenizer) == len(expected)
+
+    for token, other in zip(tokenizer.tokens, expected.tokens):
+        assert token.type is other.type
+        assert token.text == other.text
+        assert token.position == other.position
+
+
+def test_rule_tokenizer_lazy():
+    """Test that a RuleTokenizer may match its tokens on demand."""
+
+    class LazyQueryTokenizer(QueryTokenizer):
+        _lazy = True
+
+    tokenizer = LazyQueryTokenizer(text="SELECT a FROM b WHERE ?")
+
+    # Ensure that tokens are available up to the text that does not match any rule
+    assert tokenizer.next().text == "SELECT"
+    assert tokenizer.next().text == "a"
+
+    with pytest.raises(TokenizerError):
+        len(tokenizer)
+
+
+def test_rule_tokenizer_errors():
+    """Test the errors raised for unmatched text and for invalid rules."""
+
+    with pytest.raises(TokenizerError) as error:
+        QueryTokenizer(text="SELECT a\nFROM ?")
+
+    assert "line 2, column 6" in str(error.value)
+
+    with pytest.raises(TokenizerError):
+
+        class EmptyTokenizer(RuleTokenizer):
+            _rules = [(Type.Spacing, r"\s*")]
+
+    with pytest.raises(TokenizerError):
+
+        class InvalidTokenizer(RuleTokenizer):
+            _rules = [(Type.Word, r"[a-z")]
+
+    with pytest.raises(TypeError):
+
+        class TypelessTokenizer(RuleTokenizer):
+            _rules = [("Word", r"\w+")]
+
+    with pytest.raises(TokenizerError):
+        RuleTokenizer(text="abc")
+
+
+def test_rule_tokenizer_group_references():
+    """Test that the numbered backreferences and the named groups of the rule patterns
+    remain distinct within the master pattern."""
+
+    Type.register("String")
+
+    class QuotedTokenizer(RuleTokenizer):
+        _rules = [
+            (Type.Spacing, r"\s+"),
+            (Type.String, r"""(['"])[^'"]*\1"""),
+            (Type.Integer, r"(?P<digit>[0-9])(?P=digit)*"),
+            (Type.Word, r"(?P<digit>[a-z])(?P=digit)*"),
+        ]
+
+    tokenizer = QuotedTokenizer(text="ab \"cd\" 'e' 1123 aab")
+
+    assert [(token.type, token.text) for token in tokenizer.tokens] == [
+        (Type.Word, "a"),
+        (Type.Word, "b"),
+        (Type.Spacing, " "),
+        (Type.String, '"cd"'),
+        (Type.Spacing, " "),
+        (Type.String, "'e'"),
+        (Type.Spacing, " "),
+        (Type.Integer, "11"),
+        (Type.Integer, "2"),
+        (Type.Integer, "3"),
+        (Type.Spacing, " "),
+        (Type.Word, "aa"),
+        (Type.Word, "b"),
+    ]
+
+    # Ensure that mismatched quotes are not matched via another rule's group
+    with pytest.raises(TokenizerError):
+        QuotedTokenizer(text="\"cd'")
+
+
+def test_rule_tokenizer_apply_edit():
+    """Test that a RuleTokenizer re-tokenizes only the edited text, via its rules."""
+
+    text: str = "SELECT a, b FROM table WHERE c == 10\n" * 100
+
+    tokenizer = QueryTokenizer(text=text)
+
+    tokens: list[Token] = list(tokenizer.tokens)
+
+    assert tokenizer.apply_edit(7, 8, "alpha, beta") == (0, 2, 4)
+
+    assert [token.text for token in tokenizer.tokens[:5]] == [
+        "SELECT",
+        "alpha",
+        ",",
+        "beta",
+        ",",
+    ]
+
+    # Ensure that the following tokens were reused, with their offsets shifted
+    assert tokenizer[4] is tokens[2]
+    assert tokenizer[4].index == 18
+    assert tokenizer[-1].position.line == 100
+
+    edited: str = text[:7] + "alpha, beta" + text[8:]
+
+    assert [(token.type, token.span) for token in tokenizer.tokens] == [
+        (token.type, token.span) for token in QueryTokenizer(text=edited).tokens
+    ]
+
+    # Ensure that an edit introducing text that no rule matches leaves the tokens as-is
+    with pytest.raises(TokenizerError):
+        tokenizer.apply_edit(0, 0, "?")
+
+    assert tokenizer.text == edited
+    assert len(tokenizer) == len(tokens) + 2
@@ -0,0 +1,116 @@
+import pytest
+import lexographer
+
+from lexographer import Type, TypeTable, Token, TokenStore, TokenizerError
+from examples.text import Tokenizer
+
+
+class ColumnarTokenizer(Tokenizer):
+    """Sample Tokenizer subclass which holds its tokens in a columnar TokenStore."""
+
+    pass
+
+
+ColumnarTokenizer.register_store(TokenStore)
+
+
+def test_token_store_matches_token_list(data: callable):
+    """Test that the tokens held by a TokenStore match those held in a list."""
+
+    text: str = data("sample.txt")
+
+    expected = Tokenizer(text=text)
+
+    tokenizer = ColumnarTokenizer(text=text)
+
+    assert isinstance(tokenizer.tokens, TokenStore)
+    assert not isinstance(expected.tokens, TokenStore)
+
+    assert len(tokenizer) == len(expected) == len(tokenizer.tokens) == 18
+
+    for token, other in zip(tokenizer.tokens, expected.tokens):
+        assert isinstance(token, Token)
+        assert token.tokenizer is tokenizer
+        assert token.type is other.type
+        assert token.text == other.text
+        assert token.level == other.level
+        assert token.position == other.position
+
+    # Ensure that the tokens can be accessed by index, negative index and slice
+    assert tokenizer[2].text == "quick"
+    assert tokenizer.tokens[-1].text == "."
+    assert [token.text for token in tokenizer.tokens[0:3]] == ["The", " ", "quick"]
+
+    with pytest.raises(IndexError):
+        tokenizer.tokens[18]
+
+
+def test_token_store_columns(data: callable):
+    """Test the parallel arrays held by the TokenStore class."""
+
+    tokenizer = ColumnarTokenizer(text=data("sample.txt"))
+
+    store: TokenStore = tokenizer.tokens
+
+    assert list(store.starts[:3]) == [0, 3, 4]
+    assert list(store.lengths[:3]) == [3, 1, 5]
+    assert list(store.levels[:3]) == [0, 0, 0]
+
+    # Ensure that the type identifiers can be used to scan for tokens of a given type
+    words: int = store.typeid(Type.Word)
+
+    assert TypeTable.type(words) is Type.Word
+    assert words == Type.Word.id
+    assert store.typeids.count(words) == 9
+
+
+def test_token_store_rollback(data: callable):
+    """Test that rolling back a Tokenizer Mark removes tokens from the TokenStore."""
+
+    tokenizer = ColumnarTokenizer(text=data("sample.txt"))
+
+    mark = tokenizer.mark()
+
+    tokenizer.emit_many([(Type.Word, 0, 3), (Type.Word, 4, 9)])
+
+    assert len(tokenizer.tokens) == 20
+    assert tokenizer[19].text == "quick"
+
+    tokenizer.rollback(mark)
+
+    assert len(tokenizer.tokens) == len(tokenizer) == 18
+
+
+def test_token_store_validation(data: callable):
+    """Test that the TokenStore rejects unsupported Lexers and mismatched tokens."""
+
+    # Bytes are lexed via a BytesLexer, which cannot locate arbitrary positions
+    with pytest.raises(TokenizerError):
+        ColumnarTokenizer(text=b"The quick brown fox")
+
+    tokenizer = ColumnarTokenizer(text=data("sample.txt"))
+
+    with pytest.raises(TokenizerError):
+        tokenizer.tokens.append(
+            Token(tokenizer=tokenizer, type=Type.Word, position=0, text="Quick")
+        )
+
+    with pytest.raises(TypeError):
+        Tokenizer.register_store(list)
+
+
+def test_token_store_apply_edit(data: callable):
+    """Test that the columns of a TokenStore are spliced when an edit is applied."""
+
+    text: str = data("sample.txt")
+
+    tokenizer = ColumnarTokenizer(text=text)
+
+    tokenizer.apply_edit(4, 9, "slow")
+
+    edited: str = text[:4] + "slow" + text[9:]
+
+    assert [(token.type, token.text, token.position) for token in tokenizer] == [
+        (token.type, token.text, token.position)
+        for token in Tokenizer(text=edited).tokens
+    ]
@@ -0,0 +1,173 @@
+import pytest
+import lexographer
+import io
+
+from lexographer import Context, Type, Token, LexerError, StreamLexer
+from examples.text import Tokenizer
+
+
+def test_stream_lexer_instantiation_with_stream():
+    """Test the instantiation of the StreamLexer class with a text file object."""
+
+    # Create an instance of the StreamLexer class over an in-memory text stream
+    lexer = StreamLexer(stream=io.StringIO("abcdef"))
+
+    # Ensure that the StreamLexer class instance has the expected types
+    assert isinstance(lexer, StreamLexer)
+    assert isinstance(lexer, lexographer.Lexer)
+
+    # Ensure that no text is read from the stream until it is needed
+    assert lexer.length == 0
+    assert lexer.exhausted is False
+
+    # Ensure that the text is read from the stream once it is needed
+    assert lexer.read(length=3) == "abc"
+    assert lexer.index == 3
+
+
+def test_stream_lexer_instantiation_with_file(path: callable, data: callable):
+    """Test the instantiation of the StreamLexer class with a file path."""
+
+    with StreamLexer(file=path("sample.txt")) as lexer:
+        # Ensure that the file specified during instantiation is as expected
+        assert lexer.file == path("sample.txt")
+
+        # Ensure that all of the file can be read through the StreamLexer
+        assert "".join(lexer) == data("sample.txt")
+        assert lexer.exhausted is True
+        assert lexer.length == len(data("sample.txt"))
+
+
+def test_stream_lexer_instantiation_without_source():
+    """Test that the StreamLexer class requires exactly one source of text."""
+
+    with pytest.raises(LexerError):
+        StreamLexer()
+
+    with pytest.raises(LexerError):
+        StreamLexer(text="abc", stream=["abc"])
+
+
+def test_stream_lexer_chunk_boundaries():
+    """Test lexing across the boundaries of the chunks yielded by a generator."""
+
+    def generator():
+        yield "ab"
+        yield ""
+        yield "c\nd"
+        yield "ef\n"
+        yield "gh"
+
+    lexer = StreamLexer(stream=generator())
+
+    # Ensure that peeks and look-aheads can span across chunk boundaries
+    assert lexer.peek(offset=1, length=4) == "bc\nd"
+    assert lexer.lookahead("abc\n") is True
+
+    # Ensure that the positions are updated as expected when reading across chunks
+    assert lexer.read(length=4) == "abc\n"
+    assert lexer.index == 4
+    assert lexer.line == 2
+    assert lexer.column == 1
+
+    assert lexer.expect("def\ng") == "def\ng"
+    assert lexer.index == 9
+    assert lexer.line == 3
+    assert lexer.column == 2
+
+    # Ensure that pushing back across a new line restores the line and column numbers
+    assert lexer.push(length=3) == "f\ng"
+    assert lexer.line == 2
+    assert lexer.column == 3
+
+    # Ensure that look-behinds are supported over the text retained behind the cursor
+    assert lexer.peek(offset=-2, length=2) == "de"
+    assert lexer.lookbehind("de", offset=-2) is True
+
+    # Ensure that reads beyond the end of the stream raise when requested
+    with pytest.raises(LexerError) as exception:
+        lexer.read(length=10, raises=True)
+
+    assert exception.value.context is Context.Finish
+
+    assert lexer.read(length=10) == "f\ngh"
+    assert lexer.exhausted is True
+    assert lexer.read() == ""
+
+
+def test_stream_lexer_window():
+    """Test that the StreamLexer only retains a bounded window behind the cursor."""
+
+    # Generate a stream of many short lines of text
+    lines: list[str] = [f"{index:04d}\n" for index in range(1000)]
+
+    lexer = StreamLexer(stream=iter(lines), chunk=16, window=8)
+
+    for index in range(len(lines)):
+        # Ensure that each line can be read, and the position is reported as expected
+        assert lexer.line == index + 1
+        assert lexer.column == 1
+        assert lexer.read(length=5) == lines[index]
+        assert lexer.index == (index + 1) * 5
+
+        # Ensure that the buffer remains bounded by the window and chunk sizes
+        assert len(lexer.text) <= 8 + 16 + 5
+
+    # Ensure that the cursor cannot be pushed back beyond the retained window
+    with pytest.raises(LexerError):
+        lexer.push(length=100)
+
+    # Ensure that text that has fallen out of the window can no longer be peeked
+    assert lexer.peek(offset=-100) == ""
+
+
+def test_stream_lexer_tokenizer(data: callable):
+    """Test the StreamLexer class when used by a Tokenizer subclass."""
+
+    text: str = data("sample.txt")
+
+    # Tokenize the sample text via a StreamLexer fed in chunks of three characters
+    lexer = StreamLexer(stream=(text[i : i + 3] for i in range(0, len(text), 3)))
+
+    streamed = Tokenizer(lexer=lexer)
+    tokenizer = Tokenizer(text=text)
+
+    assert streamed.lexer is lexer
+
+    # Ensure that the tokens generated via each Lexer are the same
+    assert len(streamed) == len(tokenizer) == 18
+
+    for index in range(len(tokenizer)):
+        assert streamed[index].type is tokenizer[index].type
+        assert streamed[index].text == tokenizer[index].text
+        assert streamed[index].position == tokenizer[index].position
+
+
+def test_stream_lexer_scanning():
+    """Test the StreamLexer class' scanning methods across chunk boundaries."""
+
+    def generator():
+        yield "  ab"
+        yield "cd12"
+        yield "34 x-"
+        yield "->y\n"
+        yield "end"
+
+    lexer = StreamLexer(stream=generator(), chunk=2, window=2)
+
+    # Ensure that runs of characters spanning several chunks are consumed in full
+    assert lexer.scan_while(" ") == "  "
+    assert lexer.scan_while(str.isalpha) == "abcd"
+    assert lexer.match(r"\d+") == "1234"
+
+    # Ensure that a longer delimiter split across chunks takes precedence
+    assert lexer.scan_until(["->", "-"]) == " x"
+    assert lexer.expect("-") == "-"
+    assert lexer.scan_until(["->", "-"]) == ""
+    assert lexer.expect("->") == "->"
+
+    assert lexer.scan_while(lambda character: not character.isspace()) == "y"
+    assert lexer.scan_until(";") == "\nend"
+    assert lexer.index == 20
+    assert lexer.line == 2
+    assert lexer.column == 4
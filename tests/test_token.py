@@ -35,3 +35,29 @@ def test_token(data: callable):
     # Ensure that the associated type specified during instantiation is as expected
     assert isinstance(token.type, Type)
     assert token.type is Type.Unknown
+
+
+def test_token_position_derived_on_demand(data: callable):
+    """Test that a Token's Position is derived from its start offset on first access."""
+
+    text: str = data("sample.txt")
+
+    tokenizer = Tokenizer(text=text)
+
+    for token in tokenizer.tokens:
+        # Ensure that the Position has not been derived before it is first accessed
+        assert token._position is None
+
+        position = token.position
+
+        assert isinstance(position, lexographer.Position)
+
+        # Ensure that the derived Position is cached for subsequent accesses
+        assert token.position is position
+
+        assert position.index == token.index
+        assert text[token.index : token.index + token.length] == token.text
+
+        # Ensure that the line and column numbers correspond with the token's offset
+        assert position.line == text.count("\n", 0, token.index) + 1
+        assert position.column == token.index - text.rfind("\n", 0, token.index)
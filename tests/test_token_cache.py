@@ -0,0 +1,269 @@
+import os
+import pytest
+
+from lexographer import Context, TokenCache, TokenStore
+from examples.text import Tokenizer, Parser
+
+
+class CachedTokenizer(Tokenizer):
+    """Sample Tokenizer subclass holding the tokens of the texts it tokenizes in a cache."""
+
+
+CachedTokenizer.register_cache(TokenCache(capacity=4))
+
+
+class CachedStoreTokenizer(CachedTokenizer):
+    """Sample Tokenizer subclass holding its tokens in a TokenStore and in a cache."""
+
+
+CachedStoreTokenizer.register_store(TokenStore)
+CachedStoreTokenizer.register_cache(TokenCache())
+
+
+@pytest.mark.parametrize("subclass", [CachedTokenizer, CachedStoreTokenizer])
+def test_token_cache(data: callable, subclass: type):
+    """Test that repeated texts are tokenized from the cached tokens."""
+
+    text: str = data("sample.txt")
+
+    cache: TokenCache = subclass._token_cache
+    cache.clear()
+
+    first = subclass(text=text)
+
+    assert (cache.hits, cache.misses, len(cache)) == (0, 1, 1)
+    assert cache.size > 0
+
+    second = subclass(text=text)
+
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+    expected = Tokenizer(text=text)
+
+    assert second.context is Context.Finish
+    assert len(second) == len(expected)
+
+    for token, other in zip(second.tokens, expected.tokens):
+        assert token.type is other.type
+        assert token.text == other.text
+        assert token.position == other.position
+
+    # Ensure that editing a Tokenizer does not affect the cached tokens, nor caches the
+    # tokens of the partial texts that are re-tokenized from the edit
+    entries: int = len(subclass._token_cache)
+
+    first.apply_edit(4, 9, "slow")
+
+    assert len(subclass._token_cache) == entries
+
+    assert first[2].text == "slow"
+    assert subclass(text=text)[2].text == "quick"
+
+
+def test_token_cache_eviction():
+    """Test that the cache evicts the least recently used results to keep in bounds."""
+
+    cache = TokenCache(capacity=2)
+
+    cache.put("a", ("a",))
+    cache.put("b", ("b",))
+
+    assert cache.get("a") == ("a",)
+
+    cache.put("c", ("c",))
+
+    assert "b" not in cache
+    assert cache.get("a") == ("a",)
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses, cache.evictions) == (2, 1, 1)
+
+    # Ensure that the cache is bounded by the total size of the cached arrays
+    cache = TokenCache(capacity=10, limit=600)
+
+    CachedTokenizer.register_cache(cache)
+
+    try:
+        for index in range(5):
+            CachedTokenizer(text="The quick brown fox. " * (index + 1))
+
+        assert cache.size <= 600
+        assert cache.evictions > 0
+        assert len(cache) < 5
+    finally:
+        CachedTokenizer.register_cache(TokenCache(capacity=4))
+
+    with pytest.raises(TypeError):
+        TokenCache(capacity=0)
+
+    with pytest.raises(TypeError):
+        CachedTokenizer.register_cache({})
+
+
+def test_token_cache_parser(data: callable):
+    """Test that a cache registered for a Parser subclass is used by its Tokenizer."""
+
+    class CachedParser(Parser):
+        pass
+
+    CachedParser.register_cache(cache := TokenCache())
+
+    text: str = data("sample.txt")
+
+    assert CachedParser(text=text).parse() == Parser(text=text).parse()
+    assert CachedParser(text=text).parse() == Parser(text=text).parse()
+
+    assert (
+        list(CachedParser.parse_many([text, text])) == [Parser(text=text).parse()] * 2
+    )
+
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_token_cache_dfa_tokenizer(tmp_path):
+    """Test that a TokenCache may be registered for a DFATokenizer subclass that caches
+    its compiled automaton in a directory via its '_cache' class attribute."""
+
+    from lexographer import DFATokenizer, Type
+
+    class WordTokenizer(DFATokenizer):
+        _cache = str(tmp_path)
+
+        _rules = [(Type.Word, r"[a-z]+"), (Type.Spacing, r"\s+", 0, True)]
+
+    WordTokenizer.register_cache(cache := TokenCache())
+
+    assert [token.text for token in WordTokenizer(text="the lazy corgi")] == [
+        "the",
+        "lazy",
+        "corgi",
+    ]
+
+    assert [token.text for token in WordTokenizer(text="the lazy corgi")] == [
+        "the",
+        "lazy",
+        "corgi",
+    ]
+
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+class CountingTokenizer(Tokenizer):
+    """Sample Tokenizer subclass counting the texts it has tokenized."""
+
+    count: int = 0
+
+    def parse(self):
+        CountingTokenizer.count += 1
+
+        super().parse()
+
+
+def test_disk_token_cache(tmp_path):
+    """Test that the tokens of unchanged files are loaded from the disk cache."""
+
+    from lexographer import DiskTokenCache
+
+    filepath = tmp_path / "sample.txt"
+    filepath.write_text("The quick brown fox.\nThe lazy corgi!")
+
+    CountingTokenizer.register_disk_cache(str(tmp_path / "cache"))
+
+    cache: DiskTokenCache = CountingTokenizer._disk_cache
+
+    try:
+        first = CountingTokenizer(file=str(filepath))
+
+        assert CountingTokenizer.count == 1
+        assert os.path.exists(cache.filepath(CountingTokenizer, str(filepath)))
+
+        # Ensure that the tokens of the unchanged file are loaded rather than tokenized
+        second = CountingTokenizer(file=str(filepath))
+
+        assert CountingTokenizer.count == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert second.context is Context.Finish
+
+        assert [(token.type, token.text, token.position) for token in second] == [
+            (token.type, token.text, token.position) for token in first
+        ]
+
+        # Ensure that a change to the file is detected even if its size and modification
+        # time are unchanged, via the hash of its text
+        status = os.stat(filepath)
+
+        filepath.write_text("The quick brown fox.\nThe lazy dingo!")
+
+        os.utime(filepath, ns=(status.st_atime_ns, status.st_mtime_ns))
+
+        assert CountingTokenizer(file=str(filepath))[-2].text == "dingo"
+        assert CountingTokenizer.count == 2
+
+        # Ensure that a corrupt cache file is treated as a miss and then replaced
+        with open(cache.filepath(CountingTokenizer, str(filepath)), "wb") as file:
+            file.write(b"corrupt")
+
+        CountingTokenizer(file=str(filepath))
+        CountingTokenizer(file=str(filepath))
+
+        assert CountingTokenizer.count == 3
+
+        # Ensure that texts that were not read from a file are not cached
+        CountingTokenizer(text="The quick brown fox.")
+        CountingTokenizer(text="The quick brown fox.")
+
+        assert CountingTokenizer.count == 5
+    finally:
+        CountingTokenizer.register_disk_cache(None)
+
+
+def test_disk_token_cache_digest(tmp_path, monkeypatch):
+    """Test that the text is hashed once per tokenization, for both of the caches."""
+
+    filepath = tmp_path / "sample.txt"
+    filepath.write_text("The quick brown fox.\nThe lazy corgi!")
+
+    digests: list[str] = []
+
+    digest = TokenCache.digest
+
+    monkeypatch.setattr(
+        TokenCache,
+        "digest",
+        classmethod(lambda cls, text: digests.append(text) or digest(text)),
+    )
+
+    class DiskCachedTokenizer(CachedTokenizer):
+        pass
+
+    DiskCachedTokenizer.register_disk_cache(str(tmp_path / "cache"))
+
+    # Ensure that a miss of both caches, followed by saving into both, hashes once
+    DiskCachedTokenizer(file=str(filepath))
+
+    assert len(digests) == 1
+    assert DiskCachedTokenizer._disk_cache.misses == 1
+
+    DiskCachedTokenizer._token_cache.clear()
+
+    # Ensure that a hit of the disk cache also only hashes the text once
+    DiskCachedTokenizer(file=str(filepath))
+
+    assert len(digests) == 2
+    assert DiskCachedTokenizer._disk_cache.hits == 1
+
+
+def test_tokenizer_fingerprint():
+    """Test that the fingerprint of a Tokenizer subclass identifies its tokenization."""
+
+    from lexographer import RuleTokenizer, Type
+
+    assert CountingTokenizer.fingerprint() == CountingTokenizer.fingerprint()
+    assert CountingTokenizer.fingerprint() != Tokenizer.fingerprint()
+
+    def declare(pattern: str) -> type:
+        class WordTokenizer(RuleTokenizer):
+            _rules = [(Type.Word, pattern)]
+
+        return WordTokenizer
+
+    assert declare(r"[a-z]+").fingerprint() != declare(r"[a-zA-Z]+").fingerprint()
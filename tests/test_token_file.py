@@ -0,0 +1,151 @@
+import io
+import pytest
+import lexographer
+
+from lexographer import Context, Type, Token, TokenFile, TokenStore, TokenizerError
+from examples.text import Tokenizer
+
+
+class ColumnarTokenizer(Tokenizer):
+    """Sample Tokenizer subclass which holds its tokens in a columnar TokenStore."""
+
+    pass
+
+
+ColumnarTokenizer.register_store(TokenStore)
+
+
+class SpanTokenizer(lexographer.Tokenizer):
+    """Sample Tokenizer subclass emitting tokens out of order, overlapping, and at varying
+    levels, along with a token whose text differs from the source text."""
+
+    def parse(self):
+        self.emit(Type.Word, 300, 305)
+        self.emit(Type.Word, 0, 300)
+
+        self.level = 200
+
+        self.emit(Type.Spacing, 299, 301)
+
+        self.token = Token(tokenizer=self, type=Type.Period, position=305, text="!")
+
+        self.context = Context.Finish
+
+
+def describe(tokenizer: lexographer.Tokenizer) -> list[tuple]:
+    """Returns the type, text, offsets and level of each token of the Tokenizer."""
+
+    return [
+        (token.type, token.text, token.index, token.length, token.level)
+        for token in tokenizer.tokens
+    ]
+
+
+@pytest.mark.parametrize("packed", [False, True])
+@pytest.mark.parametrize("subclass", [Tokenizer, ColumnarTokenizer])
+def test_token_file(data: callable, subclass: type, packed: bool):
+    """Test that the tokens dumped into the binary format are loaded unchanged."""
+
+    tokenizer = subclass(text=data("sample.txt") * 10)
+
+    dumped: bytes = tokenizer.dump(packed=packed)
+
+    assert dumped.startswith(b"LXTK")
+
+    loaded = subclass.load(dumped)
+
+    assert isinstance(loaded, subclass)
+    assert loaded.text == tokenizer.text
+    assert loaded.context is tokenizer.context
+    assert describe(loaded) == describe(tokenizer)
+    assert loaded[-1].position == tokenizer[-1].position
+
+    reader = TokenFile(dumped)
+
+    assert len(reader) == len(tokenizer) == 180
+    assert reader.packed is packed
+    assert reader.source == tokenizer.text
+    assert reader.attributes["tokenizer"].endswith(subclass.__qualname__)
+
+    # Ensure that any token may be read without loading the tokens
+    assert reader[-1] == ("Period", 469, 1, 0)
+    assert reader[3] == (
+        tokenizer[3].type.name,
+        tokenizer[3].index,
+        tokenizer[3].length,
+        0,
+    )
+
+
+def test_token_file_encoding():
+    """Test that unordered, overlapping and long tokens, and token texts, are encoded."""
+
+    tokenizer = SpanTokenizer(text="a" * 300 + " bcde.")
+
+    for packed in [False, True]:
+        dumped: bytes = tokenizer.dump(source=False, packed=packed)
+
+        assert TokenFile(dumped).source is None
+
+        with pytest.raises(TokenizerError):
+            SpanTokenizer.load(dumped)
+
+        loaded = SpanTokenizer.load(dumped, text=tokenizer.text)
+
+        assert describe(loaded) == describe(tokenizer)
+        assert loaded[-1].text == "!"
+        assert loaded.context is Context.Finish
+
+    # Ensure that packing encodes the values of the columns in fewer bytes
+    assert len(tokenizer.dump(packed=True)) < len(tokenizer.dump())
+
+
+def test_token_file_files(data: callable, tmp_path):
+    """Test dumping tokens into and loading tokens from files and file objects."""
+
+    tokenizer = ColumnarTokenizer(text=data("sample.txt"))
+
+    filepath: str = str(tmp_path / "sample.tokens")
+
+    tokenizer.dump(filepath)
+
+    assert describe(ColumnarTokenizer.load(filepath)) == describe(tokenizer)
+
+    # Ensure that the memory-mapped file is read in place until closed
+    with TokenFile.open(filepath) as reader:
+        assert reader[0] == ("Word", 0, 3, 0)
+        assert describe(Tokenizer.load(reader)) == describe(tokenizer)
+
+    stream = io.BytesIO()
+
+    tokenizer.dump(stream, packed=True)
+
+    stream.seek(0)
+
+    assert describe(Tokenizer.load(stream)) == describe(tokenizer)
+
+
+def test_token_file_errors(data: callable):
+    """Test the errors raised for invalid token files."""
+
+    dumped: bytes = Tokenizer(text=data("sample.txt")).dump(packed=True)
+
+    for invalid in [b"", b"corrupt", dumped[:-10], b"LXTK\x02" + dumped[5:]]:
+        with pytest.raises(TokenizerError):
+            TokenFile(invalid)
+
+    with pytest.raises(TypeError):
+        TokenFile("LXTK")
+
+    with pytest.raises(TypeError):
+        Tokenizer.load(123)
+
+    # Ensure that tokens are only loaded into a related Tokenizer subclass
+    with pytest.raises(TokenizerError):
+        SpanTokenizer.load(dumped)
+
+    assert len(ColumnarTokenizer.load(dumped)) == 18
+
+    # Ensure that tokens lying beyond the end of the specified text are rejected
+    with pytest.raises(TokenizerError):
+        Tokenizer.load(Tokenizer(text=data("sample.txt")).dump(source=False), text="A")
@@ -232,3 +232,413 @@ def test_parser(data: callable):
     # characters are replaced with "•" characters and "." and "!" characters are swapped:
     assert parsed == text.replace(" ", "•").replace(".", "!")
     assert parsed == "The•quick•brown•fox•jumped•over•the•lazy•corgi!"
+
+
+def test_tokenizer_emit(data: callable):
+    """Test creating tokens via the Tokenizer's unvalidated 'emit()' method."""
+
+    tokenizer = Tokenizer(text=data("sample.txt"))
+
+    length: int = tokenizer.length
+
+    # Emit a token for the text "quick" which starts at offset 4 of the sample text
+    token = tokenizer.emit(Type.Word, 4, 9)
+
+    assert isinstance(token, Token)
+    assert token is tokenizer[length]
+    assert tokenizer.length == length + 1
+
+    assert token.type is Type.Word
+    assert token.text == "quick"
+    assert token.level == tokenizer.level
+    assert token.position.index == 4
+    assert token.position.line == 1
+    assert token.position.column == 5
+
+    # Ensure that the emitted token matches the token created by the Tokenizer
+    assert token.position == tokenizer[2].position
+
+    # Ensure that the Token does not allocate a per-instance dictionary
+    assert not hasattr(token, "__dict__")
+
+
+def test_tokenizer_emit_many(data: callable):
+    """Test creating several tokens via the Tokenizer's 'emit_many()' method."""
+
+    tokenizer = Tokenizer(text=data("sample.txt"))
+
+    length: int = tokenizer.length
+
+    count = tokenizer.emit_many(
+        [(Type.Word, 0, 3), (Type.Spacing, 3, 4), (Type.Word, 4, 9)]
+    )
+
+    assert count == 3
+    assert tokenizer.length == length + 3
+
+    assert [token.text for token in tokenizer.tokens[length:]] == ["The", " ", "quick"]
+
+    for index, token in enumerate(tokenizer.tokens[length:]):
+        assert token.position == tokenizer[index].position
+        assert token.type is tokenizer[index].type
+
+
+def test_tokenizer_emit_requires_locatable_lexer():
+    """Test that 'emit()' rejects Lexers that can only locate their cursor position."""
+
+    tokenizer = Tokenizer(text=b"The quick brown fox")
+
+    with pytest.raises(lexographer.TokenizerError):
+        tokenizer.emit(Type.Word, 0, 3)
+
+    with pytest.raises(lexographer.TokenizerError):
+        tokenizer.emit_many([(Type.Word, 0, 3)])
+
+
+def test_tokenizer_emit_text_derived_on_demand(data: callable):
+    """Test that the text of emitted tokens is sliced from the source on first access."""
+
+    tokenizer = Tokenizer(text=data("sample.txt"))
+
+    token = tokenizer.emit(Type.Word, 4, 9)
+
+    # Ensure that the token only holds the span of its text until the text is accessed
+    assert token._text is None
+    assert token.span == (4, 9)
+    assert token.length == 5
+
+    assert token.text == "quick"
+    assert token.text is token.text
+
+
+def test_tokenizer_interning():
+    """Test that the text of the registered token types is interned by the Tokenizer."""
+
+    class InterningTokenizer(Tokenizer):
+        pass
+
+    InterningTokenizer.register_interned(Type.Word)
+
+    tokenizer = InterningTokenizer(text="the cat and the dog")
+
+    words = [token for token in tokenizer.tokens if token.text == "the"]
+
+    assert len(words) == 2
+
+    # Ensure that the repeated text of the interned token type is held as one string
+    assert words[0].text is words[1].text
+
+    # Ensure that emitted tokens of the interned types also share their text strings
+    first = tokenizer.emit(Type.Word, 0, 3)
+    second = tokenizer.emit(Type.Word, 12, 15)
+
+    assert first._text is not None
+    assert first.text is second.text is words[0].text
+
+    # Ensure that emitted tokens of other types are not interned up front
+    assert tokenizer.emit(Type.Spacing, 3, 4)._text is None
+
+    with pytest.raises(TypeError):
+        InterningTokenizer.register_interned("Word")
+
+
+class LazyTokenizer(lexographer.Tokenizer):
+    """Sample Tokenizer subclass with a generator-based 'parse()' method which yields a
+    Token for each whitespace separated word, and records how many words it has lexed.
+    """
+
+    lexed: int = 0
+
+    def parse(self):
+        self.lexed = 0
+
+        while self.lexer.scan_while(str.isspace) or self.lexer.index < len(self.lexer):
+            if word := self.lexer.scan_until((" ", "\n")):
+                self.lexed += 1
+
+                if word == "!":
+                    raise lexographer.TokenizerError("Unexpected input!")
+
+                yield Token(tokenizer=self, type=Type.Word, text=word)
+
+
+def test_tokenizer_lazy_tokenization():
+    """Test that a generator-based 'parse()' method only tokenizes on demand."""
+
+    tokenizer = LazyTokenizer(text="one two three four five")
+
+    # Ensure that no tokens have been lexed until tokens are requested
+    assert tokenizer.lexed == 0
+
+    assert tokenizer.next().text == "one"
+    assert tokenizer.lexed == 1
+
+    # Ensure that peeking ahead only lexes as far as the requested token
+    assert tokenizer.peek(1).text == "three"
+    assert tokenizer.lexed == 3
+
+    assert tokenizer[3].text == "four"
+    assert tokenizer.lexed == 4
+
+    # Ensure that the length, or the list of tokens, requires all tokens to be lexed
+    assert len(tokenizer) == 5
+    assert tokenizer.lexed == 5
+
+    assert [token.text for token in tokenizer.tokens] == [
+        "one",
+        "two",
+        "three",
+        "four",
+        "five",
+    ]
+
+    assert [token.text for token in tokenizer] == [
+        "one",
+        "two",
+        "three",
+        "four",
+        "five",
+    ]
+
+    assert tokenizer[4].position.index == 19
+
+
+def test_tokenizer_lazy_tokenization_errors():
+    """Test that errors are raised by a generator-based 'parse()' method on demand."""
+
+    tokenizer = LazyTokenizer(text="one two ! " + "four " * 10000)
+
+    assert tokenizer.next().text == "one"
+    assert tokenizer.next().text == "two"
+
+    with pytest.raises(lexographer.TokenizerError):
+        tokenizer.next()
+
+    # Ensure that the remainder of the text was not tokenized
+    assert tokenizer.lexed == 3
+
+
+def test_tokenizer_apply_edit(data: callable):
+    """Test that the tokens are updated incrementally when an edit is applied."""
+
+    text: str = data("sample.txt")
+
+    tokenizer = Tokenizer(text=text)
+
+    tokens: list[Token] = list(tokenizer.tokens)
+
+    # Ensure that typing characters at the end of a word re-tokenizes only that word
+    offset: int = tokens[10].index + tokens[10].length
+
+    first, removed, inserted = tokenizer.apply_edit(offset, offset, "zz")
+
+    edited: str = text[:offset] + "zz" + text[offset:]
+
+    assert tokenizer.text == edited
+    assert (first, removed, inserted) == (10, 1, 1)
+
+    assert tokenizer[10].text == tokens[10].text + "zz"
+
+    # Ensure that the tokens before and after the edit were reused rather than recreated
+    assert tokenizer[9] is tokens[9]
+    assert tokenizer[11] is tokens[11]
+    assert tokenizer[11].index == tokens[11].index
+
+    expected = Tokenizer(text=edited)
+
+    assert len(tokenizer) == len(expected)
+
+    for token, other in zip(tokenizer.tokens, expected.tokens):
+        assert token.type is other.type
+        assert token.text == other.text
+        assert token.position == other.position
+
+    # Ensure that an edit spanning several tokens and lines matches a full tokenization
+    tokenizer.apply_edit(5, 30, "Two.\nlines")
+
+    edited = edited[:5] + "Two.\nlines" + edited[30:]
+
+    expected = Tokenizer(text=edited)
+
+    assert [(token.type, token.text, token.position) for token in tokenizer] == [
+        (token.type, token.text, token.position) for token in expected
+    ]
+
+    with pytest.raises(ValueError):
+        tokenizer.apply_edit(10, 5, "")
+
+    with pytest.raises(TypeError):
+        tokenizer.apply_edit(0, 0, 1)
+
+
+def test_tokenizer_apply_edit_removed(data: callable):
+    """Test that the tokens removed by an edit keep their text and position."""
+
+    text: str = data("sample.txt") * 2
+
+    tokenizer = Tokenizer(text=text)
+
+    tokens: list[Token] = list(tokenizer.tokens)
+
+    first, removed, inserted = tokenizer.apply_edit(50, 80, "Two.\nlines")
+
+    assert removed > 1
+
+    # Ensure that the removed tokens are located in the text from before the edit, rather
+    # than in the edited text, including after later edits before their offsets
+    tokenizer.apply_edit(0, 0, "\n\n")
+    tokenizer.apply_edit(0, 2, "")
+
+    for token, other in zip(
+        tokens[first : first + removed], list(Tokenizer(text=text).tokens)[first:]
+    ):
+        assert token.text == other.text
+        assert token.index == other.index
+        assert token.position.line == other.position.line
+        assert token.position.column == other.position.column
+
+
+def test_tokenizer_apply_edit_lazy():
+    """Test that a generator-based 'parse()' method only re-tokenizes the edited text."""
+
+    tokenizer = LazyTokenizer(text="one two three " + "four " * 1000)
+
+    assert len(tokenizer) == 1003
+
+    tokenizer.apply_edit(4, 7, "2 and 3")
+
+    assert [token.text for token in tokenizer.tokens[:6]] == [
+        "one",
+        "2",
+        "and",
+        "3",
+        "three",
+        "four",
+    ]
+
+    assert tokenizer[4].position.index == 12
+
+    # Ensure that tokenization stopped once it re-synchronized with the previous tokens
+    assert tokenizer._tokens[-1].text == "four"
+    assert len(tokenizer) == 1005
+
+
+class RecordingTokenizer(Tokenizer):
+    """Sample Tokenizer subclass recording the number of tokens each run of its 'parse()'
+    method produced, including runs that were stopped."""
+
+    runs: list[int] = []
+
+    def parse(self):
+        try:
+            super().parse()
+        finally:
+            RecordingTokenizer.runs.append(self._length)
+
+
+def test_tokenizer_apply_edit_incremental(data: callable):
+    """Test that a 'parse()' method that is not generator-based is only run for as many
+    tokens as are needed to re-tokenize an edit, rather than to the end of the text."""
+
+    text: str = data("sample.txt") * 200
+
+    tokenizer = RecordingTokenizer(text=text)
+
+    assert RecordingTokenizer.runs == [len(tokenizer)] == [3600]
+
+    RecordingTokenizer.runs.clear()
+
+    tokenizer.apply_edit(4, 9, "slow")
+
+    assert RecordingTokenizer.runs == [64]
+    assert tokenizer[2].text == "slow"
+
+    # Ensure that the budget of tokens is doubled when re-synchronizing takes longer
+    RecordingTokenizer.runs.clear()
+
+    tokenizer.apply_edit(0, 0, "A" + " a" * 100 + " ")
+
+    assert RecordingTokenizer.runs == [64, 128, 256]
+
+    expected = Tokenizer(text=tokenizer.text)
+
+    assert [(token.type, token.text, token.position) for token in tokenizer] == [
+        (token.type, token.text, token.position) for token in expected
+    ]
+
+
+def test_tokenizer_apply_edit_history(data: callable):
+    """Test that the log of edits is compacted, so that it does not grow without bound."""
+
+    text: str = data("sample.txt") * 5
+
+    tokenizer = Tokenizer(text=text)
+
+    last: Token = tokenizer[-1]
+
+    for count in range(300):
+        if count % 2:
+            tokenizer.apply_edit(0, 1, "The")
+        else:
+            tokenizer.apply_edit(0, 3, "A")
+
+    assert len(tokenizer._edits) < Tokenizer._history
+
+    # Ensure that the offsets of tokens untouched by any of the edits were all shifted
+    assert tokenizer[-1] is last
+    assert last.index == len(text) - 1
+
+    expected = Tokenizer(text=tokenizer.text)
+
+    assert [(token.type, token.text, token.position) for token in tokenizer] == [
+        (token.type, token.text, token.position) for token in expected
+    ]
+
+
+@pytest.mark.parametrize("executor", [None, "thread", "process"])
+def test_tokenizer_tokenize_many(executor: str):
+    """Test tokenizing many texts in batches, serially or via a pool of workers."""
+
+    texts: list[str] = [
+        "The " + "very " * index + "quick fox.\nThe lazy corgi!" for index in range(50)
+    ]
+
+    tokenizers: list[Tokenizer] = list(
+        Tokenizer.tokenize_many(texts, executor=executor, workers=2, batch=8)
+    )
+
+    assert len(tokenizers) == len(texts)
+
+    for tokenizer, text in zip(tokenizers, texts):
+        expected = Tokenizer(text=text)
+
+        assert isinstance(tokenizer, Tokenizer)
+        assert tokenizer.text == text
+        assert tokenizer.context is Context.Finish
+
+        assert [(token.type, token.text, token.position) for token in tokenizer] == [
+            (token.type, token.text, token.position) for token in expected
+        ]
+
+    # Ensure that the results may be yielded as each batch completes, with their indices
+    results = Tokenizer.tokenize_many(texts, executor=executor, batch=8, ordered=False)
+
+    assert sorted((index, tokenizer.text) for index, tokenizer in results) == list(
+        enumerate(texts)
+    )
+
+
+def test_tokenizer_tokenize_many_errors():
+    """Test that the arguments of the 'tokenize_many()' method are validated up front."""
+
+    with pytest.raises(TypeError):
+        Tokenizer.tokenize_many("text")
+
+    with pytest.raises(TypeError):
+        Tokenizer.tokenize_many(["text"], executor="fibers")
+
+    with pytest.raises(TypeError):
+        Tokenizer.tokenize_many(["text"], batch=0)
+
+    with pytest.raises(ValueError):
+        list(Tokenizer.tokenize_many(["text", ""]))
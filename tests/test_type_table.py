@@ -0,0 +1,81 @@
+import pytest
+import lexographer
+
+from lexographer import Type, TypeTable
+
+# Register two token types which share the same value, as is the case for types that are
+# registered without specifying a value, so that they compare and hash as being equal
+Type.register("TableFirst")
+Type.register("TableSecond")
+
+
+def test_type_identifiers():
+    """Test that Type options are assigned stable, dense and distinct identifiers."""
+
+    assert Type.TableFirst == Type.TableSecond
+
+    assert isinstance(Type.TableFirst.id, int)
+    assert not Type.TableFirst.id == Type.TableSecond.id
+
+    # Ensure that the identifiers are stable and map back to their Type options
+    assert Type.TableFirst.id == TypeTable.typeid(Type.TableFirst)
+    assert TypeTable.type(Type.TableFirst.id) is Type.TableFirst
+    assert TypeTable.type(Type.TableSecond.id) is Type.TableSecond
+
+    # Ensure that the identifiers are dense
+    typeids = sorted(option.id for option in Type)
+
+    assert typeids[0] >= 0
+    assert all(typeid < len(TypeTable._types) for typeid in typeids)
+
+    # Ensure that the identifiers follow the order that the options were defined and
+    # registered in, rather than the order in which they were first used
+    assert [option.id for option in Type] == list(range(len(list(Type))))
+
+    assert Type.Unknown.id == 0
+    assert Type.Space.id == 1
+    assert Type.TableSecond.id == Type.TableFirst.id + 1
+
+    with pytest.raises(TypeError):
+        TypeTable.typeid("TableFirst")
+
+    with pytest.raises(ValueError):
+        TypeTable.type(-1)
+
+
+def test_type_table_dispatch():
+    """Test dispatching to values via a TypeTable instance."""
+
+    table = TypeTable(
+        [(Type.TableFirst, "first"), (Type.TableSecond, "second")], default="other"
+    )
+
+    # Ensure that the Type options sharing a value are dispatched to distinct values
+    assert table[Type.TableFirst] == "first"
+    assert table[Type.TableSecond] == "second"
+    assert table[Type.Space] == "other"
+
+    # Ensure that the table may be indexed by the Type identifiers
+    assert table[Type.TableFirst.id] == "first"
+    assert table.values[Type.TableSecond.id] == "second"
+    assert table[len(table) + 10] == "other"
+
+    table = TypeTable({Type.Space: 1, Type.Tab: 2})
+
+    assert table[Type.Space] == 1
+    assert table[Type.Tab] == 2
+    assert table[Type.NewLine] is None
+
+    with pytest.raises(TypeError):
+        TypeTable("Space")
+
+
+def test_type_table_masks():
+    """Test the membership bitmasks built over the Type identifiers."""
+
+    mask = TypeTable.mask(Type.TableFirst, Type.Space)
+
+    assert TypeTable.contains(mask, Type.TableFirst.id) is True
+    assert TypeTable.contains(mask, Type.Space.id) is True
+    assert TypeTable.contains(mask, Type.TableSecond.id) is False
+    assert TypeTable.contains(mask, Type.Tab.id) is False